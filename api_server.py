@@ -258,34 +258,22 @@ async def get_candles_progressive(request: CandleRequest):
     """Get progressive historical candles (similar to get_candle_progressive)"""
     await ensure_connection()
     try:
-        from quotexapi.expiration import get_timestamp_days_ago, timestamp_to_date
+        from quotexapi.expiration import get_timestamp_days_ago
         
-        list_candles = []
-        size = request.days * 24
-        timestamp = get_timestamp_days_ago(request.days)
-        end_from_time = (int(timestamp) - int(timestamp) % request.period) + request.offset
+        logger.info(f"Fetching {request.days} days of data for {request.asset}")
         
-        logger.info(f"Fetching {size} hours of data for {request.asset}")
-        
-        for i in range(size):
-            candles = await client.get_candles(
-                request.asset, 
-                end_from_time, 
-                request.offset, 
-                request.period, 
-                progressive=True
-            )
-            if candles:
-                list_candles += candles
-            if i >= size:
-                request.offset *= 2
-            end_from_time = end_from_time + request.offset
-            
-            # Add small delay to avoid overwhelming the server
-            await asyncio.sleep(0.1)
-        
-        # Remove duplicates
-        unique_candles = list({frozenset(d.items()): d for d in list_candles}.values())
+        # One history/load request per offset window, a few in flight at once
+        download = await client.download_history(
+            request.asset,
+            get_timestamp_days_ago(request.days),
+            period=request.period,
+            window=request.offset
+        )
+        unique_candles = download.candles
+        logger.info(
+            f"Fetched {len(unique_candles)} candles in {download.stats['requests']} requests "
+            f"({download.stats['candles_per_second']:.0f} candles/s)"
+        )
         
         return {
             "asset": request.asset,
@@ -306,7 +294,7 @@ async def get_realtime_candles(
     """Get realtime candles for an asset"""
     await ensure_connection()
     try:
-        client.start_candles_stream(asset, period)
+        client.hold_candles_stream(asset, period)
         await asyncio.sleep(2)  # Wait for data to arrive
         
         candles = await client.get_realtime_candles(asset, period)
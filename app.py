@@ -304,25 +304,30 @@ async def buy_multiple(orders=10):
         {"amount": 50, "asset": "GBPJPY_otc", "direction": "put", "duration": 60},
     ]
     check_connect, message = await client.connect()
-    for i in range(0, orders):
-        print("\n/", 80 * "=", "/", end="\n")
-        print(f"OPEND ORDER: {i + 1}")
-        order = random.choice(order_list)
-        print(order)
-        if check_connect:
-            # client.change_account("REAL")
+    if check_connect:
+        # client.change_account("REAL")
+        batch = []
+        for i in range(0, orders):
+            order = dict(random.choice(order_list))
             asset_name, asset_data = await client.get_available_asset(order['asset'], force_open=True)
             print(asset_name, asset_data)
             if asset_data[2]:
-                print("OK: Asset is open.")
-                status, buy_info = await client.buy(**order)
-                print(status, buy_info)
+                order["asset"] = asset_name
+                batch.append(order)
             else:
                 print("ERRO: Asset is closed.")
-            print("Current Balance: ", await client.get_balance())
-            await asyncio.sleep(2)
 
-    print("\n/", 80 * "=", "/", end="\n")
+        pipeline = client.buy_many(batch)
+        async for result in pipeline:
+            print("\n/", 80 * "=", "/", end="\n")
+            print(f"OPEND ORDER: {result.index + 1}")
+            print(result.order)
+            print(result.status, result.data)
+            print(f"Latency: {result.latency * 1000:.1f} ms")
+
+        print("\n/", 80 * "=", "/", end="\n")
+        print(pipeline.stats())
+        print("Current Balance: ", await client.get_balance())
 
     print("Exiting...")
 
@@ -437,27 +442,25 @@ async def get_candle_progressive():
     check_connect, reason = await client.connect()
     if check_connect:
         asset = "EURUSD_otc"
-        offset = 3600  # in seconds
         period = 60  # in seconds [5, 10, 15, 30, 60, 120, 180, 240, 300, 600, 900, 1800, 3600, 14400, 86400]
         days_of_candle = 1
-        list_candles = []
-        size = days_of_candle * 24
-        timestamp = get_timestamp_days_ago(days_of_candle)
-        end_from_time = (int(timestamp) - int(timestamp) % period) + offset
-        epoch_candle = timestamp_to_date(end_from_time)
-        print(f"Searching for historical data from {epoch_candle} to now...")
-        for i in range(size):
-            epoch_candle = timestamp_to_date(end_from_time)
-            # print(epoch_candle)
-            candles = await client.get_candles(asset, end_from_time, offset, period, progressive=True)
-            if candles:
-                list_candles += candles
-            if i >= size:
-                offset *= 2
-            end_from_time = end_from_time + offset
-
-        lista_limpa = list({frozenset(d.items()): d for d in list_candles}.values())
-        print(lista_limpa, len(lista_limpa))
+        start_time = get_timestamp_days_ago(days_of_candle)
+        print(f"Searching for historical data from {timestamp_to_date(start_time)} to now...")
+        # Interrupted downloads resume from the checkpoint file.
+        download = await client.download_history(
+            asset,
+            start_time,
+            period=period,
+            concurrency=4,
+            checkpoint=f"{asset}_{period}.jsonl",
+            on_progress=lambda stats: print(
+                f"\r{stats['candles']} candles ({stats['candles_per_second']:.0f}/s)", end=""
+            )
+        )
+        print()
+        print(download.candles, len(download.candles))
+        if download.failed:
+            print(f"Missing windows: {download.failed}")
 
     print("Exiting...")
 
@@ -0,0 +1,78 @@
+# benchmarks/bench_archive.py
+
+"""CandleArchive against a JSON list of candle dicts.
+
+Times loading the archive and slicing a day out of it against loading
+and filtering the JSON file. Appends and range lookups are checked in
+test_archive.py.
+
+Usage: python -m benchmarks.bench_archive [candles]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import numpy as np
+from quotexapi.utils.candle_archive import CandleArchive, candle_columns
+
+PERIOD = 60
+
+
+def make_candles(count, start=1700000000, seed=7):
+    rng = np.random.default_rng(seed)
+    closes = np.round(1.08 + np.cumsum(rng.normal(0.0, 1e-4, count)), 5)
+    return [
+        {"time": start + i * PERIOD, "open": close, "high": close + 1e-4,
+         "low": close - 1e-4, "close": close, "ticks": 30}
+        for i, close in enumerate(closes.tolist())
+    ]
+
+
+def timed(function, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(count=2_000_000):
+    root = tempfile.mkdtemp()
+    try:
+        candles = make_candles(count)
+        archive = CandleArchive(os.path.join(root, "bench"))
+        json_path = os.path.join(root, "candles.json")
+
+        def dump_json():
+            with open(json_path, "w") as handle:
+                json.dump(candles, handle)
+
+        write_json = timed(dump_json, repeat=1)
+        write_archive = timed(archive.append, "EURUSD_otc", PERIOD, candle_columns(candles), repeat=1)
+        middle = candles[count // 2]["time"]
+        day = (middle, middle + 86400)
+
+        def json_day():
+            with open(json_path) as handle:
+                return [c for c in json.load(handle) if day[0] <= c["time"] < day[1]]
+
+        def archive_day():
+            return np.asarray(archive.open("EURUSD_otc", PERIOD).range(*day)["close"])
+
+        before = timed(json_day)
+        after = timed(archive_day)
+
+        print(f"candles:          {count:,} ({PERIOD}s)")
+        print(f"write json:       {write_json * 1000:,.1f} ms")
+        print(f"write archive:    {write_archive * 1000:,.1f} ms")
+        print(f"one day (json):   {before * 1000:,.1f} ms")
+        print(f"one day (mmap):   {after * 1000:,.3f} ms  ({before / after:,.0f}x)")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
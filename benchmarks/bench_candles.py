@@ -0,0 +1,74 @@
+# benchmarks/bench_candles.py
+
+"""calculate_candles before and after vectorizing it with NumPy.
+
+Times both on a tick history; test_candles.py checks that they produce
+the same candles.
+
+Usage: python -m benchmarks.bench_candles [ticks] [period]
+"""
+import sys
+import time
+import numpy as np
+from quotexapi.utils.services import group_by_period
+from quotexapi.utils.processor import calculate_candles
+
+
+def legacy_calculate_candles(history, period):
+    """Copy of the group_by_period implementation being replaced."""
+    grouped = group_by_period(history, period)
+    candles = []
+    for minute, ticks in grouped.items():
+        open_price = ticks[0][1]
+        close_price = ticks[-1][1]
+        high_price = max(tick[1] for tick in ticks)
+        low_price = min(tick[1] for tick in ticks)
+        num_ticks = len(ticks)
+        candle = {
+            'time': minute * period,
+            'open': open_price,
+            'close': close_price,
+            'high': high_price,
+            'low': low_price,
+            'ticks': num_ticks
+        }
+        candles.append(candle)
+    candles = candles[:-1]
+
+    return candles
+
+
+def make_history(count, start=1700000000.0, seed=7):
+    rng = np.random.default_rng(seed)
+    times = start + np.cumsum(rng.uniform(0.0, 0.5, count))
+    prices = np.round(1.08 + np.cumsum(rng.normal(0.0, 1e-5, count)), 5)
+    return [[t, p, 0] for t, p in zip(times.tolist(), prices.tolist())]
+
+
+def timed(function, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(count=1_000_000, period=60):
+    history = make_history(count)
+    array = np.asarray(history)[:, :2]
+    before = timed(legacy_calculate_candles, history, period)
+    after = timed(calculate_candles, history, period)
+    after_array = timed(calculate_candles, array, period)
+
+    print(f"ticks:            {count:,} (period {period}s)")
+    print(f"before:           {before * 1000:,.1f} ms")
+    print(f"after (lists):    {after * 1000:,.1f} ms  ({before / after:.1f}x)")
+    print(f"after (ndarray):  {after_array * 1000:,.1f} ms  ({before / after_array:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    )
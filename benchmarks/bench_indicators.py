@@ -0,0 +1,360 @@
+# benchmarks/bench_indicators.py
+
+"""TechnicalIndicators before and after vectorizing it with NumPy.
+
+The loop implementations below are copies of the previous code with an
+optional rounding hook: with rounding disabled they are the reference the
+vectorized results (``decimals=None``) must match, with ``round(x, 2)`` they
+are the previous behaviour being timed. The streaming indicators are checked
+against the vectorized ones and timed per candle update.
+
+Usage: python -m benchmarks.bench_indicators [sizes...] [--all]
+    --all also times the previous code on 1M candles (slow).
+"""
+import sys
+import time
+import numpy as np
+from quotexapi.utils.indicators import TechnicalIndicators
+from quotexapi.utils.streaming import create_streaming_indicator
+from quotexapi.utils.indicator_set import IndicatorSet
+from quotexapi.utils.batch_indicators import BatchIndicators, candle_matrix
+
+LEGACY_LIMIT = 100_000
+
+
+def keep(x):
+    return x
+
+
+def legacy_round(x):
+    return round(x, 2)
+
+
+def loop_sma(prices, period, rnd=keep):
+    return [rnd(sum(prices[i:i + period]) / period) for i in range(len(prices) - period + 1)]
+
+
+def loop_ema(prices, period, rnd=keep):
+    multiplier = 2 / (period + 1)
+    values = [sum(prices[:period]) / period]
+    for price in prices[period:]:
+        values.append(rnd(price * multiplier + values[-1] * (1 - multiplier)))
+    return values
+
+
+def loop_rsi(prices, period, rnd=keep):
+    deltas = np.diff(prices)
+    gain = np.where(deltas > 0, deltas, 0)
+    loss = np.where(deltas < 0, -deltas, 0)
+    avg_gain = np.concatenate(([np.mean(gain[:period])], gain[period:]))
+    avg_loss = np.concatenate(([np.mean(loss[:period])], loss[period:]))
+    for i in range(1, len(avg_gain)):
+        avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gain[period + i - 1]) / period
+        avg_loss[i] = (avg_loss[i - 1] * (period - 1) + loss[period + i - 1]) / period
+    rs = avg_gain / np.where(avg_loss == 0, 0.00001, avg_loss)
+    return [rnd(x) for x in (100 - (100 / (1 + rs))).tolist()]
+
+
+def loop_bollinger(prices, period, num_std, rnd=keep):
+    sma = loop_sma(prices, period, rnd)
+    std = [np.std(prices[i:i + period]) for i in range(len(prices) - period + 1)]
+    return (
+        [rnd(sma[i] + std[i] * num_std) for i in range(len(sma))],
+        [rnd(x) for x in sma],
+        [rnd(sma[i] - std[i] * num_std) for i in range(len(sma))],
+    )
+
+
+def loop_stochastic(prices, highs, lows, k_period, rnd=keep):
+    k_values = []
+    for i in range(len(prices) - k_period + 1):
+        window_high = max(highs[i:i + k_period])
+        window_low = min(lows[i:i + k_period])
+        if window_high == window_low:
+            k = 100
+        else:
+            k = ((prices[i + k_period - 1] - window_low) / (window_high - window_low)) * 100
+        k_values.append(rnd(k))
+    return k_values
+
+
+def loop_true_range(highs, lows, closes):
+    return [
+        max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+        for i in range(1, len(highs))
+    ]
+
+
+def loop_wilder(values, period, seed, rnd=keep):
+    result = [seed]
+    for value in values:
+        result.append(rnd((result[-1] * (period - 1) + value) / period))
+    return result
+
+
+def loop_atr(highs, lows, closes, period, rnd=keep):
+    true_ranges = loop_true_range(highs, lows, closes)
+    return loop_wilder(true_ranges[period:], period, sum(true_ranges[:period]) / period, rnd)
+
+
+def loop_adx(highs, lows, closes, period):
+    tr = loop_true_range(highs, lows, closes)
+    plus_dm, minus_dm = [], []
+    for i in range(1, len(highs)):
+        up, down = highs[i] - highs[i - 1], lows[i - 1] - lows[i]
+        plus_dm.append(up if up > down and up > 0 else 0)
+        minus_dm.append(down if down > up and down > 0 else 0)
+    tr_avg = loop_wilder(tr[period:], period, sum(tr[:period]) / period)
+    plus = loop_wilder(plus_dm[period:], period, sum(plus_dm[:period]) / period)
+    minus = loop_wilder(minus_dm[period:], period, sum(minus_dm[:period]) / period)
+    plus_di = [p * 100 / t for p, t in zip(plus, tr_avg)]
+    minus_di = [m * 100 / t for m, t in zip(minus, tr_avg)]
+    dx = [abs(p - m) / (p + m) * 100 if p + m else 0 for p, m in zip(plus_di, minus_di)]
+    return loop_wilder(dx[period:], period, sum(dx[:period]) / period), plus_di, minus_di
+
+
+def loop_donchian(highs, lows, period, rnd=keep):
+    return [
+        rnd((max(highs[i:i + period]) + min(lows[i:i + period])) / 2)
+        for i in range(len(highs) - period + 1)
+    ]
+
+
+def make_candles(count, seed=11):
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 0.05, count))
+    highs = closes + rng.uniform(0, 0.08, count)
+    lows = closes - rng.uniform(0, 0.08, count)
+    return closes.tolist(), highs.tolist(), lows.tolist()
+
+
+def assert_close(name, got, expected, atol=1e-8):
+    got, expected = np.asarray(got, dtype=float), np.asarray(expected, dtype=float)
+    assert got.shape == expected.shape, (name, got.shape, expected.shape)
+    assert np.allclose(got, expected, rtol=1e-9, atol=atol, equal_nan=True), (name, np.max(np.abs(got - expected)))
+
+
+def check_equivalence(count=3000):
+    ti = TechnicalIndicators
+    closes, highs, lows = make_candles(count)
+    assert_close("sma", ti.calculate_sma(closes, 20, decimals=None), loop_sma(closes, 20))
+    assert_close("ema", ti.calculate_ema(closes, 20, decimals=None), loop_ema(closes, 20))
+    assert_close("rsi", ti.calculate_rsi(closes, 14, decimals=None), loop_rsi(closes, 14))
+
+    macd = ti.calculate_macd(closes, decimals=None)
+    fast, slow = loop_ema(closes, 12), loop_ema(closes, 26)
+    macd_line = [fast[i + len(fast) - len(slow)] - slow[i] for i in range(len(slow))]
+    signal = loop_ema(macd_line, 9)
+    assert_close("macd", macd["macd"], macd_line)
+    assert_close("macd signal", macd["signal"], signal)
+
+    bands = ti.calculate_bollinger_bands(closes, 20, 2, decimals=None)
+    upper, middle, lower = loop_bollinger(closes, 20, 2)
+    assert_close("bollinger upper", bands["upper"], upper)
+    assert_close("bollinger lower", bands["lower"], lower)
+
+    stochastic = ti.calculate_stochastic(closes, highs, lows, 14, 3, decimals=None)
+    k_values = loop_stochastic(closes, highs, lows, 14)
+    assert_close("stochastic k", stochastic["k"], k_values)
+    assert_close("stochastic d", stochastic["d"], loop_sma(k_values, 3))
+
+    assert_close("atr", ti.calculate_atr(highs, lows, closes, 14, decimals=None), loop_atr(highs, lows, closes, 14))
+    adx = ti.calculate_adx(highs, lows, closes, 14, decimals=None)
+    adx_values, plus_di, minus_di = loop_adx(highs, lows, closes, 14)
+    assert_close("adx", adx["adx"], adx_values)
+    assert_close("plus_di", adx["plus_di"], plus_di)
+
+    ichimoku = ti.calculate_ichimoku(highs, lows, decimals=None)
+    for name, period in (("tenkan", 9), ("kijun", 26), ("senkou_b", 52)):
+        assert_close(name, ichimoku[name], loop_donchian(highs, lows, period))
+
+    # Rounded output stays within a cent of the previous rounded output.
+    assert_close("sma rounded", ti.calculate_sma(closes, 20), loop_sma(closes, 20, legacy_round), atol=0.0101)
+    assert_close("stochastic rounded", ti.calculate_stochastic(closes, highs, lows)["k"],
+                 loop_stochastic(closes, highs, lows, 14, legacy_round), atol=0.0101)
+    print(f"equivalence: ok ({count} candles)")
+
+
+def streamed(indicator, candles, params=None):
+    """Feed ``candles`` one by one; the forming preview must match the commit."""
+    stream = create_streaming_indicator(indicator, params, decimals=None, history=len(candles))
+    for candle in candles:
+        preview, value = stream.update(candle, closed=False), stream.update(candle)
+        if value is None:
+            assert preview is None, indicator
+            continue
+        if isinstance(value, dict):
+            preview, value = list(preview.values()), list(value.values())
+        assert_close(indicator + " preview", np.array(preview, dtype=float), np.array(value, dtype=float))
+    return stream.history()
+
+
+def check_streaming(count=3000):
+    ti = TechnicalIndicators
+    closes, highs, lows = make_candles(count)
+    candles = [
+        {"time": i * 60, "open": c, "close": c, "high": h, "low": l}
+        for i, (c, h, l) in enumerate(zip(closes, highs, lows))
+    ]
+    assert_close("stream sma", streamed("SMA", candles), ti.calculate_sma(closes, 20, decimals=None), 1e-7)
+    assert_close("stream ema", streamed("EMA", candles), ti.calculate_ema(closes, 20, decimals=None))
+    assert_close("stream rsi", streamed("RSI", candles), ti.calculate_rsi(closes, 14, decimals=None))
+    assert_close("stream atr", streamed("ATR", candles), ti.calculate_atr(highs, lows, closes, decimals=None))
+
+    macd, expected = streamed("MACD", candles), ti.calculate_macd(closes, decimals=None)
+    assert_close("stream macd", macd["macd"], expected["macd"])
+    assert_close("stream signal", [x for x in macd["signal"] if x is not None], expected["signal"])
+    bands, expected = streamed("BOLLINGER", candles), ti.calculate_bollinger_bands(closes, decimals=None)
+    for field in ("upper", "middle", "lower"):
+        assert_close("stream " + field, bands[field], expected[field], 1e-7)
+    stochastic, expected = streamed("STOCHASTIC", candles), ti.calculate_stochastic(closes, highs, lows, decimals=None)
+    assert_close("stream k", stochastic["k"], expected["k"])
+    assert_close("stream d", [x for x in stochastic["d"] if x is not None], expected["d"])
+    adx, expected = streamed("ADX", candles), ti.calculate_adx(highs, lows, closes, decimals=None)
+    assert_close("stream adx", adx["adx"], expected["adx"])
+    ichimoku, expected = streamed("ICHIMOKU", candles), ti.calculate_ichimoku(highs, lows, decimals=None)
+    for field in ("tenkan", "kijun", "senkou_a", "senkou_b", "chikou"):
+        assert_close("stream " + field, ichimoku[field], expected[field][-len(ichimoku[field]):])
+    print(f"streaming: ok ({count} candles)")
+
+
+def time_streaming(count=100_000):
+    closes, highs, lows = make_candles(count)
+    candles = [{"time": i, "close": c, "high": h, "low": l} for i, (c, h, l) in enumerate(zip(closes, highs, lows))]
+    print(f"\nstreaming, {count:,} candle updates")
+    for indicator in ("RSI", "MACD", "BOLLINGER", "ATR", "ADX", "STOCHASTIC", "ICHIMOKU"):
+        stream = create_streaming_indicator(indicator)
+        elapsed = timed(lambda: [stream.update(candle) for candle in candles])
+        print(f"  {indicator:<15} {elapsed / count * 1e6:6.2f} us/update")
+
+
+SET_SPECS = ["MACD", ("EMA", {"period": 12}), ("EMA", {"period": 26}), ("BOLLINGER", {"period": 20}),
+             ("SMA", {"period": 20}), "ATR", "ADX", "STOCHASTIC", "ICHIMOKU"]
+
+
+def time_indicator_set(count=100_000):
+    """One IndicatorSet against one calculate_* call per indicator."""
+    ti = TechnicalIndicators
+    closes, highs, lows = make_candles(count)
+    indicator_set = IndicatorSet(SET_SPECS)
+    results = indicator_set.calculate(closes, highs, lows)
+    assert results["MACD"]["macd"] == ti.calculate_macd(closes)["macd"]
+    assert results["ADX"]["adx"] == ti.calculate_adx(highs, lows, closes)["adx"]
+    separate = timed(lambda: (
+        ti.calculate_macd(closes), ti.calculate_ema(closes, 12), ti.calculate_ema(closes, 26),
+        ti.calculate_bollinger_bands(closes, 20), ti.calculate_sma(closes, 20),
+        ti.calculate_atr(highs, lows, closes), ti.calculate_adx(highs, lows, closes),
+        ti.calculate_stochastic(closes, highs, lows), ti.calculate_ichimoku(highs, lows)
+    ))
+    shared = timed(lambda: indicator_set.calculate(closes, highs, lows))
+    print(f"\nindicator set, {len(SET_SPECS)} indicators on {count:,} candles")
+    print(f"  separate {separate * 1000:8.1f} ms   shared {shared * 1000:8.1f} ms   {separate / shared:5.1f}x"
+          f"   ({indicator_set.inputs.hits} intermediates reused)")
+
+
+def make_candle_sets(assets, max_count, seed=5):
+    rng = np.random.default_rng(seed)
+    candle_sets = {}
+    for index in range(assets):
+        closes, highs, lows = make_candles(int(rng.integers(0, max_count + 1)), seed=index)
+        candle_sets[f"ASSET{index}"] = [
+            {"time": i * 60, "open": c, "close": c, "high": h, "low": l}
+            for i, (c, h, l) in enumerate(zip(closes, highs, lows))
+        ]
+    return candle_sets
+
+
+def per_asset(candle_sets):
+    for asset, candles in candle_sets.items():
+        yield asset, [c["close"] for c in candles], [c["high"] for c in candles], [c["low"] for c in candles]
+
+
+def check_batch(assets=40, max_count=400):
+    """Each valid row of the batch output equals the single-asset result."""
+    ti, batch = TechnicalIndicators, BatchIndicators
+    candle_sets = make_candle_sets(assets, max_count)
+    matrix = candle_matrix(candle_sets)
+    closes, highs, lows = matrix["close"], matrix["high"], matrix["low"]
+    bands = batch.bollinger_bands(closes, 20, 2)
+    outputs = {
+        "sma": (batch.sma(closes, 20), lambda c, h, l: ti.calculate_sma(c, 20, decimals=None)),
+        "ema": (batch.ema(closes, 20), lambda c, h, l: ti.calculate_ema(c, 20, decimals=None)),
+        "rsi": (batch.rsi(closes, 14), lambda c, h, l: ti.calculate_rsi(c, 14, decimals=None)),
+        "atr": (batch.atr(highs, lows, closes, 14), lambda c, h, l: ti.calculate_atr(h, l, c, 14, decimals=None)),
+        "upper": (bands["upper"], lambda c, h, l: ti.calculate_bollinger_bands(c, 20, 2, decimals=None)["upper"]),
+        "lower": (bands["lower"], lambda c, h, l: ti.calculate_bollinger_bands(c, 20, 2, decimals=None)["lower"]),
+    }
+    for row, (asset, c, h, l) in enumerate(per_asset(candle_sets)):
+        for name, (result, single) in outputs.items():
+            values = result[row]
+            assert_close(f"batch {name} {asset}", values[~np.isnan(values)], single(c, h, l))
+    print(f"batch: ok ({assets} assets, up to {max_count} candles)")
+
+
+def time_batch(assets=60, count=1000):
+    ti, batch = TechnicalIndicators, BatchIndicators
+    candle_sets = make_candle_sets(assets, count)
+    matrix = candle_matrix(candle_sets)
+    closes, highs, lows = matrix["close"], matrix["high"], matrix["low"]
+    rows = list(per_asset(candle_sets))
+    print(f"\nbatch, {assets} assets x up to {count} candles")
+    for name, loop, vectorized in (
+            ("RSI(14)", lambda: [ti.calculate_rsi(c, 14) for _, c, _, _ in rows], lambda: batch.rsi(closes, 14)),
+            ("EMA(20)", lambda: [ti.calculate_ema(c, 20) for _, c, _, _ in rows], lambda: batch.ema(closes, 20)),
+            ("SMA(20)", lambda: [ti.calculate_sma(c, 20) for _, c, _, _ in rows], lambda: batch.sma(closes, 20)),
+            ("BOLLINGER(20)", lambda: [ti.calculate_bollinger_bands(c, 20) for _, c, _, _ in rows],
+             lambda: batch.bollinger_bands(closes, 20)),
+            ("ATR(14)", lambda: [ti.calculate_atr(h, l, c, 14) for _, c, h, l in rows],
+             lambda: batch.atr(highs, lows, closes, 14))):
+        before, after = timed(loop), timed(vectorized)
+        print(f"  {name:<15} per asset {before * 1000:7.2f} ms   batch {after * 1000:7.2f} ms   {before / after:5.1f}x")
+
+
+def cases(closes, highs, lows):
+    ti = TechnicalIndicators
+    return {
+        "SMA(20)": (lambda: loop_sma(closes, 20, legacy_round), lambda: ti.calculate_sma(closes, 20)),
+        "EMA(20)": (lambda: loop_ema(closes, 20, legacy_round), lambda: ti.calculate_ema(closes, 20)),
+        "RSI(14)": (lambda: loop_rsi(closes, 14, legacy_round), lambda: ti.calculate_rsi(closes, 14)),
+        "BOLLINGER(20)": (lambda: loop_bollinger(closes, 20, 2, legacy_round),
+                          lambda: ti.calculate_bollinger_bands(closes, 20, 2)),
+        "STOCHASTIC(14)": (lambda: loop_stochastic(closes, highs, lows, 14, legacy_round),
+                           lambda: ti.calculate_stochastic(closes, highs, lows, 14, 3)),
+        "ATR(14)": (lambda: loop_atr(highs, lows, closes, 14, legacy_round),
+                    lambda: ti.calculate_atr(highs, lows, closes, 14)),
+        "ICHIMOKU": (lambda: [loop_donchian(highs, lows, p, legacy_round) for p in (9, 26, 52)],
+                     lambda: ti.calculate_ichimoku(highs, lows)),
+    }
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main(sizes=(10_000, 100_000, 1_000_000), run_all=False):
+    check_equivalence()
+    check_streaming()
+    time_streaming()
+    time_indicator_set()
+    check_batch()
+    time_batch()
+    for count in sizes:
+        closes, highs, lows = make_candles(count)
+        print(f"\n{count:,} candles")
+        for name, (before, after) in cases(closes, highs, lows).items():
+            after_time = timed(after)
+            if count > LEGACY_LIMIT and not run_all:
+                print(f"  {name:<15} after {after_time * 1000:9.1f} ms   (before skipped, use --all)")
+                continue
+            before_time = timed(before)
+            print(
+                f"  {name:<15} before {before_time * 1000:9.1f} ms   after {after_time * 1000:8.1f} ms"
+                f"   {before_time / after_time:7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    arguments = [argument for argument in sys.argv[1:] if argument != "--all"]
+    main(tuple(int(size) for size in arguments) or (10_000, 100_000, 1_000_000), "--all" in sys.argv)
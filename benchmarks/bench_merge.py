@@ -0,0 +1,73 @@
+# benchmarks/bench_merge.py
+
+"""merge_candles before and after the sorted k-way merge.
+
+Times computed candles merged with a tail of server candles, as in
+prepare_candles; test_merge.py holds the property checks.
+
+Usage: python -m benchmarks.bench_merge [candles]
+"""
+import sys
+import time
+import random
+import numpy as np
+from quotexapi.utils.processor import merge_candles, merge_candle_columns
+
+FIELDS = ("time", "open", "close", "high", "low", "ticks")
+
+
+def legacy_merge_candles(candles_data):
+    """Copy of the merge_candles implementation being replaced."""
+    seen_times = set()
+    merged_list = []
+    for candle in candles_data:
+        if isinstance(candle, dict) and candle.get('time') not in seen_times:
+            seen_times.add(candle['time'])
+            merged_list.append(candle)
+    merged_list.sort(key=lambda x: x['time'])
+
+    return merged_list
+
+
+def make_run(count, start, period=60, gap=0.2, tag=0):
+    run = []
+    candle_time = start
+    for _ in range(count):
+        candle_time += period * (1 + (random.random() < gap))
+        price = round(random.uniform(1.0, 1.2), 5)
+        run.append({"time": candle_time, "open": price, "close": price, "high": price,
+                    "low": price, "ticks": tag})
+    return run
+
+
+def as_columns(run):
+    return {name: np.array([candle[name] for candle in run], dtype=np.float64) for name in FIELDS}
+
+
+def timed(function, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(count=100_000):
+    random.seed(11)
+    computed = make_run(count, 1700000000, gap=0.0, tag=0)
+    # Server candles overlap the most recent tenth of the computed ones.
+    server = make_run(count // 10, computed[-count // 10]["time"] - 60, gap=0.0, tag=1)
+    before = timed(legacy_merge_candles, server + computed)
+    after = timed(merge_candles, computed, server)
+    computed_columns, server_columns = as_columns(computed), as_columns(server)
+    columns = timed(merge_candle_columns, computed_columns, server_columns)
+
+    print(f"candles:          {count:,} + {len(server):,}")
+    print(f"before:           {before * 1000:,.1f} ms")
+    print(f"after (dicts):    {after * 1000:,.1f} ms  ({before / after:.1f}x)")
+    print(f"after (columns):  {columns * 1000:,.1f} ms  ({before / columns:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
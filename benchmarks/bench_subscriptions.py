@@ -0,0 +1,100 @@
+# benchmarks/bench_subscriptions.py
+
+"""Subscription frames sent before and after the reference-counted manager.
+
+Counts the frames of a trading session: indicators on a few assets,
+bursts of orders and polled candles, as the stream methods sent them
+before and as the manager sends them. The properties of the manager are
+checked in test_subscriptions.py.
+
+Usage: python -m benchmarks.bench_subscriptions [orders]
+"""
+import sys
+import random
+import asyncio
+from quotexapi.subscriptions import Subscriptions
+
+ASSETS = ["EURUSD_otc", "GBPUSD_otc", "USDJPY_otc", "AUDCAD_otc", "BTCUSD_otc"]
+
+
+class _Api(object):
+    """Records the frames instead of sending them."""
+
+    def __init__(self):
+        self.frames = []
+
+    def subscribe_realtime_candle(self, asset, period):
+        self.frames.append(("instruments/update", asset, period))
+
+    def follow_candle(self, asset):
+        self.frames.append(("depth/follow", asset))
+
+    def unfollow_candle(self, asset):
+        self.frames.append(("depth/unfollow", asset))
+
+    def unsubscribe_realtime_candle(self, asset):
+        self.frames.append(("subfor", asset))
+
+
+class _Client(object):
+    def __init__(self):
+        self.api = _Api()
+
+
+class LegacyStreams(object):
+    """Copy of the start/stop_candles_stream frames being replaced."""
+
+    def __init__(self):
+        self.api = _Api()
+
+    def start(self, asset, period=0):
+        self.api.subscribe_realtime_candle(asset, period)
+        self.api.follow_candle(asset)
+
+    def stop(self, asset):
+        self.api.unsubscribe_realtime_candle(asset)
+        self.api.unfollow_candle(asset)
+
+
+def session(orders):
+    """Yield the stream calls of a session as (action, asset, period)."""
+    random.seed(7)
+    for asset in ASSETS[:3]:
+        yield "start", asset, 60
+    for index in range(orders):
+        asset = random.choice(ASSETS)
+        yield "hold", asset, 60
+        if index % 10 == 0:
+            yield "hold", random.choice(ASSETS), 300
+    for asset in ASSETS[:3]:
+        yield "stop", asset, 60
+
+
+async def count_frames(orders):
+    legacy = LegacyStreams()
+    client = _Client()
+    # Long enough that no hold expires during the session.
+    subscriptions = Subscriptions(client, linger=60)
+    for action, asset, period in session(orders):
+        if action == "stop":
+            legacy.stop(asset)
+            subscriptions.release(asset, period)
+            continue
+        legacy.start(asset, period)
+        if action == "start":
+            subscriptions.acquire(asset, period)
+        else:
+            subscriptions.hold(asset, period)
+    subscriptions.clear()
+    return len(legacy.api.frames), len(client.api.frames)
+
+
+def main(orders=1000):
+    before, after = asyncio.run(count_frames(orders))
+    print(f"orders:  {orders:,} on {len(ASSETS)} assets, 3 indicators")
+    print(f"before:  {before:,} frames")
+    print(f"after:   {after:,} frames  ({before / after:.0f}x fewer)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
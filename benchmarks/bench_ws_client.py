@@ -0,0 +1,154 @@
+# benchmarks/bench_ws_client.py
+
+"""Frames/sec of WebsocketClient.on_message before and after the event dispatch table.
+
+Usage: python -m benchmarks.bench_ws_client [frames]
+"""
+import sys
+import json
+import time
+from quotexapi.ws.client import WebsocketClient
+from quotexapi.ws.objects.candles import Candles
+from quotexapi.ws.objects.listinfodata import ListInfoData
+from quotexapi.ws.objects.timesync import TimeSync
+from quotexapi.ws.objects.connection import ConnectionState
+from quotexapi.utils.ticks import TickBuffer
+
+ASSETS = [f"ASSET{i:02d}_otc" for i in range(32)]
+
+
+class _Sink(object):
+    def send(self, data):
+        pass
+
+    def put(self, data, priority=None):
+        pass
+
+
+class _Api(object):
+    """Bare attribute holder with the state on_message writes to."""
+
+    host = "qxbroker.com"
+    https_url = "https://qxbroker.com"
+    wss_url = "wss://ws2.qxbroker.com/socket.io/?EIO=3&transport=websocket"
+    trace_ws = False
+
+    def __init__(self, buffer=list):
+        self.session_data = {}
+        self.current_asset = ASSETS[0]
+        self.wss_message = None
+        self.instruments = None
+        self.signal_data = {}
+        self.settings_list = {}
+        self.candle_v2_data = {}
+        self.realtime_price = {asset: buffer() for asset in ASSETS}
+        self.realtime_price_data = []
+        self.candle_builders = {}
+        self.realtime_sentiment = {}
+        self.account_balance = None
+        self._temp_status = ""
+        self.candles = Candles()
+        self.timesync = TimeSync()
+        self.listinfodata = ListInfoData()
+        self.state = ConnectionState()
+        self.writer = _Sink()
+
+
+def legacy_on_message(client, message):
+    """Hot-path copy of the substring-scanning handler being replaced."""
+    api = client.api
+    api.state.ssl_Mutual_exclusion = True
+    current_time = time.localtime()
+    if current_time.tm_sec in [0, 5, 10, 15, 20, 30, 40, 50]:
+        client.wss.send('42["tick"]')
+    try:
+        if "authorization/reject" in str(message):
+            api.state.check_rejected_connection = 1
+        elif "s_authorization" in str(message):
+            api.state.check_accepted_connection = 1
+            api.state.check_rejected_connection = 0
+        elif "instruments/list" in str(message):
+            api.state.started_listen_instruments = True
+        try:
+            message = message[1:].decode()
+            message = json.loads(message)
+            api.wss_message = message
+            if "call" in str(message) or 'put' in str(message):
+                api.instruments = message
+            if isinstance(message, dict):
+                if message.get("signals"):
+                    pass
+                elif message.get("liveBalance") or message.get("demoBalance"):
+                    api.account_balance = message
+        except:
+            pass
+        if str(message) == "41":
+            api.state.check_websocket_if_connect = 0
+        if "51-" in str(message):
+            api._temp_status = str(message)
+        elif len(message[0]) == 4:
+            result = {
+                "time": message[0][1],
+                "price": message[0][2]
+            }
+            api.realtime_price[message[0][0]].append(result)
+            api.realtime_price_data.append(message[0])
+        elif len(message[0]) == 2:
+            for i in message:
+                api.realtime_sentiment[i[0]] = {
+                    "sentiment": {
+                        "sell": 100 - int(i[1]),
+                        "buy": int(i[1])
+                    }
+                }
+    except:
+        pass
+    api.state.ssl_Mutual_exclusion = False
+
+
+def make_frames(count):
+    """Header/attachment pairs: mostly ticks, some sentiment and balance frames."""
+    frames = []
+    for n in range(count // 2):
+        asset = ASSETS[n % len(ASSETS)]
+        if n % 20 == 0:
+            event, payload = "depth/change", [[asset, 55]]
+        elif n % 97 == 0:
+            event, payload = "s_balance/list", {"liveBalance": 10.0, "demoBalance": 10000.0}
+        else:
+            event, payload = "quotes/stream", [[asset, 1700000000.0 + n * 0.25, 1.08 + n * 1e-6, 0]]
+        frames.append(f'451-["{event}",{{"_placeholder":true,"num":0}}]')
+        frames.append(b"\x04" + json.dumps(payload).encode())
+    return frames
+
+
+def run(handler, frames):
+    start = time.perf_counter()
+    for frame in frames:
+        handler(frame)
+    return len(frames) / (time.perf_counter() - start)
+
+
+def main(count=200_000):
+    frames = make_frames(count)
+
+    legacy = WebsocketClient(_Api())
+    legacy.wss = _Sink()
+    before = run(lambda frame: legacy_on_message(legacy, frame), frames)
+
+    client = WebsocketClient(_Api(lambda: TickBuffer(count)))
+    client.wss = _Sink()
+    after = run(lambda frame: client.on_message(None, frame), frames)
+
+    for asset in ASSETS:
+        assert client.api.realtime_price[asset].to_list() == legacy.api.realtime_price[asset]
+    assert client.api.realtime_sentiment == legacy.api.realtime_sentiment
+
+    print(f"frames:  {len(frames)}")
+    print(f"before:  {before:,.0f} frames/sec")
+    print(f"after:   {after:,.0f} frames/sec")
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
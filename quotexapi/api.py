@@ -2,17 +2,17 @@
 
 """Module for Quotex websocket."""
 import os
-import sys
 import time
 import json
 import ssl
 import urllib3
 import requests
 import certifi
+import asyncio
 import logging
 import platform
+import itertools
 import threading
-from . import global_value
 from .http.login import Login
 from .http.logout import Logout
 from .http.settings import Settings
@@ -26,8 +26,14 @@ from .ws.objects.timesync import TimeSync
 from .ws.objects.candles import Candles
 from .ws.objects.profile import Profile
 from .ws.objects.listinfodata import ListInfoData
+from .ws.objects.connection import ConnectionState
+from .ws.objects.instruments import Instruments
 from .ws.client import WebsocketClient
-from collections import defaultdict
+from .ws.pending import PendingRequests
+from .ws.async_client import AsyncWebsocketClient
+from .ws.writer import WebsocketWriter, AsyncWebsocketWriter
+from .utils.ticks import TickBuffer, TICK_CAPACITY
+from collections import defaultdict, deque
 
 urllib3.disable_warnings()
 logger = logging.getLogger(__name__)
@@ -38,12 +44,17 @@ os.environ['SSL_CERT_FILE'] = cert_path
 os.environ['WEBSOCKET_CLIENT_CA_BUNDLE'] = cert_path
 cacert = os.environ.get('WEBSOCKET_CLIENT_CA_BUNDLE')
 
-# Configuração do contexto SSL para usar TLS 1.3
-ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-ssl_context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1 | ssl.OP_NO_TLSv1_2  # Desativar versões TLS mais antigas
-ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3  # Garantir o uso de TLS 1.3
 
-ssl_context.load_verify_locations(certifi.where())
+def create_ssl_context():
+    # Configuração do contexto SSL para usar TLS 1.3
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1 | ssl.OP_NO_TLSv1_2  # Desativar versões TLS mais antigas
+    context.minimum_version = ssl.TLSVersion.TLSv1_3  # Garantir o uso de TLS 1.3
+    context.load_verify_locations(certifi.where())
+    return context
+
+
+ssl_context = create_ssl_context()
 
 
 def nested_dict(n, type):
@@ -55,7 +66,6 @@ def nested_dict(n, type):
 
 class QuotexAPI(object):
     """Class for communication with Quotex API."""
-    socket_option_opened = {}
     buy_id = None
     pending_id = None
     trace_ws = False
@@ -71,10 +81,6 @@ class QuotexAPI(object):
     profit_in_operation = None
     sold_options_respond = None
     sold_digital_options_respond = None
-    listinfodata = ListInfoData()
-    timesync = TimeSync()
-    candles = Candles()
-    profile = Profile()
 
     def __init__(
             self,
@@ -84,7 +90,11 @@ class QuotexAPI(object):
             lang,
             proxies=None,
             resource_path=None,
-            user_data_dir="."
+            user_data_dir=".",
+            transport="thread",
+            tick_capacity=TICK_CAPACITY,
+            tick_retention=None,
+            session_file="session.json"
     ):
         """
         :param str host: The hostname or ip address of a Quotex server.
@@ -93,38 +103,63 @@ class QuotexAPI(object):
         :param str lang: The lang of a Quotex platform.
         :param proxies: The proxies of a Quotex server.
         :param user_data_dir: The path browser user data dir.
+        :param str transport: ``thread`` runs websocket-client on a daemon
+            thread; ``asyncio`` runs the session on the caller's event loop.
+        :param int tick_capacity: Ticks kept per asset in ``realtime_price``.
+        :param float tick_retention: (optional) Seconds of ticks kept per asset.
+        :param str session_file: The session file, relative to ``resource_path``.
         """
         self.host = host
+        self.state = ConnectionState()
+        self.socket_option_opened = {}
+        self.listinfodata = ListInfoData()
+        self.timesync = TimeSync()
+        self.candles = Candles()
+        self.profile = Profile()
         self.https_url = f"https://{host}"
         self.wss_url = f"wss://ws2.{host}/socket.io/?EIO=3&transport=websocket"
         self.wss_message = None
         self.websocket_thread = None
         self.websocket_client = None
+        self.writer = None
         self.set_ssid = None
         self.object_id = None
         self.token_login2fa = None
         self.is_logged = False
-        self._temp_status = ""
         self.username = username
         self.password = password
         self.resource_path = resource_path
         self.user_data_dir = user_data_dir
+        self.session_file = session_file
         self.proxies = proxies
         self.lang = lang
+        self.transport = transport
         self.settings_list = {}
         self.signal_data = {}
         self.get_candle_data = {}
         self.historical_candles = {}
         self.candle_v2_data = {}
+        self.tick_capacity = tick_capacity
+        self.tick_retention = tick_retention
         self.realtime_price = {}
-        self.realtime_price_data = []
+        self.realtime_price_data = deque(maxlen=tick_capacity)
         self.real_time_candles = {}
+        self.candle_builders = {}
+        self.candle_caches = {}
+        self.instrument_table = Instruments()
+        self.open_orders = {}
         self.realtime_sentiment = {}
         self.top_list_leader = {}
         self.session_data = {}
+        self.pending = PendingRequests()
+        self._request_ids = itertools.count(int(time.time() * 1000))
         self.browser = Browser()
         self.browser.set_headers()
 
+    def next_request_id(self):
+        """Get a request id unique within this connection."""
+        return next(self._request_ids)
+
     @property
     def websocket(self):
         """Property to get websocket.
@@ -134,7 +169,8 @@ class QuotexAPI(object):
         return self.websocket_client.wss
 
     def subscribe_realtime_candle(self, asset, period):
-        self.realtime_price[asset] = []
+        if asset not in self.realtime_price:
+            self.realtime_price[asset] = TickBuffer(self.tick_capacity, self.tick_retention)
         payload = {
             "asset": asset,
             "period": period
@@ -151,7 +187,8 @@ class QuotexAPI(object):
         data = f'42["depth/unfollow", {json.dumps(asset)}]'
         return self.send_websocket_request(data)
 
-    def settings_apply(self, asset, duration, is_fast_option=False, end_time=None, deal=5, percent_mode=False, percent_deal=1):
+    def settings_apply(self, asset, duration, is_fast_option=False, end_time=None, deal=5, percent_mode=False, percent_deal=1,
+                       priority=None):
         payload = {
             "chartId": "graph",
             "settings": {
@@ -180,7 +217,7 @@ class QuotexAPI(object):
         }
         data = f'42["settings/store",{json.dumps(payload)}]'
         print(data)
-        self.send_websocket_request(data)
+        self.send_websocket_request(data, priority=priority)
 
     def unsubscribe_realtime_candle(self, asset):
         data = f'42["subfor", {json.dumps(asset)}]'
@@ -385,18 +422,19 @@ class QuotexAPI(object):
         history = await self.get_history(account_type, page_number)
         return history.get("data", {})
 
-    def send_websocket_request(self, data, no_force_send=True):
+    def send_websocket_request(self, data, no_force_send=True, priority=None):
         """Send websocket request to Quotex server.
         :param str data: The websocket request data.
-        :param bool no_force_send: Default None.
+        :param bool no_force_send: Queue behind the writer; when False the
+            frame is written immediately from the calling thread.
+        :param int priority: (optional) Queue priority, lower goes first.
+            Order frames default to high priority.
         """
-        while (global_value.ssl_Mutual_exclusion
-               or global_value.ssl_Mutual_exclusion_write) and no_force_send:
-            pass
-        global_value.ssl_Mutual_exclusion_write = True
-        self.websocket.send(data)
-        logger.debug(data)
-        global_value.ssl_Mutual_exclusion_write = False
+        if not no_force_send or self.writer is None:
+            self.websocket.send(data)
+            logger.debug(data)
+            return
+        self.writer.put(data, priority)
 
     async def authenticate(self):
         print("Connecting User Account ...")
@@ -408,17 +446,46 @@ class QuotexAPI(object):
         )
         print(message)
         if not status:
-            sys.exit(1)
-        global_value.SSID = self.session_data.get("token")
+            return status, message
+        self.state.ssid = self.session_data.get("token")
         self.is_logged = True
+        return status, message
 
     async def start_websocket(self):
-        global_value.check_websocket_if_connect = None
-        global_value.check_websocket_if_error = False
-        global_value.websocket_error_reason = None
-        if not global_value.SSID:
-            await self.authenticate()
+        self.state.reset_websocket()
+        if not self.state.ssid:
+            status, message = await self.authenticate()
+            if not status:
+                return False, message
+        if self.writer:
+            self.writer.stop()
+        if self.transport == "asyncio":
+            self.start_async_websocket()
+        else:
+            self.start_thread_websocket()
+        while True:
+            if self.state.check_websocket_if_error:
+                return False, self.state.websocket_error_reason
+            elif self.state.check_websocket_if_connect == 0:
+                logger.debug("Websocket connection closed.")
+                return False, "Websocket connection closed."
+            elif self.state.check_websocket_if_connect == 1:
+                logger.debug("Websocket connected successfully!!!")
+                return True, "Websocket connected successfully!!!"
+            elif self.state.check_rejected_connection == 1:
+                self.state.ssid = None
+                logger.debug("Websocket Token Rejected.")
+                return True, "Websocket Token Rejected."
+            await asyncio.sleep(0.05)
+
+    def start_thread_websocket(self):
+        """Run the websocket-client session on a daemon thread."""
         self.websocket_client = WebsocketClient(self)
+        self.writer = WebsocketWriter(self.websocket.send)
+        self.writer.start()
+        # The heartbeat is the one frame that skips the writer: websocket-client
+        # sends ``ping_payload`` straight from its own thread, so it still
+        # goes out while the writer is blocked or stopped.
         payload = {
             "ping_interval": 24,
             "ping_timeout": 20,
@@ -441,48 +508,49 @@ class QuotexAPI(object):
         )
         self.websocket_thread.daemon = True
         self.websocket_thread.start()
-        while True:
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-            elif global_value.check_websocket_if_connect == 0:
-                logger.debug("Websocket connection closed.")
-                return False, "Websocket connection closed."
-            elif global_value.check_websocket_if_connect == 1:
-                logger.debug("Websocket connected successfully!!!")
-                return True, "Websocket connected successfully!!!"
-            elif global_value.check_rejected_connection == 1:
-                global_value.SSID = None
-                logger.debug("Websocket Token Rejected.")
-                return True, "Websocket Token Rejected."
 
-    def send_ssid(self, timeout=10):
+    def start_async_websocket(self):
+        """Run the socket.io session directly on the running event loop."""
+        self.websocket_client = AsyncWebsocketClient(self)
+        self.writer = AsyncWebsocketWriter(
+            self.websocket_client.write,
+            asyncio.get_running_loop()
+        )
+        self.writer.start()
+        # A context of its own: the shared one stays as the thread transport uses it.
+        self.websocket_client.start(
+            ssl_context=create_ssl_context(),
+            ping_interval=24,
+            ping_payload="2",
+            reconnect=5
+        )
+
+    async def send_ssid(self, timeout=10):
         self.wss_message = None
-        if not global_value.SSID:
+        if not self.state.ssid:
             return False
-        self.ssid(global_value.SSID)
+        self.ssid(self.state.ssid)
         start_time = time.time()
         while self.wss_message is None:
             if time.time() - start_time > timeout:
                 return False
-            time.sleep(0.5)
+            await asyncio.sleep(0.1)
         return True
 
     async def connect(self, is_demo):
         """Method for connection to Quotex API."""
         self.account_type = is_demo
-        global_value.ssl_Mutual_exclusion = False
-        global_value.ssl_Mutual_exclusion_write = False
-        if global_value.check_websocket_if_connect:
+        if self.state.check_websocket_if_connect:
             logger.info("Closing websocket connection...")
             self.close()
         check_websocket, websocket_reason = await self.start_websocket()
         if not check_websocket:
             return check_websocket, websocket_reason
-        check_ssid = self.send_ssid()
+        check_ssid = await self.send_ssid()
         if not check_ssid:
             await self.authenticate()
             if self.is_logged:
-                self.send_ssid()
+                await self.send_ssid()
         return check_websocket, websocket_reason
 
     async def reconnect(self):
@@ -491,10 +559,15 @@ class QuotexAPI(object):
         await self.start_websocket()
 
     def close(self):
+        if self.writer:
+            self.writer.stop()
         if self.websocket_client:
             self.websocket.close()
-            self.websocket_thread.join()
+            if self.websocket_thread:
+                self.websocket_thread.join()
         return True
 
     def websocket_alive(self):
+        if self.transport == "asyncio":
+            return self.websocket_client.is_alive()
         return self.websocket_thread.is_alive()
@@ -33,10 +33,10 @@ if not email or not password:
 user_data_dir = "browser/instance/quotex.default"
 
 
-def load_session(user_agent):
+def load_session(user_agent, session_file="session.json"):
     output_file = Path(
         resource_path(
-            "session.json"
+            session_file
         )
     )
     if os.path.isfile(output_file):
@@ -64,12 +64,16 @@ def load_session(user_agent):
     return session_data
 
 
-def update_session(session_data):
+def update_session(session_data, session_file="session.json"):
     output_file = Path(
         resource_path(
-            "session.json"
+            session_file
         )
     )
+    output_file.parent.mkdir(
+        exist_ok=True,
+        parents=True
+    )
     session_result = json.dumps(session_data, indent=4)
     output_file.write_text(
         session_result
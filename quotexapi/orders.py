@@ -0,0 +1,313 @@
+# quotexapi/orders.py
+
+"""Module for sending Quotex orders with as little work as possible on the hot path."""
+import time
+import json
+import asyncio
+from .expiration import get_expiration_time_quotex
+from .ws.writer import PRIORITY_HIGH
+
+
+class OrderResult(object):
+    """Class for the outcome of one order sent by the pipeline."""
+
+    __slots__ = ("index", "order", "request_id", "status", "data", "latency")
+
+    def __init__(self, index, order, request_id, status, data, latency):
+        self.index = index
+        self.order = order
+        self.request_id = request_id
+        self.status = status
+        self.data = data
+        self.latency = latency
+
+    def __iter__(self):
+        # Unpacks like the ``(status, data)`` pair returned by ``Quotex.buy``.
+        return iter((self.status, self.data))
+
+    def __repr__(self):
+        return (
+            f"OrderResult(index={self.index}, request_id={self.request_id}, "
+            f"status={self.status}, latency={self.latency:.4f})"
+        )
+
+
+class OrderPipeline(object):
+    """Class for a batch of orders in flight at the same time.
+
+    Every ``orders/open`` frame is queued back-to-back; each confirmation is
+    matched to its order by ``requestId`` through the pending registry, so
+    results come out in completion order rather than send order::
+
+        pipeline = client.buy_many(orders)
+        async for result in pipeline:
+            print(result.index, result.status, result.latency)
+        print(pipeline.stats())
+
+    A pipeline sends its orders once: iterating it again raises
+    RuntimeError instead of opening them a second time.
+    """
+
+    def __init__(self, client, orders, timeout=None):
+        """
+        :param client: The instance of :class:`Quotex
+            <quotexapi.stable_api.Quotex>`.
+        :param orders: Iterable of dicts with the ``Quotex.buy`` arguments:
+            amount, asset, direction, duration and optionally time_mode.
+        :param timeout: (optional) Seconds to wait for each confirmation;
+            defaults to the order duration, as ``Quotex.buy`` does.
+        """
+        self.client = client
+        self.orders = [dict(order) for order in orders]
+        self.timeout = timeout
+        self.sent = 0
+        self.confirmed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.latencies = []
+        self.started_at = None
+        self.finished_at = None
+
+    def __aiter__(self):
+        return self.run()
+
+    def send(self):
+        """Queue every order and get the futures their confirmations resolve.
+
+        :returns: list of (index, order, request_id, future, sent_at).
+        """
+        if self.started_at is not None:
+            raise RuntimeError("The orders of this pipeline were already sent")
+        api = self.client.api
+        linger = self.client.subscriptions.linger
+        for order in self.orders:
+            # Repeated holds on a followed stream send no frames.
+            self.client.hold_candles_stream(order["asset"], order["duration"], order["duration"] + linger)
+
+        in_flight = []
+        self.started_at = time.perf_counter()
+        for index, order in enumerate(self.orders):
+            request_id = api.next_request_id()
+            is_fast_option = order.get("time_mode", "TIMER").upper() == "TIME"
+            future = api.pending.create("orders/open", request_id)
+            api.buy(
+                order["amount"],
+                order["asset"],
+                order["direction"],
+                order["duration"],
+                request_id,
+                is_fast_option,
+                follow=False
+            )
+            self.sent += 1
+            in_flight.append((index, order, request_id, future, time.perf_counter()))
+
+        return in_flight
+
+    async def run(self):
+        """Send the orders and yield an :class:`OrderResult` as each completes."""
+        completed = asyncio.Queue()
+
+        async def settle(index, order, request_id, future, sent_at):
+            timeout = self.timeout if self.timeout is not None else order["duration"]
+            result = await self.client.api.pending.wait(future, timeout)
+            completed.put_nowait(self.record(index, order, request_id, result, sent_at))
+
+        in_flight = self.send()
+        tasks = [asyncio.create_task(settle(*entry)) for entry in in_flight]
+        try:
+            for _ in range(len(tasks)):
+                yield await completed.get()
+        finally:
+            self.finished_at = time.perf_counter()
+            for task in tasks:
+                task.cancel()
+            # Left early: later confirmations must not land on dead futures.
+            for _, _, _, future, _ in in_flight:
+                if not future.done():
+                    self.client.api.pending.discard(future)
+
+    def record(self, index, order, request_id, result, sent_at):
+        latency = time.perf_counter() - sent_at
+        if result is None:
+            self.timed_out += 1
+            self.failed += 1
+            return OrderResult(index, order, request_id, False, None, latency)
+
+        self.latencies.append(latency)
+        if result.get("error"):
+            self.failed += 1
+            return OrderResult(index, order, request_id, False, result["error"], latency)
+
+        self.confirmed += 1
+        return OrderResult(index, order, request_id, True, result, latency)
+
+    @property
+    def elapsed(self):
+        """Property to get the seconds from the first send to the last result."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def throughput(self):
+        """Property to get the confirmed orders per second."""
+        elapsed = self.elapsed
+        return self.confirmed / elapsed if elapsed else 0.0
+
+    def stats(self):
+        """Get the pipeline counters.
+
+        :returns: dict with sent, confirmed, failed, timed_out, elapsed,
+            throughput and the average and maximum confirmation latency.
+        """
+        return {
+            "sent": self.sent,
+            "confirmed": self.confirmed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "avg_latency": sum(self.latencies) / len(self.latencies) if self.latencies else 0.0,
+            "max_latency": max(self.latencies, default=0.0),
+        }
+
+
+class ArmedOrder(object):
+    """Class for an order prepared ahead of its signal.
+
+    Arming follows the asset, applies the fast-option settings and
+    serializes the ``orders/open`` frame once; firing only fills in the
+    expiration, direction and ``requestId`` and queues that single frame::
+
+        armed = client.arm_order(10, "EURUSD_otc", 60)
+        status, buy_info = await armed.fire("call")
+
+    Re-arm after switching between demo and real accounts, since the
+    account mode is part of the serialized frame.
+    """
+
+    def __init__(self, client, amount, asset, duration, direction=None, time_mode="TIMER"):
+        """
+        :param client: The instance of :class:`Quotex
+            <quotexapi.stable_api.Quotex>`.
+        :param amount: The order amount.
+        :param asset: The asset symbol.
+        :param duration: The order duration in seconds.
+        :param direction: (optional) Default ``call`` or ``put`` for :meth:`fire`.
+        :param time_mode: ``TIMER`` for a relative duration or ``TIME`` for
+            a fixed expiration, as in ``Quotex.buy``.
+        """
+        self.client = client
+        self.amount = amount
+        self.asset = asset
+        self.duration = duration
+        self.direction = direction
+        self.is_fast_option = time_mode.upper() == "TIME"
+        # Same rule as the buy channel: fixed expirations unless OTC timer.
+        self.is_fixed_time = "_otc" not in asset or self.is_fast_option
+        self.option_type = 1 if self.is_fixed_time else 100
+        self.expiration_time = None
+        self.template = None
+        self.following = False
+        self.fired = 0
+
+    def arm(self):
+        """Subscribe, apply the settings and serialize the frame template."""
+        api = self.client.api
+        if not self.following:
+            self.client.start_candles_stream(self.asset, self.duration)
+            self.following = True
+        if self.is_fixed_time:
+            self.apply_expiration(self.next_expiration())
+
+        payload = {
+            "asset": self.asset,
+            "amount": self.amount,
+            "isDemo": api.account_type,
+            "tournamentId": 0,
+            "optionType": self.option_type
+        }
+        # The fixed fields without the closing brace; each firing appends
+        # time, action and requestId.
+        self.template = '42["orders/open",' + json.dumps(payload)[:-1]
+        return self
+
+    def next_expiration(self):
+        return int(get_expiration_time_quotex(
+            int(self.client.api.timesync.server_timestamp),
+            self.duration
+        ))
+
+    def apply_expiration(self, expiration_time):
+        self.expiration_time = expiration_time
+        if self.is_fast_option:
+            # Same lane as the order, so it never goes out first.
+            self.client.api.settings_apply(
+                self.asset,
+                self.duration,
+                is_fast_option=True,
+                end_time=expiration_time,
+                priority=PRIORITY_HIGH
+            )
+
+    def frame(self, direction, request_id):
+        """Get the ``orders/open`` frame for one firing."""
+        if self.template is None:
+            self.arm()
+        if self.is_fixed_time:
+            expiration_time = self.next_expiration()
+            if expiration_time != self.expiration_time:
+                # The armed expiration rolled over; only then resend settings.
+                self.apply_expiration(expiration_time)
+            order_time = expiration_time
+        else:
+            order_time = self.duration
+        return (
+            f'{self.template}, "time": {int(order_time)}, '
+            f'"action": {json.dumps(direction)}, "requestId": {int(request_id)}}}]'
+        )
+
+    def send(self, direction=None):
+        """Queue the order frame without waiting for its confirmation.
+
+        :param direction: (optional) ``call`` or ``put``; defaults to the
+            direction given when arming.
+        :returns: The ``requestId`` and the :class:`asyncio.Future` its
+            confirmation resolves.
+        """
+        api = self.client.api
+        request_id = api.next_request_id()
+        future = api.pending.create("orders/open", request_id)
+        api.send_websocket_request(
+            self.frame(direction or self.direction, request_id),
+            priority=PRIORITY_HIGH
+        )
+        self.fired += 1
+        return request_id, future
+
+    async def fire(self, direction=None, timeout=None):
+        """Send the order and wait for its confirmation.
+
+        :param direction: (optional) ``call`` or ``put``.
+        :param timeout: (optional) Seconds to wait; defaults to the duration.
+        :returns: ``(status, data)`` as returned by ``Quotex.buy``.
+        """
+        _, future = self.send(direction)
+        result = await self.client.api.pending.wait(
+            future,
+            timeout if timeout is not None else self.duration
+        )
+        if result is None:
+            return False, None
+        if result.get("error"):
+            return False, result["error"]
+
+        return True, result
+
+    def disarm(self):
+        """Release the asset; it is unfollowed once nothing else uses it."""
+        if self.following:
+            self.client.stop_candles_stream(self.asset, self.duration)
+            self.following = False
+        self.template = None
@@ -0,0 +1,238 @@
+# quotexapi/pool.py
+
+"""Module for running several Quotex accounts in one event loop."""
+import os
+import re
+import time
+import asyncio
+import logging
+from .stable_api import Quotex
+
+logger = logging.getLogger(__name__)
+
+# Seconds between the start of two logins.
+LOGIN_STAGGER = 2.0
+LOGIN_TIMEOUT = 120
+HEALTH_INTERVAL = 30
+# Seconds to wait for each account's answer in the aggregated views.
+REQUEST_TIMEOUT = 10
+
+
+class PoolAccount(object):
+    """Class for one account of a :class:`QuotexPool`."""
+
+    __slots__ = ("id", "client", "status", "reason", "connected_at", "checked_at", "reconnects")
+
+    def __init__(self, account_id, client):
+        self.id = account_id
+        self.client = client
+        self.status = "idle"
+        self.reason = None
+        self.connected_at = None
+        self.checked_at = None
+        self.reconnects = 0
+
+    @property
+    def alive(self):
+        api = self.client.api
+        if api is None or api.websocket_client is None:
+            return False
+        return api.state.check_websocket_if_connect == 1 and api.websocket_alive()
+
+    def info(self):
+        return {
+            "id": self.id,
+            "status": self.status,
+            "reason": self.reason,
+            "connected_at": self.connected_at,
+            "checked_at": self.checked_at,
+            "reconnects": self.reconnects
+        }
+
+
+class QuotexPool(object):
+    """Class for many authenticated :class:`Quotex` sessions in one event loop.
+
+    Each account gets its own session file and browser profile, logins are
+    started ``stagger`` seconds apart, and a health check reconnects the
+    sessions whose websocket dropped. Calls are routed by account id::
+
+        async with QuotexPool(accounts) as pool:
+            await pool.call("alice", "buy", 5, "EURUSD_otc", "call", 60)
+            print(await pool.get_balances())
+    """
+
+    def __init__(self, accounts, stagger=LOGIN_STAGGER, login_timeout=LOGIN_TIMEOUT,
+                 health_interval=HEALTH_INTERVAL, session_dir="sessions", browser_dir="browser",
+                 **options):
+        """
+        :param accounts: Iterable of dicts with ``email`` and ``password``,
+            an optional ``id`` (the email by default) and any other
+            :class:`Quotex` argument for that account.
+        :param float stagger: Seconds between the start of two logins.
+        :param float login_timeout: Seconds allowed for one connection.
+        :param float health_interval: Seconds between health checks; 0
+            disables them.
+        :param str session_dir: Directory of the per-account session files.
+        :param str browser_dir: Directory of the per-account browser profiles.
+        :param options: :class:`Quotex` arguments shared by every account.
+        """
+        self.stagger = stagger
+        self.login_timeout = login_timeout
+        self.health_interval = health_interval
+        self.accounts = {}
+        self._health_task = None
+        for account in accounts:
+            account = dict(account)
+            account_id = str(account.pop("id", None) or account["email"])
+            if account_id in self.accounts:
+                raise ValueError(f"Duplicate account id: {account_id}")
+            folder = re.sub(r"[^\w.@-]", "_", account_id)
+            settings = dict(options)
+            settings.setdefault("session_file", os.path.join(session_dir, f"{folder}.json"))
+            settings.setdefault("user_data_dir", os.path.join(browser_dir, folder))
+            settings.update(account)
+            self.accounts[account_id] = PoolAccount(account_id, Quotex(**settings))
+
+    def __getitem__(self, account_id):
+        return self.client(account_id)
+
+    def __contains__(self, account_id):
+        return account_id in self.accounts
+
+    def __len__(self):
+        return len(self.accounts)
+
+    @property
+    def ids(self):
+        return list(self.accounts)
+
+    def client(self, account_id):
+        """Get the :class:`Quotex` client of ``account_id``."""
+        account = self.accounts.get(account_id)
+        if account is None:
+            raise KeyError(f"Unknown account: {account_id}")
+        return account.client
+
+    async def connect_account(self, account):
+        account.status = "connecting"
+        try:
+            check, reason = await asyncio.wait_for(account.client.connect(), self.login_timeout)
+        except asyncio.TimeoutError:
+            check, reason = False, "Connection timed out."
+        except Exception as e:
+            check, reason = False, str(e) or type(e).__name__
+        account.status = "connected" if check else "failed"
+        account.reason = reason
+        account.checked_at = time.time()
+        if check:
+            account.connected_at = account.checked_at
+        else:
+            logger.error(f"Account {account.id} failed to connect: {reason}")
+        return check, reason
+
+    async def start(self):
+        """Connect every account, starting one login each ``stagger`` seconds.
+
+        :returns: dict of account id to the ``(check, reason)`` of its
+            connection.
+        """
+        async def staggered(delay, account):
+            await asyncio.sleep(delay)
+            return await self.connect_account(account)
+
+        accounts = list(self.accounts.values())
+        results = await asyncio.gather(*(
+            staggered(position * self.stagger, account)
+            for position, account in enumerate(accounts)
+        ))
+        if self.health_interval and self._health_task is None:
+            self._health_task = asyncio.create_task(self.health_loop())
+        return {account.id: result for account, result in zip(accounts, results)}
+
+    async def check_health(self):
+        """Reconnect the accounts whose websocket is down.
+
+        :returns: The ids of the accounts reconnected.
+        """
+        reconnected = []
+        for account in self.accounts.values():
+            if account.status == "connecting":
+                continue
+            if account.alive:
+                account.status = "connected"
+                account.checked_at = time.time()
+                continue
+            logger.info(f"Account {account.id} is down, reconnecting.")
+            account.reconnects += 1
+            # connect() closes the dead connection and replays the streams.
+            check, _ = await self.connect_account(account)
+            if check:
+                reconnected.append(account.id)
+        return reconnected
+
+    async def health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.check_health()
+            except Exception:
+                logger.exception("Pool health check failed.")
+
+    def status(self):
+        """Get the connection status of every account."""
+        return {account_id: account.info() for account_id, account in self.accounts.items()}
+
+    async def call(self, account_id, method, *args, **kwargs):
+        """Call ``method`` on the client of ``account_id``, awaiting it if needed."""
+        result = getattr(self.client(account_id), method)(*args, **kwargs)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    def connected(self):
+        return [account for account in self.accounts.values() if account.status == "connected"]
+
+    async def get_balances(self):
+        """Get the balance of every connected account.
+
+        :returns: dict with ``accounts`` (account id to balance, ``None``
+            when it could not be read) and their ``total``.
+        """
+        accounts = self.connected()
+        balances = await asyncio.gather(
+            *(asyncio.wait_for(account.client.get_balance(), REQUEST_TIMEOUT) for account in accounts),
+            return_exceptions=True
+        )
+        result = {
+            account.id: None if isinstance(balance, BaseException) else balance
+            for account, balance in zip(accounts, balances)
+        }
+        return {
+            "accounts": result,
+            "total": round(sum(balance for balance in result.values() if balance is not None), 2)
+        }
+
+    def get_open_positions(self):
+        """Get the open orders of every connected account.
+
+        :returns: dict of account id to its list of open orders.
+        """
+        return {account.id: account.client.get_open_positions() for account in self.connected()}
+
+    async def close(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
+        for account in self.accounts.values():
+            if account.client.api is not None:
+                account.client.close()
+            account.status = "closed"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
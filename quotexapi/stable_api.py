@@ -5,12 +5,21 @@ import logging
 import asyncio
 from datetime import datetime
 from . import expiration
-from . import global_value
 from .api import QuotexAPI
+from .orders import (
+    ArmedOrder,
+    OrderPipeline
+)
+from .subscriptions import Subscriptions, SUBSCRIPTION_LINGER
 from .utils.services import truncate
+from .utils.ticks import TICK_CAPACITY
+from .utils.candle_builder import CandleBuilder, CANDLE_HISTORY
+from .utils.candle_cache import CandleCache
+from .utils.candle_store import CandleStore, normalize_candle
+from .utils.history_downloader import HistoryDownloader, DOWNLOAD_CONCURRENCY
+from .utils.batch_indicators import candle_matrix
 from .utils.processor import (
     calculate_candles,
-    process_candles_v2,
     merge_candles
 )
 from .config import (
@@ -18,11 +27,18 @@ from .config import (
     update_session,
     resource_path
 )
-from .utils.indicators import TechnicalIndicators
+from .utils.indicator_set import IndicatorSet, parse_spec
+from .utils.indicator_cache import IndicatorCache, INDICATOR_CACHE_SIZE, candle_bucket
+from .utils.streaming import create_streaming_indicator
 
 __version__ = "1.0.0"
 logger = logging.getLogger(__name__)
 
+# Candles asked per history/load request when filling store gaps.
+LOAD_CANDLES = 500
+# Seconds to wait for the response of a websocket request.
+RESPONSE_TIMEOUT = 30
+
 
 class Quotex:
 
@@ -35,7 +51,14 @@ class Quotex:
             root_path=".",
             user_data_dir="browser",
             asset_default="EURUSD",
-            period_default=60
+            period_default=60,
+            transport="thread",
+            tick_capacity=TICK_CAPACITY,
+            tick_retention=None,
+            indicator_cache_size=INDICATOR_CACHE_SIZE,
+            candle_store=None,
+            session_file="session.json",
+            subscription_linger=SUBSCRIPTION_LINGER
     ):
         self.size = [
             1,
@@ -61,6 +84,14 @@ class Quotex:
         self.user_data_dir = user_data_dir
         self.asset_default = asset_default
         self.period_default = period_default
+        self.transport = transport
+        self.tick_capacity = tick_capacity
+        self.tick_retention = tick_retention
+        self.indicator_cache = IndicatorCache(indicator_cache_size)
+        self.candle_store = CandleStore(candle_store) if candle_store else None
+        self.subscriptions = Subscriptions(self, subscription_linger)
+        self._builder_streams = {}
+        self._snapshot_locks = {}
         self.subscribe_candle = []
         self.subscribe_candle_all_size = []
         self.subscribe_mood = []
@@ -73,7 +104,8 @@ class Quotex:
         self.websocket_thread = None
         self.debug_ws_enable = False
         self.resource_path = resource_path(root_path)
-        session = load_session(user_agent)
+        self.session_file = session_file
+        session = load_session(user_agent, session_file)
         self.session_data = session
 
     @property
@@ -83,10 +115,9 @@ class Quotex:
         """
         return self.websocket_client.wss
 
-    @staticmethod
-    async def check_connect():
+    async def check_connect(self):
         await asyncio.sleep(2)
-        if global_value.check_accepted_connection == 1:
+        if self.api.state.check_accepted_connection == 1:
             return True
 
         return False
@@ -97,7 +128,7 @@ class Quotex:
             "token": ssid,
             "user_agent": user_agent
         }
-        self.session_data = update_session(session)
+        self.session_data = update_session(session, self.session_file)
 
     async def re_subscribe_stream(self):
         try:
@@ -124,7 +155,7 @@ class Quotex:
 
     def get_all_asset_name(self):
         if self.api.instruments:
-            return [[i[1], i[2].replace("\n", "")] for i in self.api.instruments]
+            return [[i.symbol, i.name] for i in self.api.instrument_table]
 
     async def get_available_asset(self, asset_name: str, force_open: bool = False):
         asset_open = await self.check_asset_open(asset_name)
@@ -136,97 +167,218 @@ class Quotex:
         return asset_name, asset_open
 
     async def check_asset_open(self, asset_name: str):
-        instruments = await self.get_instruments()
-        for i in instruments:
-            if asset_name == i[1]:
-                self.api.current_asset = asset_name
-                return i[0], i[2].replace("\n", ""), i[14]
+        await self.get_instruments()
+        instrument = self.api.instrument_table.get(asset_name)
+        if instrument is not None:
+            self.api.current_asset = asset_name
+            return instrument.id, instrument.name, instrument.open
 
     async def get_all_assets(self):
-        instruments = await self.get_instruments()
-        for i in instruments:
-            if i[0] != "":
-                self.codes_asset[i[1]] = i[0]
+        await self.get_instruments()
+        for i in self.api.instrument_table:
+            if i.id != "":
+                self.codes_asset[i.symbol] = i.id
 
         return self.codes_asset
 
-    async def get_candles(self, asset, end_from_time, offset, period, progressive=False):
+    async def get_candles(self, asset, end_from_time, offset, period, progressive=False,
+                          timeout=RESPONSE_TIMEOUT):
         if end_from_time is None:
             end_from_time = time.time()
-        index = expiration.get_timestamp()
-        self.api.candles.candles_data = None
-        self.start_candles_stream(asset, period)
+        if self.candle_store is not None:
+            return await self.get_stored_candles(asset, end_from_time, offset, period)
+        index = self.api.next_request_id()
+        if progressive:
+            future = self.api.pending.create("history/load", index)
+            self.hold_candles_stream(asset, period)
+            self.api.get_candles(asset, index, end_from_time, offset, period)
+            data = await self.api.pending.wait(future, timeout)
+            if data is None:
+                logger.warning(f"No candles of {asset} received in {timeout} seconds.")
+                return []
+            return data.get("data", {})
+
+        async with self.snapshot_lock(asset):
+            future = self.api.pending.create("history/list/v2", (asset, int(period)))
+            self.hold_candles_stream(asset, period, snapshot=True)
+            self.api.get_candles(asset, index, end_from_time, offset, period)
+            data = await self.api.pending.wait(future, timeout)
+        if data is None:
+            logger.warning(f"No candles of {asset} received in {timeout} seconds.")
+            return []
+        return self.prepare_candles(asset, period, data["history"])
+
+    def snapshot_lock(self, asset):
+        """Get the lock running the ``history/list/v2`` reads of ``asset`` one
+        at a time, so a snapshot without a period is never taken by the read
+        of another period."""
+        lock = self._snapshot_locks.get(asset)
+        if lock is None:
+            lock = self._snapshot_locks[asset] = asyncio.Lock()
+        return lock
+
+    async def load_history(self, asset, end_from_time, offset, period, timeout=RESPONSE_TIMEOUT):
+        """Request the candles of ``offset`` seconds before ``end_from_time``.
+
+        :returns: list of candle dicts as sent by ``history/load``, or
+            ``None`` if no response arrived within ``timeout`` seconds.
+        """
+        index = self.api.next_request_id()
+        future = self.api.pending.create("history/load", index)
         self.api.get_candles(asset, index, end_from_time, offset, period)
-        while True:
-            while self.check_connect and self.api.candles.candles_data is None:
-                await asyncio.sleep(0.1)
-            if self.api.candles.candles_data is not None:
-                break
+        data = await self.api.pending.wait(future, timeout)
+        if data is None:
+            return None
+        return [normalize_candle(candle) for candle in data.get("data") or []]
+
+    async def download_history(self, asset, start, end=None, period=60, window=None,
+                               concurrency=DOWNLOAD_CONCURRENCY, timeout=10, checkpoint=None,
+                               on_progress=None):
+        """Download the candles of ``[start, end)`` with several ``history/load``
+        requests in flight.
+
+        :param int window: Seconds per request; 500 candles by default.
+        :param str checkpoint: (optional) JSONL file recording finished
+            windows; an interrupted download resumes from it.
+        :param on_progress: (optional) Called with the download stats
+            (``candles``, ``requests``, ``candles_per_second``, ...).
+        :returns: The instance of :class:`HistoryDownloader`; its ``run()``
+            result is in ``candles``.
+        """
+        if end is None:
+            end = int(time.time() // period) * period
+        self.hold_candles_stream(asset, period)
+
+        async def fetch(end_from_time, offset):
+            return await self.load_history(asset, end_from_time, offset, period, timeout)
+
+        downloader = HistoryDownloader(
+            fetch, asset, period, start, end,
+            window=window,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            on_progress=on_progress
+        )
+        downloader.candles = await downloader.run()
+        if self.candle_store is not None:
+            self.candle_store.save(asset, period, downloader.candles)
+        return downloader
 
-        candles = self.prepare_candles(asset, period)
-        if progressive:
-            return self.api.historical_candles.get("data", {})
+    async def fill_candle_store(self, asset, start, end, period):
+        """Fetch the parts of ``[start, end)`` missing from the candle store.
+
+        Each gap is requested newest first in chunks of ``LOAD_CANDLES``
+        candles. A chunk is recorded as fetched from its first candle on, so
+        a response cut short by the server leaves the rest as a gap.
 
+        :returns: The number of ``history/load`` requests sent.
+        """
+        requests = 0
+        for gap_start, gap_end in self.candle_store.gaps(asset, period, start, end):
+            chunk_end = gap_end
+            while chunk_end > gap_start:
+                chunk_start = max(gap_start, chunk_end - period * LOAD_CANDLES)
+                candles = await self.load_history(asset, chunk_end, chunk_end - chunk_start, period)
+                requests += 1
+                if candles is None:
+                    # No response: leave the rest of the gap for the next call.
+                    break
+                candles = [candle for candle in candles if chunk_start <= candle["time"] < chunk_end]
+                first = min((candle["time"] for candle in candles), default=chunk_start)
+                covered_start = first if first > chunk_start + period else chunk_start
+                self.candle_store.save(asset, period, candles)
+                self.candle_store.mark(asset, period, covered_start, chunk_end)
+                chunk_end = covered_start
+        return requests
+
+    async def get_stored_candles(self, asset, end_from_time, offset, period):
+        """Get the candles of ``offset`` seconds before ``end_from_time``
+        from the candle store, fetching only what it is missing.
+
+        Closed candles are stored; the candle still open, if the range
+        reaches it, is always fetched and never stored.
+        """
+        end = int(end_from_time)
+        start = end - int(offset)
+        closed_end = min(end, int(time.time() // period) * period)
+        self.hold_candles_stream(asset, period)
+        await self.fill_candle_store(asset, start, closed_end, period)
+        candles = self.candle_store.load(asset, period, start, closed_end)
+        if end > closed_end:
+            recent = await self.load_history(asset, end, end - closed_end, period)
+            candles += sorted(
+                (candle for candle in recent or [] if closed_end <= candle["time"] < end),
+                key=lambda candle: candle["time"]
+            )
         return candles
 
-    async def get_history_line(self, asset, end_from_time, offset):
+    async def get_history_line(self, asset, end_from_time, offset, timeout=RESPONSE_TIMEOUT):
         if end_from_time is None:
             end_from_time = time.time()
-        index = expiration.get_timestamp()
+        index = self.api.next_request_id()
         self.api.current_asset = asset
-        self.api.historical_candles = None
-        self.start_candles_stream(asset)
+        future = self.api.pending.create("history/load", index)
+        self.hold_candles_stream(asset)
         self.api.get_history_line(self.codes_asset[asset], index, end_from_time, offset)
-        while True:
-            while self.check_connect and self.api.historical_candles is None:
-                await asyncio.sleep(0.2)
-            if self.api.historical_candles is not None:
-                break
-        return self.api.historical_candles
-
-    async def get_candle_v2(self, asset, period):
-        self.api.candle_v2_data[asset] = None
-        self.start_candles_stream(asset, period)
-        while self.api.candle_v2_data[asset] is None:
-            await asyncio.sleep(0.2)
-        candles = self.prepare_candles(asset, period)
-        return candles
-
-    def prepare_candles(self, asset: str, period: int):
+        return await self.api.pending.wait(future, timeout)
+
+    async def get_candle_v2(self, asset, period, timeout=RESPONSE_TIMEOUT):
+        async with self.snapshot_lock(asset):
+            future = self.api.pending.create("history/list/v2", (asset, int(period)))
+            self.hold_candles_stream(asset, period, snapshot=True)
+            data = await self.api.pending.wait(future, timeout)
+        if data is None:
+            return []
+        return self.prepare_candles(asset, period, data["history"])
+
+    def prepare_candles(self, asset: str, period: int, history: list = None):
         """
         Prepare candles data for a specified asset.
 
         Args:
             asset (str): Asset name.
             period (int): Period for fetching candles.
+            history (list, optional): Tick history to build candles from.
+                Defaults to the last history received for the current asset.
 
         Returns:
             list: List of prepared candles data.
         """
-        candles_data = calculate_candles(self.api.candles.candles_data, period)
-        candles_v2_data = process_candles_v2(self.api.candle_v2_data, asset, candles_data)
-        new_candles = merge_candles(candles_v2_data)
+        if history is None:
+            history = self.api.candles.candles_data
+        candles_data = calculate_candles(history, period)
+        server_candles = self.api.candle_v2_data.get(asset, {}).get("candles", [])[1:]
+        # Server candles win over the ones computed from ticks.
+        new_candles = merge_candles(candles_data, server_candles)
 
         return new_candles
 
     async def connect(self):
+        if self.api is not None:
+            # Stop the writer and socket of the previous connection.
+            self.close()
         self.api = QuotexAPI(
             "qxbroker.com",
             self.email,
             self.password,
             self.lang,
             resource_path=self.resource_path,
-            user_data_dir=self.user_data_dir
+            user_data_dir=self.user_data_dir,
+            transport=self.transport,
+            tick_capacity=self.tick_capacity,
+            tick_retention=self.tick_retention,
+            session_file=self.session_file
         )
-        self.close()
         self.api.trace_ws = self.debug_ws_enable
         self.api.session_data = self.session_data
         self.api.current_asset = self.asset_default
         self.api.current_period = self.period_default
-        global_value.SSID = self.session_data.get("token")
+        self.api.state.ssid = self.session_data.get("token")
 
         if not self.session_data.get("token"):
-            await self.api.authenticate()
+            status, message = await self.api.authenticate()
+            if not status:
+                return False, message
 
         check, reason = await self.api.connect(self.account_is_demo)
 
@@ -234,6 +386,8 @@ class Quotex:
             logger.debug("Reconnecting on websocket")
             return await self.connect()
 
+        if check:
+            self.subscriptions.replay()
         return check, reason
 
     async def reconnect(self):
@@ -254,16 +408,16 @@ class Quotex:
         self.account_is_demo = 0 if balance_mode.upper() == "REAL" else 1
         self.api.change_account(self.account_is_demo)
 
-    async def edit_practice_balance(self, amount=None):
-        self.api.training_balance_edit_request = None
+    async def edit_practice_balance(self, amount=None, timeout=RESPONSE_TIMEOUT):
+        future = self.api.pending.create("demo/refill")
         self.api.edit_training_balance(amount)
-        while self.api.training_balance_edit_request is None:
-            await asyncio.sleep(0.2)
-        return self.api.training_balance_edit_request
+        return await self.api.pending.wait(future, timeout)
 
-    async def get_balance(self):
-        while self.api.account_balance is None:
-            await asyncio.sleep(0.2)
+    async def get_balance(self, timeout=RESPONSE_TIMEOUT):
+        if self.api.account_balance is None:
+            await self.api.pending.wait(self.api.pending.create("balance"), timeout)
+            if self.api.account_balance is None:
+                return None
         balance = self.api.account_balance.get("demoBalance") \
             if self.api.account_type > 0 else self.api.account_balance.get("liveBalance")
         return float(f"{truncate(balance + self.get_profit(), 2):.2f}")
@@ -295,145 +449,103 @@ class Quotex:
                 - 14400: 4 horas
                 - 86400: 1 día
         """
+        results = await self.calculate_indicators(asset, [(indicator, params)], history_size, timeframe)
+        if "error" in results:
+            return results
+        return next(iter(results.values()))
+
+    async def calculate_indicators(
+            self, asset: str,
+            specs: list,
+            history_size: int = 3600,
+            timeframe: int = 60
+    ) -> dict:
+        """
+        Calcula varios indicadores técnicos con una sola descarga de velas
+
+        Los cálculos intermedios comunes (EMAs, SMAs, True Range, máximos y
+        mínimos móviles) se hacen una sola vez para todos los indicadores.
+        Cada resultado queda en ``self.indicator_cache`` hasta que cierra la
+        siguiente vela del timeframe; si todos están en caché no se
+        descargan velas.
+
+        Args:
+            asset (str): Nombre del activo (ej: "EURUSD")
+            specs (list): Indicadores a calcular: "RSI", ("EMA", {"period": 12})
+                o {"indicator": "EMA", "params": {...}, "name": "ema_rapida"}
+            history_size (int): Tamaño del histórico en segundos
+            timeframe (int): Temporalidad en segundos
+
+        Returns:
+            dict: nombre -> resultado, cada uno igual al de calculate_indicator
+        """
         # Validar timeframe
         valid_timeframes = [60, 300, 900, 1800, 3600, 7200, 14400, 86400]
         if timeframe not in valid_timeframes:
             return {"error": f"Timeframe no válido. Valores permitidos: {valid_timeframes}"}
 
-        # Ajustar history_size para asegurar suficientes velas según el timeframe
-        adjusted_history = max(history_size, timeframe * 50)  # Asegurar al menos 50 velas
+        bucket = candle_bucket(timeframe)
+        specs = [parse_spec(spec) for spec in specs]
+        results, missing = {}, []
+        for name, indicator, params in specs:
+            key = IndicatorCache.key(asset, indicator, params, timeframe, history_size)
+            cached = self.indicator_cache.get(key, bucket)
+            if cached is None:
+                missing.append((name, indicator, params, key))
+            else:
+                results[name] = cached
 
-        candles = await self.get_candles(asset, time.time(), adjusted_history, timeframe)
+        if missing:
+            # Ajustar history_size para asegurar suficientes velas según el timeframe
+            adjusted_history = max(history_size, timeframe * 50)  # Asegurar al menos 50 velas
 
-        if not candles:
-            return {"error": f"No hay datos disponibles para el activo {asset}"}
+            candles = await self.get_candles(asset, time.time(), adjusted_history, timeframe)
 
-        prices = [float(candle["close"]) for candle in candles]
-        highs = [float(candle["high"]) for candle in candles]
-        lows = [float(candle["low"]) for candle in candles]
-        timestamps = [candle["time"] for candle in candles]
+            if not candles:
+                return {"error": f"No hay datos disponibles para el activo {asset}"}
 
-        indicators = TechnicalIndicators()
-        indicator = indicator.upper()
+            prices = [float(candle["close"]) for candle in candles]
+            highs = [float(candle["high"]) for candle in candles]
+            lows = [float(candle["low"]) for candle in candles]
+            timestamps = [candle["time"] for candle in candles]
 
-        try:
-            # RSI
-            if indicator == "RSI":
-                period = params.get("period", 14)
-                values = indicators.calculate_rsi(prices, period)
-                return {
-                    "rsi": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
-
-            # MACD
-            elif indicator == "MACD":
-                fast_period = params.get("fast_period", 12)
-                slow_period = params.get("slow_period", 26)
-                signal_period = params.get("signal_period", 9)
-                macd_data = indicators.calculate_macd(prices, fast_period, slow_period, signal_period)
-                macd_data["timeframe"] = timeframe
-                macd_data["timestamps"] = timestamps[-len(macd_data["macd"]):] if macd_data["macd"] else []
-                return macd_data
-
-            # SMA
-            elif indicator == "SMA":
-                period = params.get("period", 20)
-                values = indicators.calculate_sma(prices, period)
-                return {
-                    "sma": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
-
-            # EMA
-            elif indicator == "EMA":
-                period = params.get("period", 20)
-                values = indicators.calculate_ema(prices, period)
-                return {
-                    "ema": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
-
-            # BOLLINGER
-            elif indicator == "BOLLINGER":
-                period = params.get("period", 20)
-                num_std = params.get("std", 2)
-                bb_data = indicators.calculate_bollinger_bands(prices, period, num_std)
-                bb_data["timeframe"] = timeframe
-                bb_data["timestamps"] = timestamps[-len(bb_data["middle"]):] if bb_data["middle"] else []
-                return bb_data
-
-            # STOCHASTIC
-            elif indicator == "STOCHASTIC":
-                k_period = params.get("k_period", 14)
-                d_period = params.get("d_period", 3)
-                stoch_data = indicators.calculate_stochastic(prices, highs, lows, k_period, d_period)
-                stoch_data["timeframe"] = timeframe
-                stoch_data["timestamps"] = timestamps[-len(stoch_data["k"]):] if stoch_data["k"] else []
-                return stoch_data
-
-            # ATR
-            elif indicator == "ATR":
-                period = params.get("period", 14)
-                values = indicators.calculate_atr(highs, lows, prices, period)
-                return {
-                    "atr": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
-
-            # ADX
-            elif indicator == "ADX":
-                period = params.get("period", 14)
-                adx_data = indicators.calculate_adx(highs, lows, prices, period)
-                adx_data["timeframe"] = timeframe
-                adx_data["timestamps"] = timestamps[-len(adx_data["adx"]):] if adx_data["adx"] else []
-                return adx_data
-
-            # ICHIMOKU
-            elif indicator == "ICHIMOKU":
-                tenkan_period = params.get("tenkan_period", 9)
-                kijun_period = params.get("kijun_period", 26)
-                senkou_b_period = params.get("senkou_b_period", 52)
-                ichimoku_data = indicators.calculate_ichimoku(highs, lows, tenkan_period, kijun_period, senkou_b_period)
-                ichimoku_data["timeframe"] = timeframe
-                ichimoku_data["timestamps"] = timestamps[-len(ichimoku_data["tenkan"]):] if ichimoku_data[
-                    "tenkan"] else []
-                return ichimoku_data
+            computed = IndicatorSet([
+                {"indicator": indicator, "params": params, "name": name}
+                for name, indicator, params, _ in missing
+            ]).calculate(prices, highs, lows)
+            for name, _, _, key in missing:
+                result = computed[name]
+                if "error" not in result:
+                    line = next(iter(result.values()))
+                    result["timeframe"] = timeframe
+                    result["timestamps"] = timestamps[-len(line):] if line else []
+                    self.indicator_cache.put(key, bucket, result)
+                results[name] = result
 
-            else:
-                return {"error": f"Indicador '{indicator}' no soportado"}
-
-        except Exception as e:
-            return {"error": f"Error calculando el indicador: {str(e)}"}
+        return {name: results[name] for name, _, _ in specs}
 
     async def subscribe_indicator(
             self, asset: str,
             indicator: str,
             params: dict = None,
             callback=None,
-            timeframe: int = 60
+            timeframe: int = 60,
+            forming: bool = False
     ):
         """
         Suscribe a actualizaciones en tiempo real de un indicador
 
+        El histórico se descarga una sola vez para sembrar el indicador;
+        después cada vela cerrada lo actualiza en O(1) y dispara el callback.
+
         Args:
             asset (str): Nombre del activo
             indicator (str): Nombre del indicador
             params (dict): Parámetros del indicador
             callback (callable): Función que se llamará con cada actualización
             timeframe (int): Temporalidad en segundos
+            forming (bool): Llamar también al callback en cada tick con el
+                valor calculado sobre la vela en formación
         """
         if not callback:
             raise ValueError("Debe proporcionar una función callback")
@@ -443,141 +555,80 @@ class Quotex:
         if timeframe not in valid_timeframes:
             raise ValueError(f"Timeframe no válido. Valores permitidos: {valid_timeframes}")
 
+        stream = create_streaming_indicator(indicator, params)
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def on_candle(candle_asset, period, candle, closed=True):
+            if period == timeframe:
+                loop.call_soon_threadsafe(events.put_nowait, (candle, closed))
+
+        def on_forming(candle_asset, period, candle):
+            on_candle(candle_asset, period, candle, closed=False)
+
+        created = asset not in self.api.candle_builders
+        builder = self.start_candle_builder(asset, [timeframe])
+        self.start_candles_stream(asset, timeframe)
+        builder.add_listener(on_candle)
+        if forming:
+            builder.add_listener(on_forming, forming=True)
+
         try:
-            # Iniciar stream de velas
-            self.start_candles_stream(asset, timeframe)
+            # Sembrar con el histórico: sólo las velas ya cerradas
+            open_bar = builder.current(timeframe)
+            open_time = open_bar["time"] if open_bar else float("inf")
+            historical_candles = await self.get_candles(
+                asset,
+                time.time(),
+                timeframe * max(stream.warmup * 2, 50),
+                timeframe
+            )
+            seed = {
+                candle["time"]: candle for candle in historical_candles or []
+                if isinstance(candle, dict) and candle["time"] < open_time
+            }
+            for candle in builder.candles(timeframe, include_open=False):
+                seed.setdefault(candle["time"], candle)
+            stream.seed(seed[candle_time] for candle_time in sorted(seed))
 
             while True:
+                candle, closed = await events.get()
+                if stream.last_time is not None and candle["time"] <= stream.last_time:
+                    continue
+                if not closed and not events.empty():
+                    # Hay un evento más reciente; este tick ya quedó atrás.
+                    continue
+                value = stream.update(candle, closed)
                 try:
-                    # Obtener velas en tiempo real
-                    real_time_candles = await self.get_realtime_candles(asset, timeframe)
-
-                    if real_time_candles:
-                        # Convertir el diccionario a lista ordenada por tiempo
-                        candles_list = sorted(real_time_candles.items(), key=lambda x: x[0])
-
-                        # Extraer datos de las velas
-                        prices = [float(candle[1]["close"]) for candle in candles_list]
-                        highs = [float(candle[1]["high"]) for candle in candles_list]
-                        lows = [float(candle[1]["low"]) for candle in candles_list]
-
-                        # Asegurar que tenemos suficientes datos
-                        min_periods = {
-                            "RSI": 14,
-                            "MACD": 26,
-                            "BOLLINGER": 20,
-                            "STOCHASTIC": 14,
-                            "ADX": 14,
-                            "ATR": 14,
-                            "SMA": 20,
-                            "EMA": 20,
-                            "ICHIMOKU": 52
-                        }
-
-                        required_periods = min_periods.get(indicator.upper(), 14)
-                        if len(prices) < required_periods:
-                            # Si no hay suficientes datos, obtener histórico
-                            historical_candles = await self.get_candles(
-                                asset,
-                                time.time(),
-                                timeframe * required_periods * 2,  # Doble del período requerido
-                                timeframe
-                            )
-                            if historical_candles:
-                                # Combinar datos históricos con tiempo real
-                                prices = [float(candle["close"]) for candle in historical_candles] + prices
-                                highs = [float(candle["high"]) for candle in historical_candles] + highs
-                                lows = [float(candle["low"]) for candle in historical_candles] + lows
-
-                        indicators = TechnicalIndicators()
-                        indicator = indicator.upper()
-
-                        # Calcular el indicador con los datos actualizados
-                        result = {
-                            "time": candles_list[-1][0],
-                            "timeframe": timeframe,
-                            "asset": asset
-                        }
-
-                        if indicator == "RSI":
-                            period = params.get("period", 14)
-                            values = indicators.calculate_rsi(prices, period)
-                            result["value"] = values[-1] if values else None
-                            result["all_values"] = values
-                            result["indicator"] = "RSI"
-
-                        elif indicator == "MACD":
-                            fast_period = params.get("fast_period", 12)
-                            slow_period = params.get("slow_period", 26)
-                            signal_period = params.get("signal_period", 9)
-                            macd_data = indicators.calculate_macd(prices, fast_period, slow_period, signal_period)
-                            result["value"] = macd_data["current"]
-                            result["all_values"] = macd_data
-                            result["indicator"] = "MACD"
-
-                        # BOLLINGER
-                        elif indicator == "BOLLINGER":
-                            period = params.get("period", 20)
-                            num_std = params.get("std", 2)
-                            bb_data = indicators.calculate_bollinger_bands(prices, period, num_std)
-                            result["value"] = bb_data["current"]
-                            result["all_values"] = bb_data
-
-                        # STOCHASTIC
-                        elif indicator == "STOCHASTIC":
-                            k_period = params.get("k_period", 14)
-                            d_period = params.get("d_period", 3)
-                            stoch_data = indicators.calculate_stochastic(prices, highs, lows, k_period, d_period)
-                            result["value"] = stoch_data["current"]
-                            result["all_values"] = stoch_data
-
-                        # ADX
-                        elif indicator == "ADX":
-                            period = params.get("period", 14)
-                            adx_data = indicators.calculate_adx(highs, lows, prices, period)
-                            result["value"] = adx_data["current"]
-                            result["all_values"] = adx_data
-
-                        # ATR
-                        elif indicator == "ATR":
-                            period = params.get("period", 14)
-                            values = indicators.calculate_atr(highs, lows, prices, period)
-                            result["value"] = values[-1] if values else None
-                            result["all_values"] = values
-
-                        # ICHIMOKU
-                        elif indicator == "ICHIMOKU":
-                            tenkan_period = params.get("tenkan_period", 9)
-                            kijun_period = params.get("kijun_period", 26)
-                            senkou_b_period = params.get("senkou_b_period", 52)
-                            ichimoku_data = indicators.calculate_ichimoku(highs, lows, tenkan_period, kijun_period,
-                                                                          senkou_b_period)
-                            result["value"] = ichimoku_data["current"]
-                            result["all_values"] = ichimoku_data
-
-                        else:
-                            result["error"] = f"Indicador '{indicator}' no soportado para tiempo real"
-
-                        # Llamar al callback con el resultado
-                        await callback(result)
-
-                    await asyncio.sleep(1)  # Esperar 1 segundo entre actualizaciones
-
+                    await callback({
+                        "time": candle["time"],
+                        "timeframe": timeframe,
+                        "asset": asset,
+                        "indicator": stream.name,
+                        "value": value,
+                        "all_values": stream.history(),
+                        "closed": closed
+                    })
                 except Exception as e:
-                    print(f"Error en la suscripción: {str(e)}")
-                    await asyncio.sleep(1)
-        except Exception as e:
-            logger.error(f"Error en la suscripción: {str(e)}")
+                    logger.error(f"Error en la suscripción: {str(e)}")
         finally:
             # Limpiar suscripciones al salir
-            try:
-                self.stop_candles_stream(asset)
-            except:
-                pass
+            builder.remove_listener(on_candle)
+            builder.remove_listener(on_forming)
+            if created and not builder.listeners and not builder.forming_listeners:
+                self.stop_candle_builder(asset)
+            self.stop_candles_stream(asset, timeframe)
 
     async def get_profile(self):
         return await self.api.get_profile()
 
+    def get_open_positions(self):
+        """Get the orders opened in this session that have not closed yet.
+
+        :returns: list of the ``orders/open`` confirmations, oldest first.
+        """
+        return list(self.api.open_orders.values())
+
     async def get_history(self):
         """Get the trader's history based on account type.
 
@@ -589,28 +640,41 @@ class Quotex:
 
     async def buy(self, amount: float, asset: str, direction: str, duration: int, time_mode: str = "TIMER"):
         """Buy Binary option"""
-        self.api.buy_id = None
-        request_id = expiration.get_timestamp()
+        request_id = self.api.next_request_id()
         is_fast_option = True if time_mode.upper() == "TIME" else False
-        self.start_candles_stream(asset, duration)
-        self.api.buy(amount, asset, direction, duration, request_id, is_fast_option)
-
-        count = 0.1
-        while self.api.buy_id is None:
-            count += 0.1
-            if count > duration:
-                status_buy = False
-                break
-            await asyncio.sleep(0.2)
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-        else:
-            status_buy = True
+        future = self.api.pending.create("orders/open", request_id)
+        # Followed until the option expires, then for the linger time.
+        self.hold_candles_stream(asset, duration, duration + self.subscriptions.linger)
+        self.api.buy(amount, asset, direction, duration, request_id, is_fast_option, follow=False)
+
+        result = await self.api.pending.wait(future, duration)
+        if result is None:
+            return False, None
+        if result.get("error"):
+            return False, result["error"]
+
+        return True, result
+
+    def buy_many(self, orders, timeout=None):
+        """Buy several binary options without waiting on each confirmation.
+
+        :param orders: Iterable of dicts with the :meth:`buy` arguments.
+        :param timeout: (optional) Seconds to wait for each confirmation.
+        :returns: The instance of :class:`OrderPipeline
+            <quotexapi.orders.OrderPipeline>`; iterate it with ``async for``
+            to send the orders and get each result as it completes.
+        """
+        return OrderPipeline(self, orders, timeout)
+
+    def arm_order(self, amount: float, asset: str, duration: int, direction: str = None, time_mode: str = "TIMER"):
+        """Prepare an order so firing it sends a single frame.
 
-        return status_buy, self.api.buy_successful
+        :returns: The instance of :class:`ArmedOrder
+            <quotexapi.orders.ArmedOrder>`, already armed.
+        """
+        return ArmedOrder(self, amount, asset, duration, direction, time_mode).arm()
 
     async def open_pending(self, amount: float, asset: str, direction: str, duration: int, open_time: str = None):
-        self.api.pending_id = None
         user_settings = await self.get_profile()
         offset_zone = user_settings.offset
         open_time = expiration.get_next_timeframe(
@@ -619,69 +683,85 @@ class Quotex:
             duration,
             open_time
         )
+        future = self.api.pending.create("pending/create")
         self.api.open_pending(amount, asset, direction, duration, open_time)
-        count = 0.1
-        while self.api.pending_id is None:
-            count += 0.1
-            if count > duration:
-                status_buy = False
-                break
-            await asyncio.sleep(0.2)
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-        else:
-            status_buy = True
-            self.api.instruments_follow(amount, asset, direction, duration, open_time)
+        result = await self.api.pending.wait(future, duration)
+        if result is None:
+            return False, None
+        if result.get("error"):
+            return False, result["error"]
 
-        return status_buy, self.api.pending_successful
+        self.api.instruments_follow(amount, asset, direction, duration, open_time)
+        return True, result
 
-    async def sell_option(self, options_ids):
+    async def sell_option(self, options_ids, timeout=RESPONSE_TIMEOUT):
         """Sell asset Quotex"""
+        tickets = options_ids if isinstance(options_ids, list) else [options_ids]
+        futures = [self.api.pending.create("orders/cancel", ticket) for ticket in tickets]
         self.api.sell_option(options_ids)
-        self.api.sold_options_respond = None
-        while self.api.sold_options_respond is None:
-            await asyncio.sleep(0.2)
-        return self.api.sold_options_respond
+        responses = await asyncio.gather(*[self.api.pending.wait(future, timeout) for future in futures])
+        return responses[-1] if responses else None
 
     def get_payment(self):
         """Payment Quotex server"""
-        assets_data = {}
-        for i in self.api.instruments:
-            assets_data[i[2].replace("\n", "")] = {
-                "turbo_payment": i[18],
-                "payment": i[5],
-                "profit": {
-                    "1M": i[-9],
-                    "5M": i[-8]
-                },
-                "open": i[14]
-            }
-
-        return assets_data
+        return {i.name: i.payment_data() for i in self.api.instrument_table}
 
     # Function suggested by https://t.me/Suppor_Mk in the message on telegram https://t.me/c/2215782682/1/2990
     def get_payout_by_asset(self, asset_name: str, timeframe: str = "1"):
         """Payout Quotex server"""
-        assets_data = {}
-        for i in self.api.instruments:
-            if asset_name == i[1]:
-                assets_data[i[1].replace("\n", "")] = {
-                    "turbo_payment": i[18],
-                    "payment": i[5],
-                    "profit": {
-                        "24H": i[-10],
-                        "1M": i[-9],
-                        "5M": i[-8]
-                    },
-                    "open": i[14]
-                }
-                break
-
-        data = assets_data.get(asset_name)
+        instrument = self.api.instrument_table.get(asset_name)
+        if instrument is None:
+            return None
         if timeframe == "all":
-            return data.get("profit")
+            return instrument.profit
+
+        return instrument.profit.get(f"{timeframe}M")
+
+    def add_instrument_listener(self, callback, assets=None, fields=None):
+        """Call ``callback(change)`` for every payout or open-status change.
+
+        Each ``instruments/list`` snapshot is diffed against the previous
+        one; only the changes are published, as ``InstrumentChange(asset,
+        field, old, new)`` tuples. ``field`` is one of ``open``,
+        ``payment``, ``turbo_payment``, ``profit_24h``, ``profit_1m``,
+        ``profit_5m`` or ``listed`` (asset added or removed). The callback
+        runs on the thread receiving the websocket messages.
+
+        :param assets: (optional) Only changes of these assets.
+        :param fields: (optional) Only changes of these fields.
+        :returns: The listener to pass to :meth:`remove_instrument_listener`.
+        """
+        assets = set(assets) if assets else None
+        fields = set(fields) if fields else None
 
-        return data.get("profit").get(f"{timeframe}M")
+        def listener(change):
+            if (assets is None or change.asset in assets) and (fields is None or change.field in fields):
+                callback(change)
+
+        self.api.instrument_table.add_listener(listener)
+        return listener
+
+    def remove_instrument_listener(self, listener):
+        self.api.instrument_table.remove_listener(listener)
+
+    async def instrument_changes(self, assets=None, fields=None):
+        """Iterate over the instrument changes as they arrive.
+
+        ``async for change in client.instrument_changes(fields=["payment"])``;
+        the filters are those of :meth:`add_instrument_listener`.
+        """
+        loop = asyncio.get_running_loop()
+        changes = asyncio.Queue()
+        listener = self.add_instrument_listener(
+            lambda change: loop.call_soon_threadsafe(changes.put_nowait, change),
+            assets,
+            fields
+        )
+        try:
+            while True:
+                yield await changes.get()
+        finally:
+            self.remove_instrument_listener(listener)
 
     async def start_remaing_time(self):
         now_stamp = datetime.fromtimestamp(expiration.get_timestamp())
@@ -707,9 +787,37 @@ class Quotex:
         return data_dict["win"]
 
     def start_candles_stream(self, asset, period=0):
+        """Take a reference on the ``(asset, period)`` stream.
+
+        The asset is followed on its first reference only; release it with
+        :meth:`stop_candles_stream` once done.
+
+        :returns: True if the subscription frames were sent.
+        """
+        self.api.current_asset = asset
+        return self.subscriptions.acquire(asset, period)
+
+    def hold_candles_stream(self, asset, period=0, seconds=None, snapshot=False):
+        """Keep the ``(asset, period)`` stream open for a short-lived request.
+
+        :param float seconds: (optional) Seconds to keep it; defaults to
+            the subscription linger.
+        :param bool snapshot: Ask for a ``history/list/v2`` snapshot even
+            if the stream was already open.
+        :returns: True if the subscription frames were sent.
+        """
         self.api.current_asset = asset
-        self.api.subscribe_realtime_candle(asset, period)
-        self.api.follow_candle(asset)
+        subscribed = self.subscriptions.hold(asset, period, seconds)
+        if snapshot and not subscribed:
+            self.subscriptions.refresh(asset, period)
+        return subscribed
+
+    def get_subscriptions(self):
+        """Get the active streams.
+
+        :returns: dict of ``(asset, period)`` to its number of consumers.
+        """
+        return self.subscriptions.active()
 
     async def store_settings_apply(
             self,
@@ -765,22 +873,97 @@ class Quotex:
 
         return investments_settings
 
-    def stop_candles_stream(self, asset):
-        self.api.unsubscribe_realtime_candle(asset)
-        self.api.unfollow_candle(asset)
+    def stop_candles_stream(self, asset, period=None):
+        """Drop a reference taken with :meth:`start_candles_stream`.
+
+        The asset is unfollowed only when no consumer needs it anymore.
+
+        :param period: (optional) Without it, the asset's oldest stream
+            started with :meth:`start_candles_stream` loses the reference;
+            the streams kept by :meth:`hold_candles_stream` are left alone.
+        :returns: True if the asset was unfollowed.
+        """
+        return self.subscriptions.release(asset, period)
+
+    def start_candle_builder(self, asset: str, periods: list = None, history: int = CANDLE_HISTORY):
+        """Build candles of ``asset`` from its live ticks.
+
+        :param str asset: The asset symbol.
+        :param list periods: (optional) Candle periods in seconds; defaults
+            to every size in ``self.size``. Periods missing from a running
+            builder are added to it.
+        :param int history: Finalized candles kept per period.
+        :returns: The instance of :class:`CandleBuilder
+            <quotexapi.utils.candle_builder.CandleBuilder>`.
+        """
+        builder = self.api.candle_builders.get(asset)
+        if builder is None:
+            builder = CandleBuilder(asset, periods or self.size, history)
+            self.api.candle_builders[asset] = builder
+            if asset not in self._builder_streams:
+                self._builder_streams[asset] = min(builder.periods)
+                self.start_candles_stream(asset, self._builder_streams[asset])
+        elif periods:
+            for period in periods:
+                builder.add_period(period)
+        return builder
+
+    def stop_candle_builder(self, asset: str):
+        self.api.candle_builders.pop(asset, None)
+        if asset in self._builder_streams:
+            self.stop_candles_stream(asset, self._builder_streams.pop(asset))
 
     def start_signals_data(self):
         self.api.signals_subscribe()
 
     async def get_realtime_candles(self, asset: str, period: int = 0):
+        """Get the realtime candles of ``asset``.
+
+        Candles are cached per (asset, period); each call only folds in the
+        ticks received since the previous one.
+
+        :returns: dict of candles keyed by time, in time order.
+        """
+        period = period or self.period_default
         while True:
-            if self.api.candle_v2_data.get(asset):
-                candles = self.prepare_candles(asset, period)
-                for candle in candles:
-                    self.api.real_time_candles[candle["time"]] = candle
-                return self.api.real_time_candles
+            payload = self.api.candle_v2_data.get(asset)
+            if payload:
+                cache = self.api.candle_caches.get((asset, period))
+                if cache is None:
+                    cache = CandleCache(asset, period)
+                    self.api.candle_caches[(asset, period)] = cache
+                candles = cache.update(payload, self.api.realtime_price.get(asset))
+                self.api.real_time_candles.setdefault(asset, {})[period] = candles
+                return candles
             await asyncio.sleep(0.2)
 
+    def get_candle_matrix(self, assets: list, period: int = 0, length: int = None):
+        """Get the cached candles of several assets as assets x time matrices.
+
+        Reads the per-(asset, period) realtime candle caches, folding in any
+        ticks received since the last read, or the asset's candle builder;
+        assets with neither get a row of NaN. Feed the result to
+        :class:`BatchIndicators <quotexapi.utils.batch_indicators.BatchIndicators>`.
+
+        :param list assets: The asset symbols, one row each.
+        :param int period: (optional) The candle period in seconds.
+        :param int length: (optional) Most recent candles kept per asset.
+        :returns: dict with ``assets``, ``time``, ``open``, ``high``,
+            ``low`` and ``close`` matrices.
+        """
+        period = period or self.period_default
+        candle_sets = {}
+        for asset in assets:
+            candles = []
+            cache = self.api.candle_caches.get((asset, period))
+            builder = self.api.candle_builders.get(asset)
+            if cache is not None:
+                candles = cache.update(self.api.candle_v2_data.get(asset), self.api.realtime_price.get(asset))
+            elif builder is not None and period in builder.periods:
+                candles = builder.candles(period)
+            candle_sets[asset] = candles
+        return candle_matrix(candle_sets, length)
+
     async def start_realtime_price(self, asset: str, period: int = 0):
         self.start_candles_stream(asset, period)
         while True:
@@ -789,6 +972,12 @@ class Quotex:
             await asyncio.sleep(0.2)
 
     async def get_realtime_price(self, asset: str):
+        """Get the latest ticks of ``asset``.
+
+        :returns: The :class:`TickBuffer <quotexapi.utils.ticks.TickBuffer>`
+            of the asset, a sequence of ``{"time", "price"}`` dicts whose
+            ``view()`` gives the same ticks as NumPy arrays.
+        """
         return self.api.realtime_price.get(asset, {})
 
     async def start_realtime_sentiment(self, asset: str, period: int = 0):
@@ -807,6 +996,12 @@ class Quotex:
     def get_profit(self):
         return self.api.profit_in_operation or 0
 
+    def get_send_stats(self):
+        """Get the outbound websocket queue counters (depth and send waits)."""
+        if self.api.writer is None:
+            return {}
+        return self.api.writer.stats()
+
     async def get_result(self, operation_id: str):
         """Check if the trade is a win based on its ID.
 
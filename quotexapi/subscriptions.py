@@ -0,0 +1,184 @@
+# quotexapi/subscriptions.py
+
+"""Module for sharing Quotex asset subscriptions between their consumers."""
+import time
+import asyncio
+
+# Seconds a short-lived consumer keeps the stream after it is done, so the
+# next request for the same asset finds it still open.
+SUBSCRIPTION_LINGER = 30
+
+
+class Subscriptions(object):
+    """Class for the reference-counted candle and depth subscriptions of a client.
+
+    Every consumer of an asset stream (an indicator, an armed order, a
+    realtime endpoint...) takes a reference on ``(asset, period)``. Frames go
+    out only on transitions:
+
+    - ``instruments/update`` when a ``(asset, period)`` gets its first reference;
+    - ``depth/follow`` when the asset gets its first reference of any period;
+    - ``subfor`` and ``depth/unfollow`` when the asset loses its last one.
+
+    Requests that use a stream only briefly, such as ``buy`` or
+    ``get_candles``, :meth:`hold` it instead: one shared reference per
+    ``(asset, period)`` released ``linger`` seconds after the last of them.
+
+    The references outlive the websocket: :meth:`replay` subscribes the
+    active set again on a new connection.
+    """
+
+    def __init__(self, client, linger=SUBSCRIPTION_LINGER):
+        """
+        :param client: The instance of :class:`Quotex
+            <quotexapi.stable_api.Quotex>`.
+        :param float linger: Seconds a held stream stays open.
+        """
+        self.client = client
+        self.linger = linger
+        self.streams = {}
+        self.assets = {}
+        self.frames = 0
+        self._holds = {}
+
+    @property
+    def api(self):
+        return self.client.api
+
+    def acquire(self, asset, period=0):
+        """Take a reference on the ``(asset, period)`` stream.
+
+        :returns: True if the stream was not active and its frames were sent.
+        """
+        key = (asset, int(period))
+        count = self.streams.get(key, 0)
+        self.streams[key] = count + 1
+        if count:
+            return False
+        self.subscribe(*key)
+        if self.assets.get(asset, 0) == 0:
+            self.follow(asset)
+        self.assets[asset] = self.assets.get(asset, 0) + 1
+        return True
+
+    def acquired(self, asset, period):
+        """Get the references of a stream taken with :meth:`acquire`, not
+        counting the one its holds share."""
+        key = (asset, int(period))
+        return self.streams.get(key, 0) - (key in self._holds)
+
+    def release(self, asset, period=None):
+        """Drop a reference taken with :meth:`acquire`.
+
+        The reference of a :meth:`hold` is never dropped here; it goes
+        when the hold expires.
+
+        :param period: (optional) Without it, the oldest stream of the
+            asset with an acquired reference loses it.
+        :returns: True if the asset lost its last reference and was
+            unfollowed.
+        """
+        if period is None:
+            period = next(
+                (key[1] for key in self.streams if key[0] == asset and self.acquired(*key)),
+                None
+            )
+            if period is None:
+                return False
+        if not self.acquired(asset, period):
+            return False
+        return self._release((asset, int(period)))
+
+    def _release(self, key):
+        asset = key[0]
+        count = self.streams.get(key, 0)
+        if not count:
+            return False
+        if count > 1:
+            self.streams[key] = count - 1
+            return False
+        del self.streams[key]
+        self.assets[asset] -= 1
+        if self.assets[asset]:
+            return False
+        del self.assets[asset]
+        self.unfollow(asset)
+        return True
+
+    def hold(self, asset, period=0, seconds=None):
+        """Keep the ``(asset, period)`` stream open for ``seconds``.
+
+        Must be called from the event loop, which runs the release. Holds
+        on the same stream share one reference; each of them pushes back
+        its release, which never comes earlier than already scheduled.
+
+        :param float seconds: (optional) Defaults to ``linger``.
+        :returns: True if the stream was not active and its frames were sent.
+        """
+        key = (asset, int(period))
+        deadline = time.monotonic() + (self.linger if seconds is None else seconds)
+        held = self._holds.get(key)
+        if held is not None:
+            handle, until = held
+            if deadline <= until:
+                return False
+            handle.cancel()
+            subscribed = False
+        else:
+            subscribed = self.acquire(*key)
+        handle = asyncio.get_running_loop().call_later(deadline - time.monotonic(), self._expire, key)
+        self._holds[key] = (handle, deadline)
+        return subscribed
+
+    def _expire(self, key):
+        self._holds.pop(key, None)
+        self._release(key)
+
+    def refresh(self, asset, period=0):
+        """Ask for a new ``history/list/v2`` snapshot of an active stream."""
+        self.subscribe(asset, int(period))
+
+    def active(self):
+        """Get the active subscriptions.
+
+        :returns: dict of ``(asset, period)`` to its reference count.
+        """
+        return dict(self.streams)
+
+    def is_active(self, asset, period=None):
+        if period is None:
+            return asset in self.assets
+        return (asset, int(period)) in self.streams
+
+    def replay(self):
+        """Send the frames of every active subscription on a new connection."""
+        for asset, period in self.streams:
+            self.subscribe(asset, period)
+        for asset in self.assets:
+            self.follow(asset)
+
+    def clear(self):
+        """Unfollow every asset and forget all the references."""
+        for handle, _ in self._holds.values():
+            handle.cancel()
+        self._holds.clear()
+        for asset in list(self.assets):
+            self.unfollow(asset)
+        self.streams.clear()
+        self.assets.clear()
+
+    def subscribe(self, asset, period):
+        if self.api is not None:
+            self.api.subscribe_realtime_candle(asset, period)
+            self.frames += 1
+
+    def follow(self, asset):
+        if self.api is not None:
+            self.api.follow_candle(asset)
+            self.frames += 1
+
+    def unfollow(self, asset):
+        if self.api is not None:
+            self.api.unsubscribe_realtime_candle(asset)
+            self.api.unfollow_candle(asset)
+            self.frames += 2
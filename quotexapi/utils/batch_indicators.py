@@ -0,0 +1,177 @@
+# quotexapi/utils/batch_indicators.py
+
+import numpy as np
+from typing import Dict, List, Optional
+from quotexapi.utils.indicators import recursive_filter
+
+CANDLE_FIELDS = ("open", "high", "low", "close")
+
+
+def as_matrix(values) -> np.ndarray:
+    """Convierte a una matriz float64 activos x tiempo (una fila si es 1-D)"""
+    matrix = np.asarray(values, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    return matrix
+
+
+def first_valid(matrix: np.ndarray) -> np.ndarray:
+    """Columna del primer valor de cada fila (el ancho si la fila está vacía)"""
+    valid = ~np.isnan(matrix)
+    return np.where(valid.any(axis=1), valid.argmax(axis=1), matrix.shape[1])
+
+
+def window_moments(matrix: np.ndarray, period: int):
+    """Media y media de cuadrados de cada ventana; NaN si la ventana toca un NaN.
+
+    Cada fila se centra en su primer valor antes de las sumas acumuladas,
+    lo que reduce su error y el de restar ``media ** 2``.
+    """
+    rows, columns = matrix.shape
+    start = np.minimum(first_valid(matrix), columns - 1)
+    offset = np.nan_to_num(matrix[np.arange(rows), start])
+    valid = ~np.isnan(matrix)
+    centered = np.where(valid, matrix - offset[:, None], 0.0)
+    moments = []
+    for values in (centered, centered * centered, valid):
+        sums = np.zeros((rows, columns + 1))
+        np.cumsum(values, axis=1, out=sums[:, 1:])
+        moments.append(sums[:, period:] - sums[:, :-period])
+    total, squares, counts = moments
+    complete = counts == period
+    mean = np.where(complete, total / period, np.nan)
+    return mean, np.where(complete, squares / period, np.nan), offset[:, None]
+
+
+def sma_rows(matrix: np.ndarray, period: int) -> np.ndarray:
+    """SMA de cada fila; NaN en las ventanas que tocan un NaN"""
+    result = np.full(matrix.shape, np.nan)
+    if period <= matrix.shape[1]:
+        mean, _, offset = window_moments(matrix, period)
+        result[:, period - 1:] = mean + offset
+    return result
+
+
+def bollinger_rows(matrix: np.ndarray, period: int):
+    """(SMA, desviación estándar poblacional) de cada ventana de cada fila"""
+    middle, std = np.full(matrix.shape, np.nan), np.full(matrix.shape, np.nan)
+    if period <= matrix.shape[1]:
+        mean, squares, offset = window_moments(matrix, period)
+        middle[:, period - 1:] = mean + offset
+        std[:, period - 1:] = np.sqrt(np.maximum(squares - mean * mean, 0.0))
+    return middle, std
+
+
+def smooth_rows(values: np.ndarray, start: np.ndarray, period: int, multiplier: float) -> np.ndarray:
+    """y = y_anterior * (1 - multiplier) + x * multiplier en cada fila.
+
+    La fila ``i`` se siembra en ``start[i] + period - 1`` con la media de
+    sus primeros ``period`` valores, como ``ema_array`` y ``wilder_array``;
+    antes de la semilla queda NaN.
+    """
+    rows, columns = values.shape
+    result = np.full(values.shape, np.nan)
+    seed_column = start + period - 1
+    seeded = np.flatnonzero(seed_column < columns)
+    if not len(seeded):
+        return result
+    window = values[seeded[:, None], start[seeded, None] + np.arange(period)]
+    column = np.arange(columns)
+    # La semilla entra como impulso en su columna; lo anterior vale cero.
+    drive = np.where(column > seed_column[:, None], np.nan_to_num(values) * multiplier, 0.0)
+    drive[seeded, seed_column[seeded]] = window.sum(axis=1) / period
+    filtered = recursive_filter(drive[seeded], 1 - multiplier)
+    result[seeded] = np.where(column >= seed_column[seeded, None], filtered, np.nan)
+    return result
+
+
+class BatchIndicators:
+    """Indicadores de muchos activos a la vez.
+
+    Reciben matrices activos x tiempo con las filas alineadas a la derecha
+    (la última columna es la vela más reciente) y rellenas con NaN al
+    principio cuando los activos tienen distinta cantidad de velas, como
+    las que arma ``candle_matrix``. Devuelven matrices de la misma forma,
+    con NaN donde el indicador aún no tiene valor; la parte válida de cada
+    fila es igual a lo que ``TechnicalIndicators`` devuelve para ese activo
+    con ``decimals=None``.
+    """
+
+    @staticmethod
+    def sma(closes, period: int = 20) -> np.ndarray:
+        return sma_rows(as_matrix(closes), period)
+
+    @staticmethod
+    def ema(closes, period: int = 20) -> np.ndarray:
+        closes = as_matrix(closes)
+        return smooth_rows(closes, first_valid(closes), period, 2 / (period + 1))
+
+    @staticmethod
+    def rsi(closes, period: int = 14) -> np.ndarray:
+        closes = as_matrix(closes)
+        result = np.full(closes.shape, np.nan)
+        # deltas[:, j] es el cambio de la columna j a la j + 1.
+        deltas = np.diff(closes, axis=1)
+        start = first_valid(closes)
+        avg_gain = smooth_rows(np.where(deltas > 0, deltas, 0.0), start, period, 1 / period)
+        avg_loss = smooth_rows(np.where(deltas < 0, -deltas, 0.0), start, period, 1 / period)
+        rs = avg_gain / np.where(avg_loss == 0, 0.00001, avg_loss)
+        result[:, 1:] = 100 - (100 / (1 + rs))
+        return result
+
+    @staticmethod
+    def bollinger_bands(closes, period: int = 20, num_std: float = 2) -> Dict[str, np.ndarray]:
+        middle, std = bollinger_rows(as_matrix(closes), period)
+        return {
+            "upper": middle + std * num_std,
+            "middle": middle,
+            "lower": middle - std * num_std
+        }
+
+    @staticmethod
+    def atr(highs, lows, closes, period: int = 14) -> np.ndarray:
+        highs, lows, closes = as_matrix(highs), as_matrix(lows), as_matrix(closes)
+        result = np.full(closes.shape, np.nan)
+        high, low, prev_close = highs[:, 1:], lows[:, 1:], closes[:, :-1]
+        true_ranges = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+        result[:, 1:] = smooth_rows(true_ranges, first_valid(closes), period, 1 / period)
+        return result
+
+    @staticmethod
+    def latest(matrix) -> np.ndarray:
+        """Último valor de cada fila"""
+        return as_matrix(matrix)[:, -1]
+
+
+def candle_matrix(candle_sets: Dict, length: Optional[int] = None,
+                  fields=CANDLE_FIELDS) -> Dict[str, object]:
+    """Arma las matrices activos x tiempo de ``BatchIndicators``.
+
+    :param candle_sets: dict activo -> velas en orden de tiempo, como lista
+        de dicts o dict tiempo -> vela.
+    :param length: (opcional) Velas por activo, las más recientes; por
+        defecto las del activo con más velas.
+    :param fields: Campos de las velas a extraer.
+    :returns: dict con ``assets`` (orden de las filas), ``time`` y una
+        matriz por campo, alineadas a la derecha y rellenas con NaN.
+    """
+    assets: List[str] = list(candle_sets)
+    series = []
+    for asset in assets:
+        candles = candle_sets[asset] or []
+        if isinstance(candles, dict):
+            candles = candles.values()
+        series.append(list(candles))
+    if length is None:
+        length = max((len(candles) for candles in series), default=0)
+
+    result = {"assets": assets}
+    for field in ("time",) + tuple(fields):
+        matrix = np.full((len(assets), length), np.nan)
+        for row, candles in enumerate(series):
+            candles = candles[-length:] if length else []
+            if candles:
+                matrix[row, length - len(candles):] = np.fromiter(
+                    (candle[field] for candle in candles), dtype=np.float64, count=len(candles))
+        result[field] = matrix
+    return result
@@ -0,0 +1,246 @@
+# quotexapi/utils/candle_archive.py
+
+import os
+import re
+import numpy as np
+from quotexapi.utils.processor import aggregate_ticks, merge_candle_columns, tick_columns
+
+# Column files of an archive, one value per candle.
+COLUMNS = (
+    ("time", np.int64),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("ticks", np.int32),
+)
+
+# Every INDEX_STRIDE-th candle time goes to the sparse index.
+INDEX_STRIDE = 4096
+INDEX_FILE = "time.idx"
+
+
+def column_file(name, dtype):
+    return f"{name}.{np.dtype(dtype).str.lstrip('<>=|')}"
+
+
+def archived_count(path):
+    """Get the number of candles every column file of ``path`` holds.
+
+    Reads only the file sizes: a write interrupted half way leaves some
+    columns longer, and their tail is ignored.
+    """
+    sizes = []
+    for name, dtype in COLUMNS:
+        filename = os.path.join(path, column_file(name, dtype))
+        sizes.append(os.path.getsize(filename) // np.dtype(dtype).itemsize if os.path.exists(filename) else 0)
+    return min(sizes)
+
+
+def read_times(path, rows):
+    """Read the archived times at ``rows`` without mapping the time column."""
+    itemsize = np.dtype(np.int64).itemsize
+    chunks = []
+    with open(os.path.join(path, column_file("time", np.int64)), "rb") as handle:
+        for row in rows:
+            handle.seek(int(row) * itemsize)
+            chunks.append(handle.read(itemsize))
+    return np.frombuffer(b"".join(chunks), dtype=np.int64)
+
+
+def truncate(filename, size):
+    """Cut ``filename`` to ``size`` bytes if it is longer.
+
+    Files already of the right size are left alone: on Windows resizing a
+    file fails while a reader still has it mapped.
+    """
+    if os.path.exists(filename) and os.path.getsize(filename) > size:
+        with open(filename, "r+b") as handle:
+            handle.truncate(size)
+
+
+def candle_columns(candles):
+    """Get ``get_candles`` output (candle dicts or ``[time, open, close,
+    high, low, ticks]`` lists) as a dict of column arrays."""
+    candles = list(candles)
+    if candles and not isinstance(candles[0], dict):
+        candles = [dict(zip(("time", "open", "close", "high", "low", "ticks"), candle)) for candle in candles]
+    count = len(candles)
+    return {
+        name: np.fromiter((candle.get(name) or 0 for candle in candles), dtype=dtype, count=count)
+        for name, dtype in COLUMNS
+    }
+
+
+def history_line_columns(payload, period):
+    """Aggregate the ticks of a ``get_history_line`` response into candle
+    columns of ``period``; the last candle, which may be incomplete, is
+    dropped."""
+    history = payload
+    if isinstance(payload, dict):
+        history = payload.get("data") or payload.get("history") or []
+    times, prices = tick_columns(history)
+    if len(times):
+        order = np.argsort(times, kind="stable")
+        times, prices = times[order], prices[order]
+    candle_time, open_price, close_price, high_price, low_price, ticks = aggregate_ticks(times, prices, period)
+    columns = {
+        "time": np.asarray(candle_time, dtype=np.int64),
+        "open": np.asarray(open_price, dtype=np.float64),
+        "high": np.asarray(high_price, dtype=np.float64),
+        "low": np.asarray(low_price, dtype=np.float64),
+        "close": np.asarray(close_price, dtype=np.float64),
+        "ticks": np.asarray(ticks, dtype=np.int32),
+    }
+    return {name: values[:-1] for name, values in columns.items()}
+
+
+class ArchivedCandles(object):
+    """Class for the memory-mapped columns of one (asset, period) archive.
+
+    Columns are read-only ``numpy.memmap`` views, so slicing them does not
+    copy or load the file; only the pages actually read are paged in.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = archived_count(path)
+        self.columns = {
+            name: self._map(column_file(name, dtype), dtype, self.count)
+            for name, dtype in COLUMNS
+        }
+        index_count = (self.count + INDEX_STRIDE - 1) // INDEX_STRIDE
+        index_path = os.path.join(path, INDEX_FILE)
+        if os.path.exists(index_path) and os.path.getsize(index_path) // 8 >= index_count:
+            self.index = self._map(INDEX_FILE, np.int64, index_count)
+        else:
+            self.index = np.ascontiguousarray(self.columns["time"][::INDEX_STRIDE])
+
+    def _map(self, filename, dtype, count):
+        if not count:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(os.path.join(self.path, filename), dtype=dtype, mode="r", shape=(count,))
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def locate(self, timestamp, side="left"):
+        """Row of ``timestamp`` as ``numpy.searchsorted`` on the time column.
+
+        The sparse index narrows the search to one block of
+        ``INDEX_STRIDE`` rows, so only that block of the time column is read.
+        """
+        block = int(np.searchsorted(self.index, timestamp, side=side)) - 1
+        if block < 0:
+            return 0
+        start = block * INDEX_STRIDE
+        times = self.columns["time"][start:start + INDEX_STRIDE]
+        return start + int(np.searchsorted(times, timestamp, side=side))
+
+    def range(self, start=None, end=None):
+        """Get the columns of the candles with ``start <= time < end``.
+
+        :returns: dict of column name to zero-copy memmap slices.
+        """
+        first = self.locate(start) if start is not None else 0
+        last = self.locate(end) if end is not None else self.count
+        return {name: values[first:last] for name, values in self.columns.items()}
+
+    def to_candles(self, start=None, end=None):
+        """Get the candles of :meth:`range` as candle dicts."""
+        columns = self.range(start, end)
+        names = [name for name, _ in COLUMNS]
+        return [
+            dict(zip(names, row))
+            for row in zip(*(columns[name].tolist() for name in names))
+        ]
+
+
+class CandleArchive(object):
+    """Class for the append-only columnar candle archive.
+
+    Each (asset, period) is a directory with one binary file per column
+    (``time.i8``, ``open.f8``, ``high.f8``, ``low.f8``, ``close.f8``,
+    ``ticks.i4``, native byte order) plus a sparse index holding the time
+    of every ``INDEX_STRIDE``-th candle. Appends only take candles newer
+    than the last one archived.
+    """
+
+    def __init__(self, root):
+        """
+        :param str root: The archive directory.
+        """
+        self.root = root
+
+    def path(self, asset, period):
+        asset = re.sub(r"[^\w.-]", "_", asset)
+        return os.path.join(self.root, asset, str(int(period)))
+
+    def open(self, asset, period):
+        """Open the archive of (asset, period) for reading.
+
+        :returns: The instance of :class:`ArchivedCandles`.
+        """
+        return ArchivedCandles(self.path(asset, period))
+
+    def append(self, asset, period, columns):
+        """Append candle columns, in time order, newer than the archive.
+
+        :param dict columns: Arrays keyed by column name, e.g. from
+            :func:`candle_columns`.
+        :returns: The number of candles appended.
+        """
+        path = self.path(asset, period)
+        os.makedirs(path, exist_ok=True)
+        # Sizes and plain reads only: the files are resized below, which
+        # fails on Windows while they are memory-mapped.
+        count = archived_count(path)
+        # Of candles sharing a time, the last one given wins.
+        columns = merge_candle_columns({name: np.asarray(columns[name]) for name, _ in COLUMNS})
+        times = columns["time"].astype(np.int64)
+        keep = times > read_times(path, [count - 1])[0] if count else np.ones(len(times), dtype=bool)
+        if not keep.any():
+            return 0
+        # Rewind columns a previous interrupted write left longer than the rest.
+        for name, dtype in COLUMNS:
+            truncate(os.path.join(path, column_file(name, dtype)), count * np.dtype(dtype).itemsize)
+
+        # The time column is written last: it decides how many rows exist.
+        for name, dtype in COLUMNS[1:] + COLUMNS[:1]:
+            values = columns[name][keep].astype(dtype)
+            with open(os.path.join(path, column_file(name, dtype)), "ab") as handle:
+                handle.write(values.tobytes())
+
+        appended = times[keep]
+        self._extend_index(path, count, appended)
+        return len(appended)
+
+    @staticmethod
+    def _extend_index(path, count, appended):
+        index_path = os.path.join(path, INDEX_FILE)
+        indexed = os.path.getsize(index_path) // 8 if os.path.exists(index_path) else 0
+        indexed = min(indexed, (count + INDEX_STRIDE - 1) // INDEX_STRIDE)
+        rows = np.arange(indexed * INDEX_STRIDE, count + len(appended), INDEX_STRIDE)
+        entries = np.concatenate((
+            read_times(path, rows[rows < count]),
+            appended[rows[rows >= count] - count]
+        ))
+        truncate(index_path, indexed * 8)
+        with open(index_path, "ab") as handle:
+            handle.write(entries.tobytes())
+
+    def export_candles(self, asset, period, candles):
+        """Append the output of ``Quotex.get_candles``."""
+        return self.append(asset, period, candle_columns(candles))
+
+    def export_history_line(self, asset, period, payload):
+        """Append the ticks of a ``Quotex.get_history_line`` response as
+        candles of ``period``."""
+        return self.append(asset, period, history_line_columns(payload, period))
+
+    def import_candles(self, asset, period, start=None, end=None):
+        """Read back candle dicts with ``start <= time < end``."""
+        return self.open(asset, period).to_candles(start, end)
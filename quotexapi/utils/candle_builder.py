@@ -0,0 +1,134 @@
+# quotexapi/utils/candle_builder.py
+
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+CANDLE_HISTORY = 500
+
+# Positions in the open bar list.
+TIME, OPEN, HIGH, LOW, CLOSE, TICKS = range(6)
+
+
+def to_candle(bar):
+    return {
+        "time": bar[TIME],
+        "open": bar[OPEN],
+        "close": bar[CLOSE],
+        "high": bar[HIGH],
+        "low": bar[LOW],
+        "ticks": bar[TICKS]
+    }
+
+
+class CandleBuilder(object):
+    """Class for building OHLC candles of one asset from its live ticks.
+
+    Every tick updates the open bar of each period in O(1); when a tick
+    falls past the end of a bar, that bar is finalized, appended to the
+    period's bounded history and handed to the listeners. Bars keep a tick
+    count instead of the ticks themselves.
+    """
+
+    def __init__(self, asset, periods=(60,), history=CANDLE_HISTORY):
+        """
+        :param str asset: The asset symbol.
+        :param periods: Candle periods in seconds, e.g. ``Quotex.size``.
+        :param int history: Finalized candles kept per period.
+        """
+        self.asset = asset
+        self.history = history
+        self.periods = ()
+        self.open_bars = {}
+        self.closed = {}
+        self.listeners = []
+        self.forming_listeners = []
+        self.last_time = None
+        self.late_ticks = 0
+        for period in periods:
+            self.add_period(period)
+
+    def add_period(self, period):
+        """Start building candles of ``period``; its first bar opens on the next tick."""
+        period = int(period)
+        if period not in self.open_bars:
+            self.open_bars[period] = None
+            self.closed[period] = deque(maxlen=self.history)
+            self.periods = tuple(sorted(self.open_bars))
+        return period
+
+    def add_listener(self, callback, forming=False):
+        """Call ``callback(asset, period, candle)`` for every finalized candle.
+
+        :param bool forming: Call it instead on every tick, with the candle
+            still being built.
+        """
+        listeners = self.forming_listeners if forming else self.listeners
+        if callback not in listeners:
+            listeners.append(callback)
+
+    def remove_listener(self, callback):
+        for listeners in (self.listeners, self.forming_listeners):
+            if callback in listeners:
+                listeners.remove(callback)
+
+    def update(self, timestamp, price):
+        """Fold one tick into every period.
+
+        :returns: list of ``(period, candle)`` finalized by this tick.
+        """
+        finalized = []
+        for period in self.periods:
+            start_time = int(timestamp // period) * period
+            bar = self.open_bars[period]
+            if bar is None or start_time > bar[TIME]:
+                if bar is not None:
+                    candle = to_candle(bar)
+                    self.closed[period].append(candle)
+                    finalized.append((period, candle))
+                self.open_bars[period] = [start_time, price, price, price, price, 1]
+                continue
+            if start_time < bar[TIME]:
+                # Late tick for a bar that is already closed.
+                self.late_ticks += 1
+                continue
+            if price > bar[HIGH]:
+                bar[HIGH] = price
+            elif price < bar[LOW]:
+                bar[LOW] = price
+            bar[CLOSE] = price
+            bar[TICKS] += 1
+        self.last_time = timestamp
+
+        for period, candle in finalized:
+            self.notify(self.listeners, period, candle)
+        if self.forming_listeners:
+            for period in self.periods:
+                bar = self.open_bars[period]
+                if bar is not None:
+                    self.notify(self.forming_listeners, period, to_candle(bar))
+        return finalized
+
+    def notify(self, listeners, period, candle):
+        for callback in listeners:
+            try:
+                callback(self.asset, period, candle)
+            except Exception:
+                logger.exception("Candle listener failed.")
+
+    def current(self, period):
+        """Get the open candle of ``period``, or ``None`` before the first tick."""
+        bar = self.open_bars[period]
+        return to_candle(bar) if bar is not None else None
+
+    def candles(self, period, include_open=True):
+        """Get the candles of ``period`` in time order.
+
+        :param int period: The candle period in seconds.
+        :param bool include_open: Append the candle still being built.
+        """
+        candles = list(self.closed[period])
+        if include_open and self.open_bars[period] is not None:
+            candles.append(to_candle(self.open_bars[period]))
+        return candles
@@ -0,0 +1,133 @@
+# quotexapi/utils/candle_cache.py
+
+import numpy as np
+from itertools import islice
+from quotexapi.utils.processor import aggregate_ticks, tick_columns
+from quotexapi.utils.candle_builder import CANDLE_HISTORY
+
+
+class CandleCache(object):
+    """Class for the realtime candles of one (asset, period).
+
+    The cache is seeded from the asset's ``history/list/v2`` payload and
+    afterwards only folds in ticks newer than the last one it processed,
+    so a realtime read costs O(new ticks) instead of rebuilding every
+    candle from the whole tick history.
+    """
+
+    def __init__(self, asset, period, history=CANDLE_HISTORY):
+        """
+        :param str asset: The asset symbol.
+        :param int period: The candle period in seconds.
+        :param int history: Minimum number of candles kept.
+        """
+        self.asset = asset
+        self.period = period
+        self.history = history
+        self.limit = history
+        self.candles = {}
+        self.last_time = float("-inf")
+        self.source = None
+
+    def seed(self, payload):
+        """Load a ``history/list/v2`` payload, once per payload received.
+
+        Server candles win over candles computed from the payload's ticks.
+        """
+        if payload is None or payload is self.source:
+            return False
+        self.source = payload
+        server_candles = payload.get("candles", [])[1:]
+        for candle in server_candles:
+            if isinstance(candle, dict):
+                self.candles[candle["time"]] = dict(candle)
+
+        times, prices = tick_columns(payload.get("history") or [])
+        if len(times):
+            order = np.argsort(times, kind="stable")
+            times, prices = times[order], prices[order]
+            for candle_time, open_price, close_price, high_price, low_price, num_ticks in zip(
+                    *aggregate_ticks(times, prices, self.period)):
+                if candle_time not in self.candles:
+                    self.candles[candle_time] = {
+                        "time": candle_time,
+                        "open": open_price,
+                        "close": close_price,
+                        "high": high_price,
+                        "low": low_price,
+                        "ticks": num_ticks
+                    }
+            self.last_time = max(self.last_time, float(times[-1]))
+
+        self.limit = max(self.history, len(server_candles))
+        self.sort()
+        self.prune()
+        return True
+
+    def fold(self, times, prices):
+        """Fold ticks newer than the last processed one into the candles.
+
+        :param times: float64 array of tick times, in time order.
+        :param prices: float64 array of tick prices.
+        :returns: The number of ticks folded.
+        """
+        if len(times) and times[0] <= self.last_time:
+            start = int(np.searchsorted(times, self.last_time, side="right"))
+            times, prices = times[start:], prices[start:]
+        if not len(times):
+            return 0
+
+        last_key = next(reversed(self.candles), None)
+        reorder = False
+        for candle_time, open_price, close_price, high_price, low_price, num_ticks in zip(
+                *aggregate_ticks(times, prices, self.period)):
+            candle = self.candles.get(candle_time)
+            if candle is None:
+                if last_key is not None and candle_time < last_key:
+                    reorder = True
+                self.candles[candle_time] = {
+                    "time": candle_time,
+                    "open": open_price,
+                    "close": close_price,
+                    "high": high_price,
+                    "low": low_price,
+                    "ticks": num_ticks
+                }
+                continue
+            candle["close"] = close_price
+            if high_price > candle["high"]:
+                candle["high"] = high_price
+            if low_price < candle["low"]:
+                candle["low"] = low_price
+            candle["ticks"] = candle.get("ticks", 0) + num_ticks
+
+        if reorder:
+            self.sort()
+        self.last_time = float(times[-1])
+        self.prune()
+        return len(times)
+
+    def sort(self):
+        # In place, so references handed out keep seeing updates.
+        candles = sorted(self.candles.items())
+        self.candles.clear()
+        self.candles.update(candles)
+
+    def prune(self):
+        excess = len(self.candles) - self.limit
+        if excess > 0:
+            for candle_time in list(islice(self.candles, excess)):
+                del self.candles[candle_time]
+
+    def update(self, payload=None, ticks=None):
+        """Seed from ``payload`` if it is new and fold the buffered ticks.
+
+        :param payload: (optional) The asset's ``history/list/v2`` payload.
+        :param ticks: (optional) The asset's :class:`TickBuffer
+            <quotexapi.utils.ticks.TickBuffer>`.
+        :returns: dict of candles keyed by time, in time order.
+        """
+        self.seed(payload)
+        if ticks is not None:
+            self.fold(*ticks.since(self.last_time))
+        return self.candles
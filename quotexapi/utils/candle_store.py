@@ -0,0 +1,135 @@
+# quotexapi/utils/candle_store.py
+
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    asset TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    time INTEGER NOT NULL,
+    open REAL NOT NULL,
+    close REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    ticks INTEGER,
+    PRIMARY KEY (asset, period, time)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS coverage (
+    asset TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (asset, period, start)
+) WITHOUT ROWID;
+"""
+
+# Positions of the fields in the list form of a candle, as in history/list/v2.
+CANDLE_KEYS = ("time", "open", "close", "high", "low", "ticks")
+
+
+def normalize_candle(candle):
+    """Get a ``history/load`` candle, dict or list, as a candle dict."""
+    if isinstance(candle, dict):
+        return {
+            "time": int(candle["time"]),
+            "open": candle["open"],
+            "close": candle["close"],
+            "high": candle["high"],
+            "low": candle["low"],
+            "ticks": candle.get("ticks")
+        }
+    candle = dict(zip(CANDLE_KEYS, candle))
+    candle["time"] = int(candle["time"])
+    candle.setdefault("ticks", None)
+    return candle
+
+
+class CandleStore(object):
+    """Class for the on-disk archive of closed candles.
+
+    Candles are kept in SQLite keyed by ``(asset, period, time)``. A
+    second table records which time ranges were already fetched from the
+    server, including ranges without candles (closed market), so only the
+    gaps between them have to be requested again.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path: The SQLite database file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def save(self, asset, period, candles):
+        """Insert or replace candles; the last one written for a time wins.
+
+        :returns: The number of candles written.
+        """
+        rows = [
+            (asset, period, candle["time"], candle["open"], candle["close"],
+             candle["high"], candle["low"], candle.get("ticks"))
+            for candle in candles
+        ]
+        if rows:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def load(self, asset, period, start, end):
+        """Get the stored candles with ``start <= time < end``, in time order."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT time, open, close, high, low, ticks FROM candles "
+                "WHERE asset = ? AND period = ? AND time >= ? AND time < ? ORDER BY time",
+                (asset, period, start, end)
+            ).fetchall()
+        return [dict(zip(CANDLE_KEYS, row)) for row in rows]
+
+    def mark(self, asset, period, start, end):
+        """Record ``[start, end)`` as fetched, merging touching ranges."""
+        if end <= start:
+            return
+        with self._lock, self._connection:
+            ranges = self._connection.execute(
+                "SELECT start, end FROM coverage WHERE asset = ? AND period = ? AND start <= ? AND end >= ?",
+                (asset, period, end, start)
+            ).fetchall()
+            for range_start, range_end in ranges:
+                start, end = min(start, range_start), max(end, range_end)
+            self._connection.executemany(
+                "DELETE FROM coverage WHERE asset = ? AND period = ? AND start = ?",
+                [(asset, period, range_start) for range_start, _ in ranges]
+            )
+            self._connection.execute("INSERT INTO coverage VALUES (?, ?, ?, ?)", (asset, period, start, end))
+
+    def covered(self, asset, period, start, end):
+        """Get the fetched ranges overlapping ``[start, end)``, in order."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT start, end FROM coverage WHERE asset = ? AND period = ? AND start < ? AND end > ? "
+                "ORDER BY start",
+                (asset, period, end, start)
+            ).fetchall()
+
+    def gaps(self, asset, period, start, end):
+        """Get the parts of ``[start, end)`` not fetched yet, in order."""
+        gaps = []
+        cursor = start
+        for range_start, range_end in self.covered(asset, period, start, end):
+            if range_start > cursor:
+                gaps.append((cursor, range_start))
+            cursor = max(cursor, range_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,199 @@
+# quotexapi/utils/history_downloader.py
+
+import os
+import json
+import time
+import asyncio
+import logging
+from quotexapi.utils.processor import merge_candles
+
+logger = logging.getLogger(__name__)
+
+# history/load requests kept in flight at once.
+DOWNLOAD_CONCURRENCY = 4
+DOWNLOAD_RETRIES = 3
+
+
+def split_range(start, end, size):
+    """Split ``[start, end)`` into consecutive windows of ``size`` seconds."""
+    return [(window, min(window + size, end)) for window in range(start, end, size)]
+
+
+def subtract_ranges(start, end, ranges):
+    """Get the parts of ``[start, end)`` not covered by ``ranges``, in order."""
+    gaps = []
+    cursor = start
+    for range_start, range_end in sorted(ranges):
+        if range_start > cursor:
+            gaps.append((cursor, min(range_start, end)))
+        cursor = max(cursor, range_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return [(gap_start, gap_end) for gap_start, gap_end in gaps if gap_start < gap_end]
+
+
+class HistoryDownloader(object):
+    """Class for downloading a long candle history in parallel windows.
+
+    The range is split into windows that are requested concurrently, up to
+    ``concurrency`` at a time; each request is correlated with its window
+    through its own ``history/load`` index. A window the server answers
+    only partially is requested again for the missing older part.
+
+    Every finished window is appended to the JSONL ``checkpoint`` file, if
+    given, so an interrupted download resumes with only the ranges it had
+    not covered yet.
+    """
+
+    def __init__(self, fetch, asset, period, start, end, window=None,
+                 concurrency=DOWNLOAD_CONCURRENCY, retries=DOWNLOAD_RETRIES,
+                 checkpoint=None, on_progress=None):
+        """
+        :param fetch: Coroutine function ``fetch(end_from_time, offset)``
+            returning the candle dicts of ``[end_from_time - offset,
+            end_from_time)``, or ``None`` if no response arrived.
+        :param int window: Seconds per request; 500 candles by default.
+        :param str checkpoint: (optional) Path of the JSONL checkpoint.
+        :param on_progress: (optional) Called with :attr:`stats` after
+            each window.
+        """
+        self.fetch = fetch
+        self.asset = asset
+        self.period = int(period)
+        self.start = int(start) - int(start) % self.period
+        self.end = int(end)
+        self.window = int(window or self.period * 500)
+        self.concurrency = max(1, concurrency)
+        self.retries = retries
+        self.checkpoint = checkpoint
+        self.on_progress = on_progress
+        self.runs = []
+        self.failed = []
+        self.stats = {
+            "windows": 0,
+            "requests": 0,
+            "retries": 0,
+            "candles": 0,
+            "resumed": 0,
+            "elapsed": 0.0,
+            "candles_per_second": 0.0,
+        }
+        self._started = None
+        self._checkpoint_file = None
+
+    def load_checkpoint(self):
+        """Read the ranges a previous run covered into :attr:`runs`."""
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return
+        with open(self.checkpoint) as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut by an interrupted write.
+                    continue
+                if entry.get("asset") != self.asset or entry.get("period") != self.period:
+                    continue
+                self.runs.append((entry["start"], entry["end"], entry["candles"]))
+                self.stats["resumed"] += len(entry["candles"])
+
+    def save_checkpoint(self, start, end, candles):
+        if self._checkpoint_file is None:
+            return
+        entry = {"asset": self.asset, "period": self.period, "start": start, "end": end, "candles": candles}
+        self._checkpoint_file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._checkpoint_file.flush()
+
+    def pending_windows(self):
+        """Get the windows of the range not covered yet, oldest first."""
+        covered = [(start, end) for start, end, _ in self.runs]
+        return [
+            window
+            for gap_start, gap_end in subtract_ranges(self.start, self.end, covered)
+            for window in split_range(gap_start, gap_end, self.window)
+        ]
+
+    async def fetch_window(self, start, end):
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.stats["retries"] += 1
+            self.stats["requests"] += 1
+            candles = await self.fetch(end, end - start)
+            if candles is not None:
+                return merge_candles([candle for candle in candles if start <= candle["time"] < end])
+        return None
+
+    async def worker(self, queue):
+        while True:
+            start, end = await queue.get()
+            try:
+                try:
+                    candles = await self.fetch_window(start, end)
+                except Exception as e:
+                    logger.error(f"Error downloading {self.asset} [{start}, {end}): {e}")
+                    candles = None
+                if candles is None:
+                    logger.warning(f"No history for {self.asset} [{start}, {end}) after {self.retries + 1} tries")
+                    self.failed.append((start, end))
+                    continue
+                covered_start = start
+                if candles and candles[0]["time"] > start + self.period:
+                    # The response was cut short: request the older part again.
+                    covered_start = candles[0]["time"]
+                    queue.put_nowait((start, covered_start))
+                self.runs.append((covered_start, end, candles))
+                self.save_checkpoint(covered_start, end, candles)
+                self.report(len(candles))
+            finally:
+                queue.task_done()
+
+    def report(self, candles):
+        elapsed = time.perf_counter() - self._started
+        self.stats["windows"] += 1
+        self.stats["candles"] += candles
+        self.stats["elapsed"] = elapsed
+        self.stats["candles_per_second"] = self.stats["candles"] / elapsed if elapsed else 0.0
+        if self.on_progress is not None:
+            self.on_progress(dict(self.stats))
+
+    async def run(self):
+        """Download the range.
+
+        :returns: The candle dicts of ``[start, end)`` in time order. Windows
+            still missing after the retries are listed in :attr:`failed`;
+            running again with the same checkpoint requests only those.
+        """
+        self._started = time.perf_counter()
+        self.runs = []
+        self.failed = []
+        self.load_checkpoint()
+        queue = asyncio.Queue()
+        for window in self.pending_windows():
+            queue.put_nowait(window)
+
+        if self.checkpoint:
+            self._checkpoint_file = open(self.checkpoint, "a")
+        workers = [asyncio.create_task(self.worker(queue)) for _ in range(self.concurrency)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if self._checkpoint_file is not None:
+                self._checkpoint_file.close()
+                self._checkpoint_file = None
+
+        self.stats["elapsed"] = time.perf_counter() - self._started
+        logger.info(
+            f"Downloaded {self.stats['candles']} candles of {self.asset} in "
+            f"{self.stats['requests']} requests ({self.stats['candles_per_second']:.0f} candles/s)"
+        )
+        self.runs.sort(key=lambda run: run[0])
+        return [
+            candle
+            for candle in merge_candles(*(candles for _, _, candles in self.runs))
+            if self.start <= candle["time"] < self.end
+        ]
@@ -0,0 +1,95 @@
+# quotexapi/utils/indicator_cache.py
+
+import time
+import threading
+from collections import OrderedDict
+
+INDICATOR_CACHE_SIZE = 256
+
+
+def candle_bucket(timeframe, timestamp=None):
+    """Index of the candle of ``timeframe`` open at ``timestamp``.
+
+    It changes exactly when a candle closes, so results stamped with it
+    stay valid until the next close.
+    """
+    if timestamp is None:
+        timestamp = time.time()
+    return int(timestamp // timeframe)
+
+
+def copy_result(result):
+    """Copy a result down to its lists and dicts of values."""
+    return {
+        name: value.copy() if isinstance(value, (list, dict)) else value
+        for name, value in result.items()
+    }
+
+
+class IndicatorCache(object):
+    """Class for the LRU cache of indicator results.
+
+    Entries are keyed by ``(asset, indicator, params, timeframe, history)``
+    and stamped with the candle bucket they were computed in; a lookup in a
+    later bucket is a miss, so a result is served until the next candle of
+    its timeframe closes.
+
+    Results are copied on the way in and out, so callers are free to
+    modify what they get.
+    """
+
+    def __init__(self, maxsize=INDICATOR_CACHE_SIZE):
+        """
+        :param int maxsize: Maximum number of results kept; 0 disables it.
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(asset, indicator, params, timeframe, history):
+        params = tuple(sorted((params or {}).items()))
+        return asset, indicator.upper(), params, timeframe, history
+
+    def get(self, key, bucket):
+        """Get the result cached for ``key`` in ``bucket``, or ``None``."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != bucket:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return copy_result(entry[1])
+
+    def put(self, key, bucket, result):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self.entries[key] = (bucket, copy_result(result))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self):
+        """Get the hit, miss and eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,100 @@
+# quotexapi/utils/indicator_set.py
+
+from typing import Dict, List, Optional
+from quotexapi.utils.indicators import (
+    IndicatorInputs,
+    sma_result,
+    ema_result,
+    rsi_result,
+    macd_result,
+    bollinger_result,
+    stochastic_result,
+    atr_result,
+    adx_result,
+    ichimoku_result
+)
+
+# Función de cálculo y parámetros por defecto, en el orden de sus argumentos;
+# los nombres son los que acepta ``calculate_indicator``.
+INDICATORS = {
+    "RSI": (rsi_result, {"period": 14}),
+    "MACD": (macd_result, {"fast_period": 12, "slow_period": 26, "signal_period": 9}),
+    "SMA": (sma_result, {"period": 20}),
+    "EMA": (ema_result, {"period": 20}),
+    "BOLLINGER": (bollinger_result, {"period": 20, "std": 2}),
+    "STOCHASTIC": (stochastic_result, {"k_period": 14, "d_period": 3}),
+    "ATR": (atr_result, {"period": 14}),
+    "ADX": (adx_result, {"period": 14}),
+    "ICHIMOKU": (ichimoku_result, {"tenkan_period": 9, "kijun_period": 26, "senkou_b_period": 52}),
+}
+
+
+def parse_spec(spec):
+    """Normaliza una especificación de indicador.
+
+    Acepta ``"RSI"``, ``("EMA", {"period": 12})`` o
+    ``{"indicator": "EMA", "params": {"period": 12}, "name": "ema_rapida"}``.
+
+    :returns: tupla (nombre del resultado, indicador, parámetros).
+    """
+    name = None
+    if isinstance(spec, str):
+        indicator, params = spec, None
+    elif isinstance(spec, dict):
+        indicator, params, name = spec["indicator"], spec.get("params"), spec.get("name")
+    else:
+        indicator, params = spec[0], spec[1] if len(spec) > 1 else None
+    indicator, params = indicator.upper(), params or {}
+    if name is None:
+        name = indicator
+        if params:
+            name += "(" + ", ".join(f"{key}={value}" for key, value in params.items()) + ")"
+    return name, indicator, params
+
+
+class IndicatorSet:
+    """Varios indicadores calculados sobre las mismas velas.
+
+    Los intermedios que comparten (EMAs, SMAs, True Range, extremos
+    móviles) se calculan una sola vez por llamada a :meth:`calculate`.
+    """
+
+    def __init__(self, specs):
+        self.specs = [parse_spec(spec) for spec in specs]
+        self.inputs = None
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _, _ in self.specs]
+
+    def calculate(self, closes, highs=None, lows=None, decimals: Optional[int] = 2) -> Dict[str, Dict]:
+        """Calcula todos los indicadores.
+
+        :returns: dict nombre -> resultado, con la misma forma que el de
+            ``calculate_indicator`` (sin ``timeframe`` ni ``timestamps``).
+        """
+        self.inputs = IndicatorInputs(closes, highs, lows)
+        results = {}
+        for name, indicator, params in self.specs:
+            entry = INDICATORS.get(indicator)
+            if entry is None:
+                results[name] = {"error": f"Indicador '{indicator}' no soportado"}
+                continue
+            function, defaults = entry
+            try:
+                values = function(
+                    self.inputs,
+                    *(params.get(key, default) for key, default in defaults.items()),
+                    decimals=decimals
+                )
+            except Exception as e:
+                results[name] = {"error": f"Error calculando el indicador: {str(e)}"}
+                continue
+            if isinstance(values, list):
+                values = {
+                    indicator.lower(): values,
+                    "current": values[-1] if values else None,
+                    "history_size": len(values)
+                }
+            results[name] = values
+        return results
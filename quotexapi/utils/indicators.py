@@ -1,293 +1,410 @@
 # quotexapi/utils/indicators.py
 
 import numpy as np
-from typing import List, Dict, Union, Tuple
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import List, Dict, Union, Tuple, Optional
+from quotexapi.utils.rolling import rolling_max, rolling_min
+
+# Ventanas evaluadas a la vez al operar con sliding_window_view.
+WINDOW_CHUNK = 65536
+
+
+def as_array(values) -> np.ndarray:
+    """Convierte una secuencia en un arreglo float64 (sin copiar si ya lo es)"""
+    return np.asarray(values, dtype=np.float64)
+
+
+def output(values, decimals: Optional[int] = 2) -> List[float]:
+    """Redondea una sola vez, al final, y devuelve una lista"""
+    values = as_array(values)
+    if decimals is not None:
+        values = np.round(values, decimals)
+    return values.tolist()
+
+
+def recursive_filter(values: np.ndarray, decay: float, initial=0.0) -> np.ndarray:
+    """Resuelve y[i] = decay * y[i - 1] + values[i], con y[-1] = initial.
+
+    Es la recurrencia de la EMA y del suavizado de Wilder. Se evalúa por
+    bloques con potencias de ``decay`` y sumas acumuladas, sin bucle por
+    elemento; el tamaño del bloque evita desbordar ``decay ** -k``. Con un
+    arreglo 2-D se resuelve cada fila (``initial`` puede ser uno por fila).
+    """
+    values = as_array(values)
+    n = values.shape[-1]
+    result = np.empty(values.shape, dtype=np.float64)
+    if not n:
+        return result
+    previous = np.asarray(initial, dtype=np.float64)
+    if decay <= 0:
+        result[...] = values
+        return result
+    if decay >= 1:
+        return np.cumsum(values, axis=-1) + previous[..., None]
+
+    block = max(1, min(n, int(100 / -np.log10(decay))))
+    powers = decay ** np.arange(block + 1, dtype=np.float64)
+    inverse = decay ** -np.arange(block, dtype=np.float64)
+    for start in range(0, n, block):
+        chunk = values[..., start:start + block]
+        m = chunk.shape[-1]
+        accumulated = np.cumsum(chunk * inverse[:m], axis=-1)
+        result[..., start:start + m] = powers[1:m + 1] * previous[..., None] + powers[:m] * accumulated
+        previous = result[..., start + m - 1]
+    return result
+
+
+def sma_array(values, period: int) -> np.ndarray:
+    """SMA con sumas acumuladas: O(n) sin importar el período"""
+    values = as_array(values)
+    if len(values) < period:
+        return np.empty(0, dtype=np.float64)
+    # Centrar en el primer valor reduce el error de la suma acumulada.
+    offset = values[0]
+    sums = np.concatenate(([0.0], np.cumsum(values - offset)))
+    return (sums[period:] - sums[:-period]) / period + offset
+
+
+def ema_array(values, period: int) -> np.ndarray:
+    """EMA sembrada con la SMA de los primeros ``period`` valores"""
+    values = as_array(values)
+    if len(values) < period:
+        return np.empty(0, dtype=np.float64)
+    multiplier = 2 / (period + 1)
+    seed = values[:period].sum() / period
+    tail = recursive_filter(values[period:] * multiplier, 1 - multiplier, seed)
+    return np.concatenate(([seed], tail))
+
+
+def wilder_array(values, period: int, seed: float) -> np.ndarray:
+    """Suavizado de Wilder: y = (y_anterior * (period - 1) + x) / period"""
+    tail = recursive_filter(as_array(values) / period, (period - 1) / period, seed)
+    return np.concatenate(([seed], tail))
+
+
+def rolling_std(values, period: int) -> np.ndarray:
+    """Desviación estándar poblacional de cada ventana"""
+    values = as_array(values)
+    if len(values) < period:
+        return np.empty(0, dtype=np.float64)
+    windows = sliding_window_view(values, period)
+    result = np.empty(len(windows), dtype=np.float64)
+    for start in range(0, len(windows), WINDOW_CHUNK):
+        result[start:start + WINDOW_CHUNK] = windows[start:start + WINDOW_CHUNK].std(axis=1)
+    return result
+
+
+def true_range(highs, lows, closes) -> np.ndarray:
+    """True Range desde la segunda vela: max(H - L, |H - C_ant|, |L - C_ant|)"""
+    highs, lows, closes = as_array(highs), as_array(lows), as_array(closes)
+    high, low, prev_close = highs[1:], lows[1:], closes[:-1]
+    return np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+class IndicatorInputs:
+    """Velas de entrada con los cálculos intermedios memoizados.
+
+    Cada intermedio (EMA, SMA, desviación, True Range, máximos y mínimos
+    móviles, ...) se calcula la primera vez que un indicador lo pide y se
+    reutiliza después: MACD(12, 26) y EMA(12) comparten la misma EMA,
+    Bollinger(20) y SMA(20) la misma SMA, ATR y ADX el mismo promedio del
+    True Range.
+    """
+
+    def __init__(self, closes, highs=None, lows=None):
+        self.closes = as_array(closes)
+        self.highs = as_array(highs) if highs is not None else self.closes
+        self.lows = as_array(lows) if lows is not None else self.closes
+        self.nodes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.closes)
+
+    def node(self, key, compute, *args):
+        if key in self.nodes:
+            self.hits += 1
+            return self.nodes[key]
+        self.misses += 1
+        value = self.nodes[key] = compute(*args)
+        return value
+
+    def sma(self, period: int) -> np.ndarray:
+        return self.node(("sma", period), sma_array, self.closes, period)
+
+    def ema(self, period: int) -> np.ndarray:
+        return self.node(("ema", period), ema_array, self.closes, period)
+
+    def std(self, period: int) -> np.ndarray:
+        return self.node(("std", period), rolling_std, self.closes, period)
+
+    def rsi(self, period: int) -> np.ndarray:
+        def compute():
+            deltas = np.diff(self.closes)
+            gain = np.where(deltas > 0, deltas, 0.0)
+            loss = np.where(deltas < 0, -deltas, 0.0)
+
+            avg_gain = wilder_array(gain[period:], period, gain[:period].mean())
+            avg_loss = wilder_array(loss[period:], period, loss[:period].mean())
+
+            rs = avg_gain / np.where(avg_loss == 0, 0.00001, avg_loss)
+            return 100 - (100 / (1 + rs))
+        return self.node(("rsi", period), compute)
+
+    def true_range(self) -> np.ndarray:
+        return self.node(("true_range",), true_range, self.highs, self.lows, self.closes)
+
+    def atr(self, period: int) -> np.ndarray:
+        """Promedio de Wilder del True Range (ATR y base del ADX)"""
+        def compute():
+            tr = self.true_range()
+            return wilder_array(tr[period:], period, tr[:period].sum() / period)
+        return self.node(("atr", period), compute)
+
+    def adx(self, period: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        def compute():
+            up_move = self.highs[1:] - self.highs[:-1]
+            down_move = self.lows[:-1] - self.lows[1:]
+            plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+            minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+            # Promedios de Wilder de TR y de los movimientos direccionales
+            tr_avg = self.atr(period)
+            plus_avg = wilder_array(plus_dm[period:], period, plus_dm[:period].sum() / period)
+            minus_avg = wilder_array(minus_dm[period:], period, minus_dm[:period].sum() / period)
 
+            with np.errstate(divide="ignore", invalid="ignore"):
+                plus_di = np.where(tr_avg == 0, 0.0, plus_avg * 100 / tr_avg)
+                minus_di = np.where(tr_avg == 0, 0.0, minus_avg * 100 / tr_avg)
+                di_sum = plus_di + minus_di
+                dx = np.where(di_sum == 0, 0.0, np.abs(plus_di - minus_di) / di_sum * 100)
 
-class TechnicalIndicators:
-    @staticmethod
-    def calculate_sma(prices: List[float], period: int) -> List[float]:
-        """Calcula la Media Móvil Simple (SMA)"""
-        if len(prices) < period:
-            return []
+            adx = wilder_array(dx[period:], period, dx[:period].sum() / period)
+            return adx, plus_di, minus_di
+        return self.node(("adx", period), compute)
+
+    def highest(self, period: int) -> np.ndarray:
+        return self.node(("highest", period), rolling_max, self.highs, period)
+
+    def lowest(self, period: int) -> np.ndarray:
+        return self.node(("lowest", period), rolling_min, self.lows, period)
 
-        sma_values = []
-        for i in range(len(prices) - period + 1):
-            sma = sum(prices[i:(i + period)]) / period
-            sma_values.append(round(sma, 2))
-        return sma_values
+    def stochastic_k(self, k_period: int) -> np.ndarray:
+        def compute():
+            window_high, window_low = self.highest(k_period), self.lowest(k_period)
+            spread = window_high - window_low
+            with np.errstate(divide="ignore", invalid="ignore"):
+                k = (self.closes[k_period - 1:] - window_low) / spread * 100
+            return np.where(spread == 0, 100.0, k)
+        return self.node(("stochastic_k", k_period), compute)
 
-    @staticmethod
-    def calculate_ema(prices: List[float], period: int) -> List[float]:
-        """Calcula la Media Móvil Exponencial (EMA)"""
-        if len(prices) < period:
-            return []
+    def donchian(self, period: int) -> np.ndarray:
+        """Punto medio del canal de Donchian de cada ventana"""
+        return self.node(("donchian", period), lambda: (self.highest(period) + self.lowest(period)) / 2)
 
-        multiplier = 2 / (period + 1)
-        ema_values = [sum(prices[:period]) / period]
 
-        for price in prices[period:]:
-            ema = (price * multiplier) + (ema_values[-1] * (1 - multiplier))
-            ema_values.append(round(ema, 2))
-        return ema_values
+def current(**values: List[float]) -> Dict[str, List[float]]:
+    """Agrega a las líneas de un indicador su último valor en ``current``"""
+    result = dict(values)
+    result["current"] = {name: line[-1] if line else None for name, line in values.items()}
+    return result
 
-    @staticmethod
-    def calculate_rsi(prices: List[float], period: int = 14) -> List[float]:
-        """Calcula el Índice de Fuerza Relativa (RSI)"""
-        if len(prices) < period + 1:
-            return []
 
-        deltas = np.diff(prices)
-        gain = np.where(deltas > 0, deltas, 0)
-        loss = np.where(deltas < 0, -deltas, 0)
+def sma_result(inputs: IndicatorInputs, period: int, decimals: Optional[int] = 2) -> List[float]:
+    if len(inputs) < period:
+        return []
+    return output(inputs.sma(period), decimals)
 
-        avg_gain = np.concatenate(([np.mean(gain[:period])], gain[period:]))
-        avg_loss = np.concatenate(([np.mean(loss[:period])], loss[period:]))
 
-        for i in range(1, len(avg_gain)):
-            avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gain[period + i - 1]) / period
-            avg_loss[i] = (avg_loss[i - 1] * (period - 1) + loss[period + i - 1]) / period
+def ema_result(inputs: IndicatorInputs, period: int, decimals: Optional[int] = 2) -> List[float]:
+    if len(inputs) < period:
+        return []
+    return output(inputs.ema(period), decimals)
 
-        rs = avg_gain / np.where(avg_loss == 0, 0.00001, avg_loss)
-        rsi = 100 - (100 / (1 + rs))
-        return [round(x, 2) for x in rsi.tolist()]
 
-    @staticmethod
-    def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> \
-    Dict[str, List[float]]:
-        """Calcula el MACD (Moving Average Convergence Divergence)"""
-        if len(prices) < slow_period:
-            return {"macd": [], "signal": [], "histogram": []}
+def rsi_result(inputs: IndicatorInputs, period: int = 14, decimals: Optional[int] = 2) -> List[float]:
+    if len(inputs) < period + 1:
+        return []
+    return output(inputs.rsi(period), decimals)
 
-        fast_ema = TechnicalIndicators.calculate_ema(prices, fast_period)
-        slow_ema = TechnicalIndicators.calculate_ema(prices, slow_period)
 
-        macd_line = []
-        for i in range(len(slow_ema)):
-            macd = fast_ema[i + (len(fast_ema) - len(slow_ema))] - slow_ema[i]
-            macd_line.append(round(macd, 2))
+def macd_result(inputs: IndicatorInputs, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9,
+                decimals: Optional[int] = 2) -> Dict[str, List[float]]:
+    if len(inputs) < slow_period:
+        return {"macd": [], "signal": [], "histogram": []}
 
-        signal_line = TechnicalIndicators.calculate_ema(macd_line, signal_period)
+    fast_ema = inputs.ema(fast_period)
+    slow_ema = inputs.ema(slow_period)
 
-        histogram = []
-        for i in range(len(signal_line)):
-            hist = macd_line[i + (len(macd_line) - len(signal_line))] - signal_line[i]
-            histogram.append(round(hist, 2))
+    macd_line = fast_ema[len(fast_ema) - len(slow_ema):] - slow_ema
+    signal_line = ema_array(macd_line, signal_period)
+    histogram = macd_line[len(macd_line) - len(signal_line):] - signal_line
 
-        return {
-            "macd": macd_line,
-            "signal": signal_line,
-            "histogram": histogram,
-            "current": {
-                "macd": macd_line[-1] if macd_line else None,
-                "signal": signal_line[-1] if signal_line else None,
-                "histogram": histogram[-1] if histogram else None
-            }
-        }
+    return current(
+        macd=output(macd_line, decimals),
+        signal=output(signal_line, decimals),
+        histogram=output(histogram, decimals)
+    )
 
-    @staticmethod
-    def calculate_bollinger_bands(prices: List[float], period: int = 20, num_std: float = 2) -> Dict[str, List[float]]:
-        """Calcula las Bandas de Bollinger"""
-        if len(prices) < period:
-            return {"upper": [], "middle": [], "lower": []}
 
-        sma = TechnicalIndicators.calculate_sma(prices, period)
-        std = []
+def bollinger_result(inputs: IndicatorInputs, period: int = 20, num_std: float = 2,
+                     decimals: Optional[int] = 2) -> Dict[str, List[float]]:
+    if len(inputs) < period:
+        return {"upper": [], "middle": [], "lower": []}
 
-        for i in range(len(prices) - period + 1):
-            window = prices[i:(i + period)]
-            std.append(np.std(window))
+    sma = inputs.sma(period)
+    std = inputs.std(period)
 
-        upper_band = [sma[i] + (std[i] * num_std) for i in range(len(sma))]
-        lower_band = [sma[i] - (std[i] * num_std) for i in range(len(sma))]
+    return current(
+        upper=output(sma + std * num_std, decimals),
+        middle=output(sma, decimals),
+        lower=output(sma - std * num_std, decimals)
+    )
 
-        return {
-            "upper": [round(x, 2) for x in upper_band],
-            "middle": [round(x, 2) for x in sma],
-            "lower": [round(x, 2) for x in lower_band],
-            "current": {
-                "upper": upper_band[-1] if upper_band else None,
-                "middle": sma[-1] if sma else None,
-                "lower": lower_band[-1] if lower_band else None
-            }
-        }
 
-    @staticmethod
-    def calculate_stochastic(prices: List[float], highs: List[float], lows: List[float], k_period: int = 14,
-                             d_period: int = 3) -> Dict[str, List[float]]:
-        """Calcula el Oscilador Estocástico"""
-        if len(prices) < k_period:
-            return {"k": [], "d": []}
+def stochastic_result(inputs: IndicatorInputs, k_period: int = 14, d_period: int = 3,
+                      decimals: Optional[int] = 2) -> Dict[str, List[float]]:
+    if len(inputs) < k_period:
+        return {"k": [], "d": []}
+
+    k_array = inputs.stochastic_k(k_period)
+    return current(k=output(k_array, decimals), d=output(sma_array(k_array, d_period), decimals))
 
-        k_values = []
 
-        for i in range(len(prices) - k_period + 1):
-            window_high = max(highs[i:i + k_period])
-            window_low = min(lows[i:i + k_period])
+def atr_result(inputs: IndicatorInputs, period: int = 14, decimals: Optional[int] = 2) -> List[float]:
+    if len(inputs) < period:
+        return []
+    return output(inputs.atr(period), decimals)
 
-            if window_high == window_low:
-                k = 100
-            else:
-                k = ((prices[i + k_period - 1] - window_low) / (window_high - window_low)) * 100
-            k_values.append(round(k, 2))
 
-        d_values = TechnicalIndicators.calculate_sma(k_values, d_period)
+def adx_result(inputs: IndicatorInputs, period: int = 14, decimals: Optional[int] = 2) -> Dict[str, List[float]]:
+    if len(inputs) < period + 1:
+        return {"adx": [], "plus_di": [], "minus_di": []}
 
+    adx, plus_di, minus_di = inputs.adx(period)
+    return current(
+        adx=output(adx, decimals),
+        plus_di=output(plus_di, decimals),
+        minus_di=output(minus_di, decimals)
+    )
+
+
+def ichimoku_result(inputs: IndicatorInputs, tenkan_period: int = 9, kijun_period: int = 26,
+                    senkou_b_period: int = 52, decimals: Optional[int] = 2) -> Dict[str, List[float]]:
+    if len(inputs) < senkou_b_period:
         return {
-            "k": k_values,
-            "d": d_values,
-            "current": {
-                "k": k_values[-1] if k_values else None,
-                "d": d_values[-1] if d_values else None
-            }
+            "tenkan": [],
+            "kijun": [],
+            "senkou_a": [],
+            "senkou_b": [],
+            "chikou": []
         }
 
+    # Cálculo de las líneas
+    tenkan = inputs.donchian(tenkan_period)
+    kijun = inputs.donchian(kijun_period)
+    senkou_b = inputs.donchian(senkou_b_period)
+
+    # Senkou Span A (Promedio de Tenkan y Kijun de la misma vela; ambas
+    # series terminan en la última vela)
+    size = min(len(tenkan), len(kijun))
+    senkou_a = (tenkan[-size:] + kijun[-size:]) / 2
+
+    # Chikou Span (Precio de cierre desplazado 26 períodos hacia atrás)
+    chikou = inputs.lows[kijun_period:]
+
+    return current(
+        tenkan=output(tenkan, decimals),
+        kijun=output(kijun, decimals),
+        senkou_a=output(senkou_a, decimals),
+        senkou_b=output(senkou_b, decimals),
+        chikou=output(chikou, decimals)
+    )
+
+
+class TechnicalIndicators:
+    """Indicadores técnicos vectorizados con NumPy.
+
+    Todos los métodos aceptan listas o arreglos y devuelven listas. El
+    parámetro ``decimals`` redondea una sola vez al final (``None`` no
+    redondea); los cálculos intermedios siempre usan precisión completa.
+    Para varios indicadores sobre las mismas velas, ``IndicatorSet``
+    comparte los intermedios entre ellos.
+    """
+
     @staticmethod
-    def calculate_atr(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> List[float]:
-        """Calcula el Average True Range (ATR)"""
-        if len(highs) < period:
-            return []
+    def calculate_sma(prices: List[float], period: int, decimals: Optional[int] = 2) -> List[float]:
+        """Calcula la Media Móvil Simple (SMA)"""
+        return sma_result(IndicatorInputs(prices), period, decimals)
+
+    @staticmethod
+    def calculate_ema(prices: List[float], period: int, decimals: Optional[int] = 2) -> List[float]:
+        """Calcula la Media Móvil Exponencial (EMA)"""
+        return ema_result(IndicatorInputs(prices), period, decimals)
+
+    @staticmethod
+    def rsi_array(prices, period: int = 14) -> np.ndarray:
+        return IndicatorInputs(prices).rsi(period)
 
-        true_ranges = []
-        for i in range(1, len(highs)):
-            high = highs[i]
-            low = lows[i]
-            prev_close = closes[i - 1]
+    @staticmethod
+    def calculate_rsi(prices: List[float], period: int = 14, decimals: Optional[int] = 2) -> List[float]:
+        """Calcula el Índice de Fuerza Relativa (RSI)"""
+        return rsi_result(IndicatorInputs(prices), period, decimals)
+
+    @staticmethod
+    def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9,
+                       decimals: Optional[int] = 2) -> Dict[str, List[float]]:
+        """Calcula el MACD (Moving Average Convergence Divergence)"""
+        return macd_result(IndicatorInputs(prices), fast_period, slow_period, signal_period, decimals)
+
+    @staticmethod
+    def calculate_bollinger_bands(prices: List[float], period: int = 20, num_std: float = 2,
+                                  decimals: Optional[int] = 2) -> Dict[str, List[float]]:
+        """Calcula las Bandas de Bollinger"""
+        return bollinger_result(IndicatorInputs(prices), period, num_std, decimals)
 
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
+    @staticmethod
+    def stochastic_k_array(prices, highs, lows, k_period: int = 14) -> np.ndarray:
+        return IndicatorInputs(prices, highs, lows).stochastic_k(k_period)
 
-            true_range = max(tr1, tr2, tr3)
-            true_ranges.append(true_range)
+    @staticmethod
+    def calculate_stochastic(prices: List[float], highs: List[float], lows: List[float], k_period: int = 14,
+                             d_period: int = 3, decimals: Optional[int] = 2) -> Dict[str, List[float]]:
+        """Calcula el Oscilador Estocástico"""
+        return stochastic_result(IndicatorInputs(prices, highs, lows), k_period, d_period, decimals)
 
-        atr_values = [sum(true_ranges[:period]) / period]
+    @staticmethod
+    def atr_array(highs, lows, closes, period: int = 14) -> np.ndarray:
+        return IndicatorInputs(closes, highs, lows).atr(period)
 
-        for i in range(period, len(true_ranges)):
-            atr = (atr_values[-1] * (period - 1) + true_ranges[i]) / period
-            atr_values.append(round(atr, 2))
+    @staticmethod
+    def calculate_atr(highs: List[float], lows: List[float], closes: List[float], period: int = 14,
+                      decimals: Optional[int] = 2) -> List[float]:
+        """Calcula el Average True Range (ATR)"""
+        return atr_result(IndicatorInputs(closes, highs, lows), period, decimals)
 
-        return atr_values
+    @staticmethod
+    def adx_arrays(highs, lows, closes, period: int = 14) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return IndicatorInputs(closes, highs, lows).adx(period)
 
     @staticmethod
-    def calculate_adx(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> Dict[
-        str, List[float]]:
+    def calculate_adx(highs: List[float], lows: List[float], closes: List[float], period: int = 14,
+                      decimals: Optional[int] = 2) -> Dict[str, List[float]]:
         """Calcula el Average Directional Index (ADX)"""
-        if len(highs) < period + 1:
-            return {"adx": [], "plus_di": [], "minus_di": []}
-
-        # Calcular True Range
-        tr = []
-        plus_dm = []
-        minus_dm = []
-
-        for i in range(1, len(highs)):
-            high = highs[i]
-            low = lows[i]
-            prev_high = highs[i - 1]
-            prev_low = lows[i - 1]
-            prev_close = closes[i - 1]
-
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
-            tr.append(max(tr1, tr2, tr3))
-
-            plus_dm1 = high - prev_high
-            minus_dm1 = prev_low - low
-
-            if plus_dm1 > minus_dm1 and plus_dm1 > 0:
-                plus_dm.append(plus_dm1)
-            else:
-                plus_dm.append(0)
-
-            if minus_dm1 > plus_dm1 and minus_dm1 > 0:
-                minus_dm.append(minus_dm1)
-            else:
-                minus_dm.append(0)
-
-        # Calcular los promedios
-        tr_avg = [sum(tr[:period]) / period]
-        plus_di_avg = [sum(plus_dm[:period]) / period * 100 / tr_avg[0]]
-        minus_di_avg = [sum(minus_dm[:period]) / period * 100 / tr_avg[0]]
-
-        for i in range(period, len(tr)):
-            tr_avg.append((tr_avg[-1] * (period - 1) + tr[i]) / period)
-            plus_di = (plus_di_avg[-1] * (period - 1) + plus_dm[i]) / period
-            minus_di = (minus_di_avg[-1] * (period - 1) + minus_dm[i]) / period
-
-            plus_di_avg.append(plus_di * 100 / tr_avg[-1])
-            minus_di_avg.append(minus_di * 100 / tr_avg[-1])
-
-        # Calcular ADX
-        dx_values = []
-        for i in range(len(plus_di_avg)):
-            dx = abs(plus_di_avg[i] - minus_di_avg[i]) / (plus_di_avg[i] + minus_di_avg[i]) * 100
-            dx_values.append(dx)
-
-        adx_values = [sum(dx_values[:period]) / period]
-        for i in range(period, len(dx_values)):
-            adx = (adx_values[-1] * (period - 1) + dx_values[i]) / period
-            adx_values.append(round(adx, 2))
+        return adx_result(IndicatorInputs(closes, highs, lows), period, decimals)
 
-        return {
-            "adx": adx_values,
-            "plus_di": [round(x, 2) for x in plus_di_avg],
-            "minus_di": [round(x, 2) for x in minus_di_avg],
-            "current": {
-                "adx": adx_values[-1] if adx_values else None,
-                "plus_di": plus_di_avg[-1] if plus_di_avg else None,
-                "minus_di": minus_di_avg[-1] if minus_di_avg else None
-            }
-        }
+    @staticmethod
+    def donchian_array(highs, lows, period: int) -> np.ndarray:
+        """Punto medio del canal de Donchian de cada ventana"""
+        return IndicatorInputs(lows, highs, lows).donchian(period)
 
     @staticmethod
     def calculate_ichimoku(highs: List[float], lows: List[float],
                            tenkan_period: int = 9,
                            kijun_period: int = 26,
-                           senkou_b_period: int = 52) -> Dict[str, List[float]]:
+                           senkou_b_period: int = 52,
+                           decimals: Optional[int] = 2) -> Dict[str, List[float]]:
         """Calcula el Ichimoku Cloud"""
-        if len(highs) < senkou_b_period:
-            return {
-                "tenkan": [],
-                "kijun": [],
-                "senkou_a": [],
-                "senkou_b": [],
-                "chikou": []
-            }
-
-        def donchian(high_prices: List[float], low_prices: List[float], period: int) -> List[float]:
-            result = []
-            for i in range(len(high_prices) - period + 1):
-                highest = max(high_prices[i:i + period])
-                lowest = min(low_prices[i:i + period])
-                result.append((highest + lowest) / 2)
-            return result
-
-        # Cálculo de las líneas
-        tenkan = donchian(highs, lows, tenkan_period)
-        kijun = donchian(highs, lows, kijun_period)
-        senkou_b = donchian(highs, lows, senkou_b_period)
-
-        # Senkou Span A (Promedio de Tenkan y Kijun)
-        senkou_a = []
-        for i in range(min(len(tenkan), len(kijun))):
-            senkou_a.append((tenkan[i] + kijun[i]) / 2)
-
-        # Chikou Span (Precio de cierre desplazado 26 períodos hacia atrás)
-        chikou = lows[kijun_period:]
-
-        return {
-            "tenkan": [round(x, 2) for x in tenkan],
-            "kijun": [round(x, 2) for x in kijun],
-            "senkou_a": [round(x, 2) for x in senkou_a],
-            "senkou_b": [round(x, 2) for x in senkou_b],
-            "chikou": [round(x, 2) for x in chikou],
-            "current": {
-                "tenkan": tenkan[-1] if tenkan else None,
-                "kijun": kijun[-1] if kijun else None,
-                "senkou_a": senkou_a[-1] if senkou_a else None,
-                "senkou_b": senkou_b[-1] if senkou_b else None,
-                "chikou": chikou[-1] if chikou else None
-            }
-        }
\ No newline at end of file
+        return ichimoku_result(IndicatorInputs(lows, highs, lows), tenkan_period, kijun_period, senkou_b_period,
+                               decimals)
@@ -1,7 +1,10 @@
 # quotexapi/utils/processor.py
 
 import time
-from quotexapi.utils.services import group_by_period
+import numpy as np
+from bisect import bisect_left, bisect_right
+from itertools import repeat
+from operator import itemgetter, lt
 
 
 def get_color(candle):
@@ -13,32 +16,38 @@ def get_color(candle):
         return 'gray'
 
 
-def process_tick(tick, candles, period=60):
+def process_tick(tick, candles, period=60, history=10):
     pair, timestamp, price, direction = tick
     timestamp = int(timestamp)
 
     start_time = (timestamp // period) * period
 
-    if pair not in candles:
-        candles[pair] = {}
-
-    if start_time not in candles[pair]:
-        candles[pair][start_time] = {
+    bars = candles.get(pair)
+    if bars is None:
+        bars = candles[pair] = {}
+
+    current_candle = bars.get(start_time)
+    if current_candle is None:
+        # Prune only when a new bar opens; bars are kept in time order.
+        cutoff = start_time - period * history
+        for old_time in list(bars):
+            if old_time > cutoff:
+                break
+            del bars[old_time]
+        current_candle = bars[start_time] = {
             "open": price,
             "close": price,
             "high": price,
             "low": price,
-            "ticks": [],
+            "ticks": 0,
         }
 
-    current_candle = candles[pair][start_time]
     current_candle["close"] = price
-    current_candle["high"] = max(current_candle["high"], price)
-    current_candle["low"] = min(current_candle["low"], price)
-    current_candle["ticks"].append(tick)  # Armazena o tick para análises futuras
-
-    current_time = int(time.time())
-    candles[pair] = {k: v for k, v in candles[pair].items() if k > current_time - period * 10}
+    if price > current_candle["high"]:
+        current_candle["high"] = price
+    elif price < current_candle["low"]:
+        current_candle["low"] = price
+    current_candle["ticks"] += 1
 
     return candles
 
@@ -128,36 +137,158 @@ def process_candles_v2(history, asset, data):
     return candles
 
 
+def tick_columns(history):
+    """Get the time and price columns of ``[time, price, ...]`` rows.
+
+    :param history: list of rows or a 2-D array with at least two columns.
+    :returns: tuple of float64 ``times`` and ``prices`` arrays.
+    """
+    if isinstance(history, np.ndarray):
+        if history.ndim != 2 or not len(history):
+            return np.empty(0), np.empty(0)
+        return (
+            np.asarray(history[:, 0], dtype=np.float64),
+            np.asarray(history[:, 1], dtype=np.float64)
+        )
+    count = len(history)
+    return (
+        np.fromiter(map(itemgetter(0), history), dtype=np.float64, count=count),
+        np.fromiter(map(itemgetter(1), history), dtype=np.float64, count=count)
+    )
+
+
+def aggregate_buckets(buckets, prices, period):
+    """Reduce runs of equal ``buckets`` to OHLC columns.
+
+    :returns: tuple of the ``(time, open, close, high, low, ticks)`` lists
+        and the index where each run starts.
+    """
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)]
+    columns = (
+        (buckets[starts] * period).tolist(),
+        prices[starts].tolist(),
+        prices[ends - 1].tolist(),
+        np.maximum.reduceat(prices, starts).tolist(),
+        np.minimum.reduceat(prices, starts).tolist(),
+        (ends - starts).tolist(),
+    )
+    return columns, starts
+
+
+def aggregate_ticks(times, prices, period):
+    """Group time-ordered ticks into per-bucket OHLC columns.
+
+    :returns: tuple of lists ``(time, open, close, high, low, ticks)``.
+    """
+    buckets = np.floor_divide(times, period).astype(np.int64)
+    return aggregate_buckets(buckets, prices, period)[0]
+
+
 def calculate_candles(history, period):
-    grouped = group_by_period(history, period)
-    candles = []
-    for minute, ticks in grouped.items():
-        open_price = ticks[0][1]
-        close_price = ticks[-1][1]
-        high_price = max(tick[1] for tick in ticks)
-        low_price = min(tick[1] for tick in ticks)
-        num_ticks = len(ticks)
-        candle = {
-            'time': minute * period,
+    times, prices = tick_columns(history)
+    if not len(times):
+        return []
+
+    buckets = np.floor_divide(times, period).astype(np.int64)
+
+    order = None
+    if len(buckets) > 1 and np.any(buckets[1:] < buckets[:-1]):
+        # Out of order ticks: group them stably, as a dict of lists would.
+        order = np.argsort(buckets, kind="stable")
+        buckets = buckets[order]
+        prices = prices[order]
+
+    columns, starts = aggregate_buckets(buckets, prices, period)
+    candles = [
+        {
+            'time': minute,
             'open': open_price,
             'close': close_price,
             'high': high_price,
             'low': low_price,
             'ticks': num_ticks
         }
-        candles.append(candle)
+        for minute, open_price, close_price, high_price, low_price, num_ticks in zip(*columns)
+    ]
+    if order is not None:
+        # Keep the candles in order of each bucket's first tick.
+        candles = [candles[i] for i in np.argsort(order[starts], kind="stable")]
     candles = candles[:-1]
 
     return candles
 
 
-def merge_candles(candles_data):
-    seen_times = set()
-    merged_list = []
-    for candle in candles_data:
-        if isinstance(candle, dict) and candle.get('time') not in seen_times:
-            seen_times.add(candle['time'])
-            merged_list.append(candle)
-    merged_list.sort(key=lambda x: x['time'])
-
-    return merged_list
+candle_time = itemgetter("time")
+
+
+def sorted_run(candles):
+    """Get the candle dicts of ``candles`` in time order, one per time.
+
+    Runs already in order without repeated times, as history and realtime
+    candles are, are only checked. Entries that are not dicts are skipped;
+    of candles sharing a time the later one is kept.
+
+    :returns: tuple of the candle list and the list of their times.
+    """
+    run = candles if isinstance(candles, list) else list(candles)
+    if not all(map(isinstance, run, repeat(dict))):
+        run = [candle for candle in run if isinstance(candle, dict)]
+    times = list(map(candle_time, run))
+    if not all(map(lt, times, times[1:])):
+        return overwrite(times, run)
+    return run, times
+
+
+def overwrite(times, candles):
+    """Keep the last of ``candles`` given for each time, in time order."""
+    latest = dict(zip(times, candles))
+    times = sorted(latest)
+    return list(map(latest.__getitem__, times)), times
+
+
+def merge_candles(*runs):
+    """Merge runs of candle dicts into one list in time order.
+
+    Of candles sharing a time the last one wins: the one from the later
+    run or, within a run, the later position. Entries that are not dicts
+    are skipped.
+
+    Each run is merged into the result in one step: a bisection finds the
+    stretch of the result its times span, and only that stretch is merged
+    with it; a run that overlaps nothing is spliced in. Runs in order
+    that barely overlap, like historical and realtime candles, cost one
+    read of each candle's time.
+    """
+    merged, merged_times = [], []
+    for run, times in map(sorted_run, runs):
+        if not run:
+            continue
+        low = bisect_left(merged_times, times[0])
+        high = bisect_right(merged_times, times[-1])
+        if low < high:
+            run, times = overwrite(merged_times[low:high] + times, merged[low:high] + run)
+        merged[low:high] = run
+        merged_times[low:high] = times
+    return merged
+
+
+def merge_candle_columns(*runs):
+    """Merge runs of candle columns into one set of columns in time order.
+
+    :param runs: dicts of equal-length arrays keyed by column name, all
+        with the same columns and a ``time`` column.
+    :returns: dict of column arrays; of rows sharing a time the last one
+        wins, as in :func:`merge_candles`.
+    """
+    if not runs:
+        return {"time": np.empty(0, dtype=np.int64)}
+    columns = {name: np.concatenate([np.asarray(run[name]) for run in runs]) for name in runs[0]}
+    times = columns["time"]
+    # A stable sort of concatenated sorted runs only merges them.
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    keep = np.ones(len(times), dtype=bool)
+    keep[:-1] = times[:-1] != times[1:]
+    rows = order[keep]
+    return {name: values[rows] for name, values in columns.items()}
@@ -0,0 +1,87 @@
+# quotexapi/utils/rolling.py
+
+from collections import deque
+from typing import Optional
+import numpy as np
+
+
+def rolling_extreme(values, period: int, maximum: bool = True) -> np.ndarray:
+    """Máximo (o mínimo) de cada ventana de ``period`` valores en O(n).
+
+    Algoritmo de van Herk/Gil-Werman: se parte el arreglo en bloques de
+    ``period``, se acumula el extremo hacia adelante y hacia atrás dentro de
+    cada bloque, y cada ventana, que toca a lo sumo dos bloques, es el
+    extremo del sufijo de su inicio y el prefijo de su final.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    count = len(values)
+    if period < 1 or count < period:
+        return np.empty(0, dtype=np.float64)
+    if period == 1:
+        return values.copy()
+    pick = np.maximum if maximum else np.minimum
+    blocks = -(-count // period)
+    padded = np.full(blocks * period, -np.inf if maximum else np.inf)
+    padded[:count] = values
+    padded = padded.reshape(blocks, period)
+    prefix = pick.accumulate(padded, axis=1).ravel()
+    suffix = pick.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    return pick(suffix[:count - period + 1], prefix[period - 1:count])
+
+
+def rolling_max(values, period: int) -> np.ndarray:
+    return rolling_extreme(values, period, maximum=True)
+
+
+def rolling_min(values, period: int) -> np.ndarray:
+    return rolling_extreme(values, period, maximum=False)
+
+
+class RollingExtreme:
+    """Máximo (o mínimo) de los últimos ``period`` valores en O(1) amortizado.
+
+    Mantiene una deque monótona de (índice, valor): cada valor entra una
+    vez y sale una vez, y el frente es siempre el extremo de la ventana.
+    """
+
+    __slots__ = ("period", "maximum", "window", "count")
+
+    def __init__(self, period: int, pick=max):
+        self.period = period
+        self.maximum = pick is max
+        self.window = deque()
+        self.count = 0
+
+    def next(self, x: float) -> Optional[float]:
+        """Extremo tras ``x`` sin modificar el estado"""
+        if self.count + 1 < self.period:
+            return None
+        window = self.window
+        front = None
+        if window:
+            # El frente sale de la ventana si es el valor más antiguo.
+            if window[0][0] > self.count - self.period:
+                front = window[0][1]
+            elif len(window) > 1:
+                front = window[1][1]
+        if front is None:
+            return x
+        if self.maximum:
+            return front if front > x else x
+        return front if front < x else x
+
+    def update(self, x: float) -> Optional[float]:
+        window = self.window
+        if self.maximum:
+            while window and window[-1][1] <= x:
+                window.pop()
+        else:
+            while window and window[-1][1] >= x:
+                window.pop()
+        window.append((self.count, x))
+        self.count += 1
+        if window[0][0] <= self.count - 1 - self.period:
+            window.popleft()
+        if self.count < self.period:
+            return None
+        return window[0][1]
@@ -0,0 +1,528 @@
+# quotexapi/utils/streaming.py
+
+from collections import deque
+from typing import Dict, Optional
+from quotexapi.utils.candle_builder import CANDLE_HISTORY
+from quotexapi.utils.rolling import RollingExtreme
+
+# Cada cuántas actualizaciones se recalculan las sumas móviles desde la
+# ventana, para que el error de sumar y restar no se acumule.
+RESUM_INTERVAL = 1024
+
+
+class EMAState:
+    """EMA incremental sembrada con la SMA de los primeros ``period`` valores"""
+
+    __slots__ = ("period", "multiplier", "count", "total", "value")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.multiplier = 2 / (period + 1)
+        self.count = 0
+        self.total = 0.0
+        self.value = None
+
+    def next(self, x: float) -> Optional[float]:
+        """Valor tras ``x`` sin modificar el estado"""
+        if self.count + 1 < self.period:
+            return None
+        if self.count + 1 == self.period:
+            return (self.total + x) / self.period
+        return x * self.multiplier + self.value * (1 - self.multiplier)
+
+    def update(self, x: float) -> Optional[float]:
+        value = self.next(x)
+        self.count += 1
+        if self.count <= self.period:
+            self.total += x
+        self.value = value
+        return value
+
+
+class WilderState(EMAState):
+    """Suavizado de Wilder: y = (y_anterior * (period - 1) + x) / period"""
+
+    __slots__ = ()
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.multiplier = 1 / period
+
+
+class RollingWindow:
+    """Ventana de tamaño fijo con suma y suma de cuadrados en O(1)"""
+
+    __slots__ = ("period", "values", "anchor", "total", "squares", "updates")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.anchor = None
+        self.total = 0.0
+        self.squares = 0.0
+        self.updates = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.period
+
+    def _sums(self, x: float, anchor: float):
+        # Sumas con ``x`` agregado (y el más antiguo fuera si está llena).
+        d = x - anchor
+        total, squares = self.total + d, self.squares + d * d
+        if self.full:
+            old = self.values[0] - anchor
+            total -= old
+            squares -= old * old
+        return total, squares
+
+    def next(self, x: float):
+        """(media, desviación estándar poblacional) tras ``x``, sin modificar"""
+        if len(self.values) + 1 < self.period:
+            return None
+        anchor = self.anchor if self.anchor is not None else x
+        return self._stats(*self._sums(x, anchor), anchor)
+
+    def _stats(self, total, squares, anchor):
+        mean = total / self.period
+        variance = max(squares / self.period - mean * mean, 0.0)
+        return mean + anchor, variance ** 0.5
+
+    def update(self, x: float):
+        if self.anchor is None:
+            self.anchor = x
+        self.total, self.squares = self._sums(x, self.anchor)
+        self.values.append(x)
+        self.updates += 1
+        if self.updates % RESUM_INTERVAL == 0:
+            self.total = sum(v - self.anchor for v in self.values)
+            self.squares = sum((v - self.anchor) ** 2 for v in self.values)
+        if not self.full:
+            return None
+        return self._stats(self.total, self.squares, self.anchor)
+
+
+class StreamingIndicator:
+    """Indicador que se actualiza vela a vela en O(1).
+
+    Se siembra una sola vez con el histórico (:meth:`seed`) y luego recibe
+    cada vela cerrada con ``update(candle)``; ``update(candle, closed=False)``
+    calcula el valor con la vela en formación sin modificar el estado.
+    """
+
+    name = None
+    fields = None
+
+    def __init__(self, decimals: Optional[int] = 2, history: int = CANDLE_HISTORY):
+        self.decimals = decimals
+        self.values = deque(maxlen=history)
+        self.value = None
+        self.last_time = None
+        self.count = 0
+
+    @property
+    def warmup(self) -> int:
+        """Velas necesarias para el primer valor"""
+        return 1
+
+    def seed(self, candles):
+        for candle in candles:
+            self.update(candle)
+        return self.value
+
+    def update(self, candle: Dict, closed: bool = True):
+        if not closed:
+            return self.format(self.peek(candle))
+        value = self.format(self.commit(candle))
+        self.count += 1
+        self.last_time = candle.get("time")
+        if value is not None:
+            self.values.append(value)
+            self.value = value
+        return value
+
+    def commit(self, candle: Dict):
+        raise NotImplementedError
+
+    def peek(self, candle: Dict):
+        raise NotImplementedError
+
+    def format(self, raw):
+        if raw is None:
+            return None
+        if isinstance(raw, dict):
+            return {key: self.round(value) for key, value in raw.items()}
+        return self.round(raw)
+
+    def round(self, value):
+        if value is None or self.decimals is None:
+            return value
+        return round(value, self.decimals)
+
+    def history(self):
+        """Valores de las velas cerradas: lista o dict de listas por campo"""
+        if self.fields is None:
+            return list(self.values)
+        return {field: [value[field] for value in self.values] for field in self.fields}
+
+
+class StreamingSMA(StreamingIndicator):
+    name = "SMA"
+
+    def __init__(self, period: int = 20, **kwargs):
+        super().__init__(**kwargs)
+        self.period = period
+        self.window = RollingWindow(period)
+
+    @property
+    def warmup(self):
+        return self.period
+
+    def commit(self, candle):
+        stats = self.window.update(candle["close"])
+        return stats[0] if stats else None
+
+    def peek(self, candle):
+        stats = self.window.next(candle["close"])
+        return stats[0] if stats else None
+
+
+class StreamingEMA(StreamingIndicator):
+    name = "EMA"
+
+    def __init__(self, period: int = 20, **kwargs):
+        super().__init__(**kwargs)
+        self.period = period
+        self.ema = EMAState(period)
+
+    @property
+    def warmup(self):
+        return self.period
+
+    def commit(self, candle):
+        return self.ema.update(candle["close"])
+
+    def peek(self, candle):
+        return self.ema.next(candle["close"])
+
+
+class StreamingRSI(StreamingIndicator):
+    """RSI con suavizado de Wilder"""
+
+    name = "RSI"
+
+    def __init__(self, period: int = 14, **kwargs):
+        super().__init__(**kwargs)
+        self.period = period
+        self.previous = None
+        self.gain = WilderState(period)
+        self.loss = WilderState(period)
+
+    @property
+    def warmup(self):
+        return self.period + 1
+
+    @staticmethod
+    def rsi(avg_gain, avg_loss):
+        if avg_gain is None or avg_loss is None:
+            return None
+        rs = avg_gain / (avg_loss if avg_loss != 0 else 0.00001)
+        return 100 - (100 / (1 + rs))
+
+    def commit(self, candle):
+        close = candle["close"]
+        previous, self.previous = self.previous, close
+        if previous is None:
+            return None
+        delta = close - previous
+        return self.rsi(self.gain.update(max(delta, 0.0)), self.loss.update(max(-delta, 0.0)))
+
+    def peek(self, candle):
+        if self.previous is None:
+            return None
+        delta = candle["close"] - self.previous
+        return self.rsi(self.gain.next(max(delta, 0.0)), self.loss.next(max(-delta, 0.0)))
+
+
+class StreamingMACD(StreamingIndicator):
+    name = "MACD"
+    fields = ("macd", "signal", "histogram")
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9, **kwargs):
+        super().__init__(**kwargs)
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self.fast = EMAState(fast_period)
+        self.slow = EMAState(slow_period)
+        self.signal = EMAState(signal_period)
+
+    @property
+    def warmup(self):
+        return self.slow_period
+
+    @staticmethod
+    def result(macd, signal):
+        if macd is None:
+            return None
+        return {
+            "macd": macd,
+            "signal": signal,
+            "histogram": macd - signal if signal is not None else None
+        }
+
+    def commit(self, candle):
+        fast = self.fast.update(candle["close"])
+        slow = self.slow.update(candle["close"])
+        if fast is None or slow is None:
+            return None
+        macd = fast - slow
+        return self.result(macd, self.signal.update(macd))
+
+    def peek(self, candle):
+        fast = self.fast.next(candle["close"])
+        slow = self.slow.next(candle["close"])
+        if fast is None or slow is None:
+            return None
+        macd = fast - slow
+        return self.result(macd, self.signal.next(macd))
+
+
+class StreamingBollinger(StreamingIndicator):
+    name = "BOLLINGER"
+    fields = ("upper", "middle", "lower")
+
+    def __init__(self, period: int = 20, num_std: float = 2, **kwargs):
+        super().__init__(**kwargs)
+        self.period = period
+        self.num_std = num_std
+        self.window = RollingWindow(period)
+
+    @property
+    def warmup(self):
+        return self.period
+
+    def result(self, stats):
+        if stats is None:
+            return None
+        middle, std = stats
+        return {
+            "upper": middle + std * self.num_std,
+            "middle": middle,
+            "lower": middle - std * self.num_std
+        }
+
+    def commit(self, candle):
+        return self.result(self.window.update(candle["close"]))
+
+    def peek(self, candle):
+        return self.result(self.window.next(candle["close"]))
+
+
+class StreamingStochastic(StreamingIndicator):
+    name = "STOCHASTIC"
+    fields = ("k", "d")
+
+    def __init__(self, k_period: int = 14, d_period: int = 3, **kwargs):
+        super().__init__(**kwargs)
+        self.k_period = k_period
+        self.highest = RollingExtreme(k_period, max)
+        self.lowest = RollingExtreme(k_period, min)
+        self.d = RollingWindow(d_period)
+
+    @property
+    def warmup(self):
+        return self.k_period
+
+    @staticmethod
+    def k(close, highest, lowest):
+        if highest is None or lowest is None:
+            return None
+        if highest == lowest:
+            return 100.0
+        return (close - lowest) / (highest - lowest) * 100
+
+    def commit(self, candle):
+        k = self.k(candle["close"], self.highest.update(candle["high"]), self.lowest.update(candle["low"]))
+        if k is None:
+            return None
+        d = self.d.update(k)
+        return {"k": k, "d": d[0] if d else None}
+
+    def peek(self, candle):
+        k = self.k(candle["close"], self.highest.next(candle["high"]), self.lowest.next(candle["low"]))
+        if k is None:
+            return None
+        d = self.d.next(k)
+        return {"k": k, "d": d[0] if d else None}
+
+
+def true_range(candle, previous_close):
+    high, low = candle["high"], candle["low"]
+    return max(high - low, abs(high - previous_close), abs(low - previous_close))
+
+
+class StreamingATR(StreamingIndicator):
+    name = "ATR"
+
+    def __init__(self, period: int = 14, **kwargs):
+        super().__init__(**kwargs)
+        self.period = period
+        self.previous_close = None
+        self.atr = WilderState(period)
+
+    @property
+    def warmup(self):
+        return self.period + 1
+
+    def commit(self, candle):
+        previous_close, self.previous_close = self.previous_close, candle["close"]
+        if previous_close is None:
+            return None
+        return self.atr.update(true_range(candle, previous_close))
+
+    def peek(self, candle):
+        if self.previous_close is None:
+            return None
+        return self.atr.next(true_range(candle, self.previous_close))
+
+
+class StreamingADX(StreamingIndicator):
+    name = "ADX"
+    fields = ("adx", "plus_di", "minus_di")
+
+    def __init__(self, period: int = 14, **kwargs):
+        super().__init__(**kwargs)
+        self.period = period
+        self.previous = None
+        self.tr = WilderState(period)
+        self.plus = WilderState(period)
+        self.minus = WilderState(period)
+        self.adx = WilderState(period)
+
+    @property
+    def warmup(self):
+        return 2 * self.period
+
+    def moves(self, candle):
+        previous_high, previous_low, previous_close = self.previous
+        up_move = candle["high"] - previous_high
+        down_move = previous_low - candle["low"]
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+        return true_range(candle, previous_close), plus_dm, minus_dm
+
+    @staticmethod
+    def directional(tr_avg, plus_avg, minus_avg):
+        if tr_avg is None:
+            return None
+        plus_di = plus_avg * 100 / tr_avg if tr_avg else 0.0
+        minus_di = minus_avg * 100 / tr_avg if tr_avg else 0.0
+        di_sum = plus_di + minus_di
+        dx = abs(plus_di - minus_di) / di_sum * 100 if di_sum else 0.0
+        return plus_di, minus_di, dx
+
+    def commit(self, candle):
+        if self.previous is None:
+            self.previous = (candle["high"], candle["low"], candle["close"])
+            return None
+        tr, plus_dm, minus_dm = self.moves(candle)
+        self.previous = (candle["high"], candle["low"], candle["close"])
+        result = self.directional(self.tr.update(tr), self.plus.update(plus_dm), self.minus.update(minus_dm))
+        if result is None:
+            return None
+        plus_di, minus_di, dx = result
+        adx = self.adx.update(dx)
+        if adx is None:
+            return None
+        return {"adx": adx, "plus_di": plus_di, "minus_di": minus_di}
+
+    def peek(self, candle):
+        if self.previous is None:
+            return None
+        tr, plus_dm, minus_dm = self.moves(candle)
+        result = self.directional(self.tr.next(tr), self.plus.next(plus_dm), self.minus.next(minus_dm))
+        if result is None:
+            return None
+        plus_di, minus_di, dx = result
+        adx = self.adx.next(dx)
+        if adx is None:
+            return None
+        return {"adx": adx, "plus_di": plus_di, "minus_di": minus_di}
+
+
+class StreamingIchimoku(StreamingIndicator):
+    name = "ICHIMOKU"
+    fields = ("tenkan", "kijun", "senkou_a", "senkou_b", "chikou")
+
+    def __init__(self, tenkan_period: int = 9, kijun_period: int = 26, senkou_b_period: int = 52, **kwargs):
+        super().__init__(**kwargs)
+        self.senkou_b_period = senkou_b_period
+        self.channels = [
+            (RollingExtreme(period, max), RollingExtreme(period, min))
+            for period in (tenkan_period, kijun_period, senkou_b_period)
+        ]
+
+    @property
+    def warmup(self):
+        return self.senkou_b_period
+
+    @staticmethod
+    def result(lines, candle):
+        tenkan, kijun, senkou_b = lines
+        if senkou_b is None:
+            return None
+        return {
+            "tenkan": tenkan,
+            "kijun": kijun,
+            "senkou_a": (tenkan + kijun) / 2,
+            "senkou_b": senkou_b,
+            # Igual que calculate_ichimoku, que desplaza los mínimos.
+            "chikou": candle["low"]
+        }
+
+    def commit(self, candle):
+        lines = []
+        for highest, lowest in self.channels:
+            high, low = highest.update(candle["high"]), lowest.update(candle["low"])
+            lines.append((high + low) / 2 if high is not None else None)
+        return self.result(lines, candle)
+
+    def peek(self, candle):
+        lines = []
+        for highest, lowest in self.channels:
+            high, low = highest.next(candle["high"]), lowest.next(candle["low"])
+            lines.append((high + low) / 2 if high is not None else None)
+        return self.result(lines, candle)
+
+
+STREAMING_INDICATORS = {
+    "SMA": (StreamingSMA, {"period": "period"}),
+    "EMA": (StreamingEMA, {"period": "period"}),
+    "RSI": (StreamingRSI, {"period": "period"}),
+    "MACD": (StreamingMACD, {
+        "fast_period": "fast_period",
+        "slow_period": "slow_period",
+        "signal_period": "signal_period"
+    }),
+    "BOLLINGER": (StreamingBollinger, {"period": "period", "std": "num_std"}),
+    "STOCHASTIC": (StreamingStochastic, {"k_period": "k_period", "d_period": "d_period"}),
+    "ATR": (StreamingATR, {"period": "period"}),
+    "ADX": (StreamingADX, {"period": "period"}),
+    "ICHIMOKU": (StreamingIchimoku, {
+        "tenkan_period": "tenkan_period",
+        "kijun_period": "kijun_period",
+        "senkou_b_period": "senkou_b_period"
+    }),
+}
+
+
+def create_streaming_indicator(indicator: str, params: Dict = None, decimals: Optional[int] = 2,
+                               history: int = CANDLE_HISTORY) -> StreamingIndicator:
+    """Crea un indicador incremental con los parámetros de ``calculate_indicator``"""
+    entry = STREAMING_INDICATORS.get(indicator.upper())
+    if entry is None:
+        raise ValueError(f"Indicador '{indicator}' no soportado para tiempo real")
+    cls, names = entry
+    params = params or {}
+    kwargs = {argument: params[key] for key, argument in names.items() if key in params}
+    return cls(decimals=decimals, history=history, **kwargs)
@@ -0,0 +1,132 @@
+# quotexapi/utils/ticks.py
+
+import numpy as np
+
+TICK_CAPACITY = 10_000
+
+
+class TickBuffer(object):
+    """Fixed-capacity ring buffer of (time, price) ticks for one asset.
+
+    Every tick is written twice, at ``head`` and ``head + capacity``, so the
+    latest window is always one contiguous slice and :meth:`view` returns
+    NumPy views without copying. Appending is O(1) and memory never grows
+    past ``capacity`` ticks; ``retention`` additionally hides ticks older
+    than that many seconds before the newest one.
+
+    The buffer also behaves as a read-only sequence of ``{"time", "price"}``
+    dicts, so code indexing ``prices[-1]["price"]`` keeps working.
+    """
+
+    __slots__ = ("capacity", "retention", "_times", "_prices", "_head", "_size", "total")
+
+    def __init__(self, capacity=TICK_CAPACITY, retention=None):
+        """
+        :param int capacity: Maximum number of ticks kept.
+        :param float retention: (optional) Seconds of ticks to keep,
+            measured back from the newest tick.
+        """
+        if capacity < 1:
+            raise ValueError("The capacity must be a positive number.")
+        self.capacity = int(capacity)
+        self.retention = retention
+        self._times = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._prices = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        self.total = 0
+
+    def append(self, timestamp, price):
+        head = self._head
+        mirror = head + self.capacity
+        self._times[head] = self._times[mirror] = timestamp
+        self._prices[head] = self._prices[mirror] = price
+        self._head = head + 1 if head + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+        self.total += 1
+
+    def extend(self, ticks):
+        for timestamp, price in ticks:
+            self.append(timestamp, price)
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+    def _window(self):
+        # The newest tick sits just before ``head`` in the mirrored half.
+        end = self._head + self.capacity
+        start = end - self._size
+        if self.retention is not None and self._size:
+            cutoff = self._times[end - 1] - self.retention
+            start += int(np.searchsorted(self._times[start:end], cutoff, side="left"))
+        return start, end
+
+    def view(self, n=None):
+        """Get the latest ticks as zero-copy arrays.
+
+        :param int n: (optional) Number of latest ticks; all kept by default.
+        :returns: tuple of read-only ``times`` and ``prices`` float64 views.
+        """
+        start, end = self._window()
+        if n is not None:
+            start = max(start, end - n)
+        times = self._times[start:end]
+        prices = self._prices[start:end]
+        times.flags.writeable = False
+        prices.flags.writeable = False
+        return times, prices
+
+    def times(self, n=None):
+        return self.view(n)[0]
+
+    def prices(self, n=None):
+        return self.view(n)[1]
+
+    def since(self, timestamp):
+        """Get the ticks newer than ``timestamp`` as zero-copy arrays."""
+        times, prices = self.view()
+        start = int(np.searchsorted(times, timestamp, side="right"))
+        return times[start:], prices[start:]
+
+    def last(self):
+        """Get the newest tick as a dict, or ``None`` when empty."""
+        if not self._size:
+            return None
+        return self[-1]
+
+    def to_list(self, n=None):
+        times, prices = self.view(n)
+        return [
+            {"time": timestamp, "price": price}
+            for timestamp, price in zip(times.tolist(), prices.tolist())
+        ]
+
+    def __len__(self):
+        start, end = self._window()
+        return end - start
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        start, end = self._window()
+        size = end - start
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("tick index out of range")
+        position = start + index
+        return {
+            "time": float(self._times[position]),
+            "price": float(self._prices[position])
+        }
+
+    def __repr__(self):
+        return f"TickBuffer(size={len(self)}, capacity={self.capacity}, retention={self.retention})"
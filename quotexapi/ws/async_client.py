@@ -0,0 +1,111 @@
+# quotexapi/ws/async_client.py
+
+"""Module for Quotex websocket running on the asyncio event loop."""
+import asyncio
+import logging
+from .client import WebsocketClient
+
+try:
+    from websockets.asyncio.client import connect as ws_connect
+    HEADERS_ARGUMENT = "additional_headers"
+except ImportError:  # websockets < 13
+    try:
+        from websockets import connect as ws_connect
+        HEADERS_ARGUMENT = "extra_headers"
+    except ImportError:
+        ws_connect = None
+        HEADERS_ARGUMENT = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWebsocketClient(WebsocketClient):
+    """Class for work with Quotex API websocket on the caller's event loop.
+
+    Frames are handled by the same dispatch table as
+    :class:`WebsocketClient <quotexapi.ws.client.WebsocketClient>`, but
+    directly on the event loop instead of on a websocket thread.
+    """
+
+    def __init__(self, api):
+        """
+        :param api: The instance of :class:`QuotexAPI
+            <quotexapi.api.QuotexAPI>`.
+        """
+        if ws_connect is None:
+            raise ImportError(
+                "The asyncio transport requires the 'websockets' package: pip install websockets"
+            )
+        super().__init__(api)
+        self.connection = None
+        self.task = None
+        self._closing = False
+
+    def create_connection(self):
+        # Callers use ``wss.send``/``wss.close`` as with websocket-client.
+        return self
+
+    async def write(self, data):
+        """Write one frame to the open connection."""
+        await self.connection.send(data)
+
+    async def heartbeat(self, interval, payload):
+        while True:
+            await asyncio.sleep(interval)
+            self.send(payload)
+
+    async def run_forever(self, ssl_context=None, ping_interval=24, ping_payload="2", reconnect=5):
+        """Run the socket.io session until :meth:`close` is called.
+
+        :param ssl_context: (optional) The SSL context for the connection.
+        :param int ping_interval: Seconds between engine.io pings.
+        :param str ping_payload: The engine.io ping frame.
+        :param int reconnect: Seconds to wait before reconnecting; 0 disables.
+        """
+        options = {
+            "origin": self.api.https_url,
+            "max_size": None,
+            "user_agent_header": self.headers["User-Agent"],
+            HEADERS_ARGUMENT: {},
+        }
+        if self.api.wss_url.startswith("wss://"):
+            options["ssl"] = ssl_context
+        while not self._closing:
+            heartbeat = None
+            try:
+                async with ws_connect(self.api.wss_url, **options) as connection:
+                    self.connection = connection
+                    self.on_open(self)
+                    heartbeat = asyncio.create_task(self.heartbeat(ping_interval, ping_payload))
+                    async for message in connection:
+                        self.on_message(self, message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.on_error(self, e)
+            finally:
+                if heartbeat:
+                    heartbeat.cancel()
+                self.connection = None
+                self.on_close(self, None, None)
+            if self._closing or not reconnect:
+                break
+            await asyncio.sleep(reconnect)
+
+    def start(self, **kwargs):
+        self._closing = False
+        self.task = asyncio.get_running_loop().create_task(self.run_forever(**kwargs))
+        return self.task
+
+    def close(self):
+        self._closing = True
+        if self.task is None or self.task.done():
+            return
+        if self.connection is not None:
+            # Let the session end with a normal close frame.
+            self.task.get_loop().create_task(self.connection.close())
+        else:
+            self.task.cancel()
+
+    def is_alive(self):
+        return self.task is not None and not self.task.done()
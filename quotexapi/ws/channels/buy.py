@@ -10,7 +10,18 @@ class Buy(Base):
 
     name = "buy"
 
-    def __call__(self, price, asset, direction, duration, request_id, is_fast_option):
+    def __call__(self, price, asset, direction, duration, request_id, is_fast_option, follow=True):
+        """Method to send an order to the buy websocket channel.
+
+        :param price: The order amount.
+        :param asset: The asset symbol.
+        :param direction: ``call`` or ``put``.
+        :param duration: The order duration in seconds.
+        :param request_id: The id the confirmation is correlated by.
+        :param is_fast_option: Whether the order uses a fixed expiration time.
+        :param follow: Send ``depth/follow`` and ``tick`` before the order;
+            callers that already follow the asset can skip them.
+        """
         option_type = 100
 
         if "_otc" not in asset or is_fast_option:
@@ -30,8 +41,9 @@ class Buy(Base):
 
             duration = expiration_time
 
-        data = f'42["depth/follow", f"{asset}"]'
-        self.send_websocket_request(data)
+        if follow:
+            data = f'42["depth/follow", {json.dumps(asset)}]'
+            self.send_websocket_request(data)
 
         payload = {
             "asset": asset,
@@ -44,8 +56,9 @@ class Buy(Base):
             "optionType": option_type
         }
 
-        data = f'42["tick"]'
-        self.send_websocket_request(data)
+        if follow:
+            data = f'42["tick"]'
+            self.send_websocket_request(data)
 
         data = f'42["orders/open",{json.dumps(payload)}]'
         self.send_websocket_request(data)
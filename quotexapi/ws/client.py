@@ -1,14 +1,23 @@
 # quotexapi/ws/client.py
 
 """Module for Quotex websocket."""
-import json
 import time
 import logging
 import websocket
-from .. import global_value
+from .decoder import decode_text, decode_binary
 
 logger = logging.getLogger(__name__)
 
+TICK_SECONDS = frozenset((0, 5, 10, 15, 20, 30, 40, 50))
+
+
+def history_index(index):
+    """Get the request id echoed by a ``history/load`` response."""
+    try:
+        return int(index)
+    except (TypeError, ValueError):
+        return index
+
 
 class WebsocketClient(object):
     """Class for work with Quotex API websocket."""
@@ -26,8 +35,22 @@ class WebsocketClient(object):
             "Host": f"ws2.{self.api.host}",
         }
 
+        self.wss = self.create_connection()
+        self._pending_event = None
+        self._last_tick = None
+        self.handlers = {
+            "s_authorization": self.on_authorization,
+            "authorization/reject": self.on_authorization_reject,
+            "instruments/list": self.on_instruments,
+            "settings/list": self.on_settings,
+            "history/list/v2": self.on_history,
+            "quotes/stream": self.on_quotes,
+        }
+
+    def create_connection(self):
+        """Create the underlying websocket connection object."""
         websocket.enableTrace(self.api.trace_ws)
-        self.wss = websocket.WebSocketApp(
+        return websocket.WebSocketApp(
             self.api.wss_url,
             on_message=self.on_message,
             on_error=self.on_error,
@@ -39,151 +62,243 @@ class WebsocketClient(object):
             # cookie=self.api.cookies
         )
 
+    def register(self, event, handler):
+        """Register the handler for a socket.io event payload.
+
+        :param str event: The socket.io event name, e.g. ``quotes/stream``.
+        :param handler: Callable receiving the decoded event payload.
+        """
+        self.handlers[event] = handler
+
     def on_message(self, wss, message):
         """Method to process websocket messages."""
-        global_value.ssl_Mutual_exclusion = True
-        current_time = time.localtime()
-        if current_time.tm_sec in [0, 5, 10, 15, 20, 30, 40, 50]:
-            self.wss.send('42["tick"]')
+        self.send_tick()
         try:
-            if "authorization/reject" in str(message):
-                logger.debug("Token rejected, making automatic reconnection.")
-                global_value.check_rejected_connection = 1
-            elif "s_authorization" in str(message):
-                global_value.check_accepted_connection = 1
-                global_value.check_rejected_connection = 0
-            elif "instruments/list" in str(message):
-                global_value.started_listen_instruments = True
-
-            try:
-                message = message[1:].decode()
-                logger.debug(message)
-                message = json.loads(message)
-                self.api.wss_message = message
-                if "call" in str(message) or 'put' in str(message):
-                    self.api.instruments = message
-                if isinstance(message, dict):
-                    if message.get("signals"):
-                        time_in = message.get("time")
-                        for i in message["signals"]:
-                            try:
-                                self.api.signal_data[i[0]] = {}
-                                self.api.signal_data[i[0]][i[2]] = {}
-                                self.api.signal_data[i[0]][i[2]]["dir"] = i[1][0]["signal"]
-                                self.api.signal_data[i[0]][i[2]]["duration"] = i[1][0]["timeFrame"]
-                            except:
-                                self.api.signal_data[i[0]] = {}
-                                self.api.signal_data[i[0]][time_in] = {}
-                                self.api.signal_data[i[0]][time_in]["dir"] = i[1][0][1]
-                                self.api.signal_data[i[0]][time_in]["duration"] = i[1][0][0]
-                    elif message.get("liveBalance") or message.get("demoBalance"):
-                        self.api.account_balance = message
-                    elif message.get("position"):
-                        self.api.top_list_leader = message
-                    elif len(message) == 1 and message.get("profit", -1) > -1:
-                        self.api.profit_today = message
-                    elif message.get("index"):
-                        self.api.historical_candles = message
-                        self.api.timesync.server_timestamp = message.get("closeTimestamp")
-                    if message.get("pending"):
-                        self.api.pending_successful = message
-                        self.api.pending_id = message["pending"]["ticket"]
-                    elif message.get("id") and not message.get("ticket"):
-                        self.api.buy_successful = message
-                        self.api.buy_id = message["id"]
-                        self.api.timesync.server_timestamp = message.get("closeTimestamp")
-                    elif message.get("ticket") and not message.get("id"):
-                        self.api.sold_options_respond = message
-                    elif message.get("deals"):
-                        for get_m in message["deals"]:
-                            self.api.profit_in_operation = get_m["profit"]
-                            get_m["win"] = True if message["profit"] > 0 else False
-                            get_m["game_state"] = 1
-                            self.api.listinfodata.set(
-                                get_m["win"],
-                                get_m["game_state"],
-                                get_m["id"]
-                            )
-                    elif message.get("isDemo") and message.get("balance"):
-                        self.api.training_balance_edit_request = message
-                    elif message.get("error"):
-                        global_value.websocket_error_reason = message.get("error")
-                        global_value.check_websocket_if_error = True
-                        if global_value.websocket_error_reason == "not_money":
-                            self.api.account_balance = {"liveBalance": 0}
-                    elif not message.get("list") == []:
-                        self.api.wss_message = message
-            except:
-                pass
-
-            if str(message) == "41":
-                logger.info("Disconnection event triggered by the platform, causing automatic reconnection.")
-                global_value.check_websocket_if_connect = 0
-            if "51-" in str(message):
-                self.api._temp_status = str(message)
-            elif self.api._temp_status == """451-["settings/list",{"_placeholder":true,"num":0}]""":
-                self.api.settings_list = message
-                self.api._temp_status = ""
-            elif self.api._temp_status == """451-["history/list/v2",{"_placeholder":true,"num":0}]""":
-                if message.get("asset") == self.api.current_asset:
-                    self.api.candles.candles_data = message["history"]
-                    self.api.candle_v2_data[message["asset"]] = message
-                    self.api.candle_v2_data[message["asset"]]["candles"] = [{
-                        "time": candle[0],
-                        "open": candle[1],
-                        "close": candle[2],
-                        "high": candle[3],
-                        "low": candle[4],
-                        "ticks": candle[5]
-                    } for candle in message["candles"]]
-            elif len(message[0]) == 4:
-                result = {
-                    "time": message[0][1],
-                    "price": message[0][2]
+            if isinstance(message, bytes):
+                self.on_binary(message)
+            else:
+                self.on_text(message)
+        except Exception:
+            logger.debug("Failed to process websocket message.", exc_info=True)
+
+    def send(self, data):
+        """Queue a frame behind the api writer."""
+        self.api.writer.put(data)
+
+    def send_tick(self):
+        """Keep the session warm with a tick on the platform's schedule."""
+        now = int(time.time())
+        if now != self._last_tick and now % 60 in TICK_SECONDS:
+            self._last_tick = now
+            self.send('42["tick"]')
+
+    def on_text(self, message):
+        """Method to process socket.io text frames."""
+        packet = decode_text(message)
+        if packet.is_binary_event:
+            # The payload follows in the next binary frame.
+            self._pending_event = packet.event
+            if packet.event == "instruments/list":
+                self.api.state.started_listen_instruments = True
+        elif packet.is_event:
+            handler = self.handlers.get(packet.event)
+            if handler is not None:
+                handler(packet.data)
+        elif packet.is_disconnect:
+            logger.info("Disconnection event triggered by the platform, causing automatic reconnection.")
+            self.api.state.check_websocket_if_connect = 0
+
+    def on_binary(self, message):
+        """Method to process socket.io binary attachments."""
+        event = self._pending_event
+        self._pending_event = None
+        data = decode_binary(message)
+        logger.debug(data)
+        self.api.wss_message = data
+        self.handlers.get(event, self.on_payload)(data)
+
+    def on_authorization(self, data):
+        self.api.state.check_accepted_connection = 1
+        self.api.state.check_rejected_connection = 0
+
+    def on_authorization_reject(self, data):
+        logger.debug("Token rejected, making automatic reconnection.")
+        self.api.state.check_rejected_connection = 1
+
+    def on_instruments(self, data):
+        self.api.instrument_table.update(data)
+        self.api.instruments = data
+
+    def on_settings(self, data):
+        self.on_payload(data)
+        self.api.settings_list = data
+
+    def on_history(self, data):
+        self.on_payload(data)
+        asset = data.get("asset")
+        data["candles"] = [{
+            "time": candle[0],
+            "open": candle[1],
+            "close": candle[2],
+            "high": candle[3],
+            "low": candle[4],
+            "ticks": candle[5]
+        } for candle in data["candles"]]
+        self.api.candle_v2_data[asset] = data
+        if asset == self.api.current_asset:
+            self.api.candles.candles_data = data["history"]
+        # Snapshot reads wait on (asset, period); one without a period is
+        # for the only read of the asset, as they run one at a time.
+        period = data.get("period")
+        for key in self.api.pending.keys("history/list/v2"):
+            if key[0] == asset and (period is None or key[1] == period):
+                self.api.pending.resolve("history/list/v2", key, data)
+
+    def on_quotes(self, data):
+        for tick in data:
+            if len(tick) == 4:
+                self.on_tick(tick)
+
+    def on_tick(self, tick):
+        prices = self.api.realtime_price.get(tick[0])
+        if prices is None:
+            return
+        prices.append(tick[1], tick[2])
+        self.api.realtime_price_data.append(tick)
+        builder = self.api.candle_builders.get(tick[0])
+        if builder is not None:
+            builder.update(tick[1], tick[2])
+
+    def on_sentiment(self, data):
+        for item in data:
+            self.api.realtime_sentiment[item[0]] = {
+                "sentiment": {
+                    "sell": 100 - int(item[1]),
+                    "buy": int(item[1])
                 }
-                self.api.realtime_price[message[0][0]].append(result)
-                self.api.realtime_price_data.append(message[0])
-            elif len(message[0]) == 2:
-                for i in message:
-                    result = {
-                        "sentiment": {
-                            "sell": 100 - int(i[1]),
-                            "buy": int(i[1])
-                        }
-                    }
-                    self.api.realtime_sentiment[i[0]] = result
-        except:
-            pass
-        global_value.ssl_Mutual_exclusion = False
+            }
+
+    def on_payload(self, data):
+        """Route a payload whose event has no dedicated handler by its shape."""
+        if isinstance(data, dict):
+            self.on_dict(data)
+        elif isinstance(data, list) and data and isinstance(data[0], list):
+            size = len(data[0])
+            if size == 4:
+                self.on_quotes(data)
+            elif size == 2:
+                self.on_sentiment(data)
+
+    def on_dict(self, message):
+        if message.get("signals"):
+            time_in = message.get("time")
+            for i in message["signals"]:
+                try:
+                    self.api.signal_data[i[0]] = {}
+                    self.api.signal_data[i[0]][i[2]] = {}
+                    self.api.signal_data[i[0]][i[2]]["dir"] = i[1][0]["signal"]
+                    self.api.signal_data[i[0]][i[2]]["duration"] = i[1][0]["timeFrame"]
+                except:
+                    self.api.signal_data[i[0]] = {}
+                    self.api.signal_data[i[0]][time_in] = {}
+                    self.api.signal_data[i[0]][time_in]["dir"] = i[1][0][1]
+                    self.api.signal_data[i[0]][time_in]["duration"] = i[1][0][0]
+        elif message.get("liveBalance") or message.get("demoBalance"):
+            self.api.account_balance = message
+            self.api.pending.resolve_all("balance", message)
+        elif message.get("position"):
+            self.api.top_list_leader = message
+        elif len(message) == 1 and message.get("profit", -1) > -1:
+            self.api.profit_today = message
+        elif message.get("index"):
+            self.api.historical_candles = message
+            self.api.timesync.server_timestamp = message.get("closeTimestamp")
+            # Several loads can be in flight: a reply goes only to its own index.
+            if not self.api.pending.resolve("history/load", history_index(message["index"]), message):
+                logger.debug(f"Unmatched history/load response: {message['index']}")
+        if message.get("pending"):
+            self.api.pending_successful = message
+            self.api.pending_id = message["pending"]["ticket"]
+            self.api.pending.resolve("pending/create", None, message)
+        elif message.get("id") and not message.get("ticket"):
+            self.api.buy_successful = message
+            self.api.buy_id = message["id"]
+            self.api.timesync.server_timestamp = message.get("closeTimestamp")
+            if self.api.pending.resolve("orders/open", message.get("requestId"), message):
+                # Only the confirmation of an order this client sent.
+                self.api.open_orders[message["id"]] = message
+        elif message.get("ticket") and not message.get("id"):
+            self.api.sold_options_respond = message
+            self.api.pending.resolve("orders/cancel", message["ticket"], message)
+        elif message.get("deals"):
+            for get_m in message["deals"]:
+                self.api.open_orders.pop(get_m["id"], None)
+                self.api.profit_in_operation = get_m["profit"]
+                get_m["win"] = True if message["profit"] > 0 else False
+                get_m["game_state"] = 1
+                self.api.listinfodata.set(
+                    get_m["win"],
+                    get_m["game_state"],
+                    get_m["id"]
+                )
+        elif message.get("isDemo") and message.get("balance"):
+            self.api.training_balance_edit_request = message
+            self.api.pending.resolve("demo/refill", None, message)
+        elif message.get("error"):
+            self.api.state.websocket_error_reason = message.get("error")
+            self.api.state.check_websocket_if_error = True
+            if self.api.state.websocket_error_reason == "not_money":
+                self.api.account_balance = {"liveBalance": 0}
+            self.on_request_error(message)
+
+    def on_request_error(self, message):
+        """Fail the request an error frame belongs to, when that is certain.
+
+        Errors usually carry no request id: one is tied to an order only if
+        that order is the single request in flight. Otherwise the error
+        stays in ``state`` and the requests wait for their own confirmation
+        or timeout.
+        """
+        pending = self.api.pending
+        if message.get("requestId") is not None:
+            if pending.resolve("orders/open", message["requestId"], message):
+                return
+        orders = pending.count("orders/open")
+        pendings = pending.count("pending/create")
+        if orders + pendings != 1:
+            if orders + pendings:
+                logger.warning(f"Error not tied to a request: {message.get('error')}")
+            return
+        pending.resolve("orders/open" if orders else "pending/create", None, message)
 
     def on_error(self, wss, error):
         """Method to process websocket errors."""
         logger.error(error)
-        global_value.websocket_error_reason = str(error)
-        global_value.check_websocket_if_error = True
+        self.api.state.websocket_error_reason = str(error)
+        self.api.state.check_websocket_if_error = True
 
     def on_open(self, wss):
         """Method to process websocket open."""
         logger.info("Websocket client connected.")
-        global_value.check_websocket_if_connect = 1
+        self.api.state.check_websocket_if_connect = 1
         asset_name = self.api.current_asset
         period = self.api.current_period
-        self.wss.send('42["tick"]')
-        self.wss.send('42["indicator/list"]')
-        self.wss.send('42["drawing/load"]')
-        self.wss.send('42["pending/list"]')
-        self.wss.send('42["instruments/update",{"asset":"%s","period":%d}]' % (asset_name, period))
-        self.wss.send('42["depth/follow","%s"]' % asset_name)
-        self.wss.send('42["chart_notification/get"]')
-        self.wss.send('42["tick"]')
+        self.send('42["tick"]')
+        self.send('42["indicator/list"]')
+        self.send('42["drawing/load"]')
+        self.send('42["pending/list"]')
+        self.send('42["instruments/update",{"asset":"%s","period":%d}]' % (asset_name, period))
+        self.send('42["depth/follow","%s"]' % asset_name)
+        self.send('42["chart_notification/get"]')
+        self.send('42["tick"]')
 
     def on_close(self, wss, close_status_code, close_msg):
         """Method to process websocket close."""
         logger.info("Websocket connection closed.")
-        global_value.check_websocket_if_connect = 0
+        self.api.state.check_websocket_if_connect = 0
 
     def on_ping(self, wss, ping_msg):
         pass
 
     def on_pong(self, wss, pong_msg):
-        self.wss.send("2")
+        self.send("2")
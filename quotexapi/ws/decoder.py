@@ -0,0 +1,107 @@
+# quotexapi/ws/decoder.py
+
+"""Module for decoding Quotex socket.io frames."""
+import json
+
+# Engine.io packet types (EIO=3).
+ENGINE_OPEN = "0"
+ENGINE_CLOSE = "1"
+ENGINE_PING = "2"
+ENGINE_PONG = "3"
+ENGINE_MESSAGE = "4"
+
+# Socket.io packet types carried inside an engine.io message.
+SOCKET_CONNECT = "0"
+SOCKET_DISCONNECT = "1"
+SOCKET_EVENT = "2"
+SOCKET_ACK = "3"
+SOCKET_ERROR = "4"
+SOCKET_BINARY_EVENT = "5"
+
+BINARY_MARKER = 4
+
+_json_decode = json.JSONDecoder().decode
+
+
+class Packet(object):
+    """Class for a decoded socket.io text frame."""
+
+    __slots__ = ("engine_type", "socket_type", "event", "data", "attachments")
+
+    def __init__(self, engine_type, socket_type=None, event=None, data=None, attachments=0):
+        self.engine_type = engine_type
+        self.socket_type = socket_type
+        self.event = event
+        self.data = data
+        self.attachments = attachments
+
+    @property
+    def is_event(self):
+        return self.socket_type == SOCKET_EVENT
+
+    @property
+    def is_binary_event(self):
+        return self.socket_type == SOCKET_BINARY_EVENT
+
+    @property
+    def is_disconnect(self):
+        return self.socket_type == SOCKET_DISCONNECT
+
+    def __repr__(self):
+        return (
+            f"Packet(engine_type={self.engine_type!r}, socket_type={self.socket_type!r}, "
+            f"event={self.event!r}, attachments={self.attachments})"
+        )
+
+
+def decode_text(message):
+    """Decode a socket.io text frame once.
+
+    :param str message: The raw text frame, e.g. ``42["tick"]`` or
+        ``451-["quotes/stream",{"_placeholder":true,"num":0}]``.
+    :returns: The instance of :class:`Packet <quotexapi.ws.decoder.Packet>`.
+    """
+    if not message:
+        return Packet(None)
+    engine_type = message[0]
+    if engine_type != ENGINE_MESSAGE or len(message) < 2:
+        return Packet(engine_type)
+
+    socket_type = message[1]
+    if socket_type != SOCKET_EVENT and socket_type != SOCKET_BINARY_EVENT:
+        return Packet(engine_type, socket_type)
+
+    body = message[2:]
+    attachments = 0
+    if socket_type == SOCKET_BINARY_EVENT:
+        dash = body.find("-")
+        if dash > 0:
+            attachments = int(body[:dash])
+            body = body[dash + 1:]
+
+    # Skip an optional namespace or ack id before the JSON array.
+    start = body.find("[")
+    if start < 0:
+        return Packet(engine_type, socket_type, attachments=attachments)
+
+    if attachments and body.startswith('["', start):
+        # Binary headers only carry placeholders, so the name is all we need.
+        end = body.find('"', start + 2)
+        return Packet(engine_type, socket_type, body[start + 2:end], None, attachments)
+
+    args = _json_decode(body[start:])
+    event = args[0] if args else None
+    data = args[1] if len(args) > 1 else None
+    return Packet(engine_type, socket_type, event, data, attachments)
+
+
+def decode_binary(message):
+    """Decode a binary attachment frame into its JSON payload.
+
+    :param bytes message: The raw binary frame; the first byte is the
+        engine.io message marker.
+    :returns: The decoded JSON payload.
+    """
+    if message and message[0] == BINARY_MARKER:
+        message = message[1:]
+    return _json_decode(message.decode())
@@ -0,0 +1,31 @@
+# quotexapi/ws/objects/connection.py
+
+"""Module for Quotex Connection websocket object."""
+
+from quotexapi.ws.objects.base import Base
+
+
+class ConnectionState(Base):
+    """Class for the session and websocket status of one client.
+
+    Each :class:`QuotexAPI <quotexapi.api.QuotexAPI>` owns one, so several
+    accounts can be connected from the same process and event loop.
+    """
+
+    def __init__(self):
+        super(ConnectionState, self).__init__()
+        self.__name = "connectionState"
+        self.ssid = None
+        self.check_websocket_if_connect = None
+        self.started_listen_instruments = True
+        self.check_rejected_connection = False
+        self.check_accepted_connection = False
+        self.check_websocket_if_error = False
+        self.websocket_error_reason = None
+        self.balance_id = None
+
+    def reset_websocket(self):
+        """Forget the status of the previous websocket connection."""
+        self.check_websocket_if_connect = None
+        self.check_websocket_if_error = False
+        self.websocket_error_reason = None
@@ -0,0 +1,163 @@
+# quotexapi/ws/objects/instruments.py
+
+"""Module for Quotex Instruments websocket object."""
+import logging
+from collections import namedtuple
+from quotexapi.ws.objects.base import Base
+
+logger = logging.getLogger(__name__)
+
+# Fields compared between snapshots; ``listed`` flags assets added or removed.
+CHANGE_FIELDS = ("open", "payment", "turbo_payment", "profit_24h", "profit_1m", "profit_5m")
+
+InstrumentChange = namedtuple("InstrumentChange", ("asset", "field", "old", "new"))
+
+
+class Instrument(object):
+    """Class for one asset of the ``instruments/list`` payload."""
+
+    __slots__ = (
+        "id",
+        "symbol",
+        "name",
+        "payment",
+        "open",
+        "turbo_payment",
+        "profit_24h",
+        "profit_1m",
+        "profit_5m",
+        "row"
+    )
+
+    def __init__(self, row):
+        self.update(row)
+
+    def update(self, row):
+        """Refresh the fields in place from an ``instruments/list`` row.
+
+        :returns: list of :class:`InstrumentChange` for the fields of
+            ``CHANGE_FIELDS`` whose value changed.
+        """
+        before = [getattr(self, field, None) for field in CHANGE_FIELDS]
+        self.id = row[0]
+        self.symbol = row[1]
+        self.name = row[2].replace("\n", "")
+        self.payment = row[5]
+        self.open = row[14]
+        self.turbo_payment = row[18]
+        self.profit_24h = row[-10]
+        self.profit_1m = row[-9]
+        self.profit_5m = row[-8]
+        self.row = row
+        return [
+            InstrumentChange(self.symbol, field, old, getattr(self, field))
+            for field, old in zip(CHANGE_FIELDS, before)
+            if getattr(self, field) != old
+        ]
+
+    @property
+    def profit(self):
+        return {
+            "24H": self.profit_24h,
+            "1M": self.profit_1m,
+            "5M": self.profit_5m
+        }
+
+    def payment_data(self):
+        """Get the asset as in :meth:`Quotex.get_payment`."""
+        return {
+            "turbo_payment": self.turbo_payment,
+            "payment": self.payment,
+            "profit": {
+                "1M": self.profit_1m,
+                "5M": self.profit_5m
+            },
+            "open": self.open
+        }
+
+    def __repr__(self):
+        return f"Instrument({self.symbol!r}, payment={self.payment}, open={self.open})"
+
+
+class Instruments(Base):
+    """Class for the Quotex instruments, indexed by symbol and id.
+
+    Every ``instruments/list`` snapshot updates the records of the assets
+    already known in place, so references to them stay current, and is
+    diffed against the previous one: the listeners get only the changes.
+    """
+
+    def __init__(self):
+        super(Instruments, self).__init__()
+        self.__name = "instruments"
+        self.by_symbol = {}
+        self.by_id = {}
+        self.loaded = False
+        self.listeners = []
+
+    def add_listener(self, callback):
+        """Call ``callback(change)`` with every :class:`InstrumentChange`.
+
+        It runs on the thread receiving the websocket messages.
+        """
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def update(self, rows):
+        """Apply an ``instruments/list`` snapshot.
+
+        Assets missing from the snapshot are dropped. The first snapshot
+        only loads the table and reports no changes.
+
+        :returns: list of :class:`InstrumentChange`.
+        """
+        changes = []
+        by_symbol = {}
+        for row in rows:
+            if not isinstance(row, list) or len(row) < 19:
+                continue
+            instrument = self.by_symbol.get(row[1])
+            if instrument is None:
+                instrument = Instrument(row)
+                if self.loaded:
+                    changes.append(InstrumentChange(instrument.symbol, "listed", False, True))
+            else:
+                changes += instrument.update(row)
+            by_symbol[instrument.symbol] = instrument
+        changes += [
+            InstrumentChange(symbol, "listed", True, False)
+            for symbol in self.by_symbol if symbol not in by_symbol
+        ]
+        self.by_symbol = by_symbol
+        self.by_id = {instrument.id: instrument for instrument in by_symbol.values()}
+        self.loaded = True
+        self.notify(changes)
+        return changes
+
+    def notify(self, changes):
+        for change in changes:
+            for callback in list(self.listeners):
+                try:
+                    callback(change)
+                except Exception:
+                    logger.exception("Instrument listener failed.")
+
+    def get(self, symbol):
+        """Get the :class:`Instrument` of ``symbol``, or ``None``."""
+        return self.by_symbol.get(symbol)
+
+    def get_by_id(self, instrument_id):
+        return self.by_id.get(instrument_id)
+
+    def __contains__(self, symbol):
+        return symbol in self.by_symbol
+
+    def __iter__(self):
+        return iter(list(self.by_symbol.values()))
+
+    def __len__(self):
+        return len(self.by_symbol)
@@ -0,0 +1,138 @@
+# quotexapi/ws/pending.py
+
+"""Module for correlating Quotex websocket requests with their responses."""
+import asyncio
+import itertools
+import threading
+from collections import OrderedDict
+
+
+class PendingRequests(object):
+    """Class for the registry of requests waiting on a websocket response.
+
+    Requests are grouped by ``kind`` (usually the socket.io event) and keyed
+    by whatever the response echoes back: ``requestId``, ticket, asset or
+    history index. The websocket handlers resolve the waiting futures
+    directly, from either the event loop or the websocket thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._anonymous = itertools.count()
+
+    def create(self, kind, key=None):
+        """Register a request and get the future its response resolves.
+
+        :param str kind: The request kind, e.g. ``orders/open``.
+        :param key: (optional) The correlation key; requests without one
+            are resolved in FIFO order.
+        :returns: The instance of :class:`asyncio.Future`.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if key is None:
+            key = ("anonymous", next(self._anonymous))
+        with self._lock:
+            waiting = self._pending.setdefault(kind, OrderedDict())
+            waiting.setdefault(key, []).append((future, loop))
+        future.pending_key = (kind, key)
+        return future
+
+    def resolve(self, kind, key=None, result=None, fallback=False):
+        """Resolve the requests waiting on ``key``.
+
+        :param str kind: The request kind.
+        :param key: (optional) The correlation key from the response; when
+            missing the oldest request of ``kind`` is resolved.
+        :param result: The response to deliver.
+        :param bool fallback: Resolve the oldest request when ``key`` is
+            not registered.
+        :returns: True if any request was resolved.
+        """
+        with self._lock:
+            waiting = self._pending.get(kind)
+            if not waiting:
+                return False
+            entries = waiting.pop(key, None) if key is not None else None
+            if entries is None:
+                if key is not None and not fallback:
+                    return False
+                _, entries = waiting.popitem(last=False)
+        for future, loop in entries:
+            self._settle(future, loop, result)
+        return True
+
+    def resolve_all(self, kind, result=None):
+        """Resolve every request of ``kind`` with the same response."""
+        with self._lock:
+            waiting = self._pending.pop(kind, None)
+        if not waiting:
+            return False
+        for entries in waiting.values():
+            for future, loop in entries:
+                self._settle(future, loop, result)
+        return True
+
+    def discard(self, future):
+        """Forget a request, e.g. after it timed out."""
+        kind, key = future.pending_key
+        with self._lock:
+            waiting = self._pending.get(kind)
+            if not waiting or key not in waiting:
+                return
+            entries = [entry for entry in waiting[key] if entry[0] is not future]
+            if entries:
+                waiting[key] = entries
+            else:
+                del waiting[key]
+
+    def keys(self, kind):
+        """Get the keys with requests of ``kind`` waiting, oldest first."""
+        with self._lock:
+            return list(self._pending.get(kind, {}))
+
+    def count(self, kind=None):
+        """Get the number of requests waiting, overall or for ``kind``."""
+        with self._lock:
+            if kind is not None:
+                return sum(len(entries) for entries in self._pending.get(kind, {}).values())
+            return sum(
+                len(entries)
+                for waiting in self._pending.values()
+                for entries in waiting.values()
+            )
+
+    async def wait(self, future, timeout=None):
+        """Wait for a response; ``None`` if it did not arrive in time.
+
+        The request is forgotten however the wait ends, so a waiter that
+        timed out or was cancelled never takes a later response.
+        """
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self.discard(future)
+
+    @staticmethod
+    def _settle(future, loop, result):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            if not future.done():
+                future.set_result(result)
+        else:
+            try:
+                loop.call_soon_threadsafe(_set_result, future, result)
+            except RuntimeError:
+                # The waiting loop is already closed.
+                pass
+
+
+def _set_result(future, result):
+    if not future.done():
+        future.set_result(result)
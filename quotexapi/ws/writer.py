@@ -0,0 +1,221 @@
+# quotexapi/ws/writer.py
+
+"""Module for the Quotex websocket outbound queue."""
+import time
+import heapq
+import asyncio
+import logging
+import itertools
+import threading
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+PRIORITY_EVENTS = {
+    "orders/open": PRIORITY_HIGH,
+    "orders/cancel": PRIORITY_HIGH,
+}
+
+# Frames the next orders depend on, e.g. the expiration of a fast option:
+# frames put after one of them never overtake it.
+BARRIER_EVENTS = {
+    "settings/store",
+    "depth/follow",
+}
+
+
+def event_name(data):
+    """Get the socket.io event name of an outbound ``42[...]`` frame."""
+    if data.startswith('42["'):
+        end = data.find('"', 4)
+        if end > 0:
+            return data[4:end]
+    return None
+
+
+def priority_of(data):
+    """Get the send priority of an outbound frame; lower goes first."""
+    return PRIORITY_EVENTS.get(event_name(data), PRIORITY_NORMAL)
+
+
+class WebsocketWriter(object):
+    """Class for the single writer draining the outbound websocket queue."""
+
+    def __init__(self, send):
+        """
+        :param send: Callable writing one frame to the socket.
+        """
+        self.send = send
+        self._queue = []
+        self._sequence = itertools.count()
+        self._barrier = None
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self.sent = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def depth(self):
+        """Property to get the number of frames waiting to be sent."""
+        return len(self._queue)
+
+    def put(self, data, priority=None):
+        """Queue a frame for sending.
+
+        :param str data: The websocket frame.
+        :param int priority: (optional) Send priority, lower goes first.
+            Defaults to the priority of the frame's event. A frame never
+            goes before a barrier frame queued ahead of it.
+        """
+        if priority is None:
+            priority = priority_of(data)
+        with self._condition:
+            key = (priority, next(self._sequence))
+            if self._barrier is not None and key < self._barrier:
+                # Right after the barrier, still ahead of the frames behind it.
+                key = self._barrier + key[1:]
+            if event_name(data) in BARRIER_EVENTS:
+                self._barrier = key
+            heapq.heappush(self._queue, (key, time.perf_counter(), data))
+            if len(self._queue) > self.max_depth:
+                self.max_depth = len(self._queue)
+            self._condition.notify()
+
+    def get(self):
+        """Wait for the next frame to send; ``None`` once stopped."""
+        with self._condition:
+            while self._running and not self._queue:
+                self._condition.wait()
+            return self.pop()
+
+    def pop(self):
+        """Take the next frame without waiting; ``None`` if the queue is empty."""
+        with self._condition:
+            if not self._queue:
+                return None
+            key, queued_at, data = heapq.heappop(self._queue)
+            if key == self._barrier:
+                self._barrier = None
+        self.record_wait(time.perf_counter() - queued_at)
+        return data
+
+    def record_wait(self, waited):
+        self.wait_time += waited
+        if waited > self.max_wait:
+            self.max_wait = waited
+
+    def write(self, data):
+        try:
+            self.send(data)
+            self.sent += 1
+            logger.debug(data)
+        except Exception as e:
+            self.dropped += 1
+            logger.error(f"Websocket send failed: {e}")
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self.run, name="quotex-writer")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def run(self):
+        while True:
+            data = self.get()
+            if data is None:
+                break
+            self.write(data)
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._queue.clear()
+            self._barrier = None
+            self._condition.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def stats(self):
+        """Get the queue counters.
+
+        :returns: dict with depth, max_depth, sent, dropped and the total,
+            average and maximum seconds frames waited in the queue.
+        """
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "wait_time": self.wait_time,
+            "avg_wait": self.wait_time / self.sent if self.sent else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class AsyncWebsocketWriter(WebsocketWriter):
+    """Class for the outbound queue drained by a task on the event loop."""
+
+    def __init__(self, send, loop):
+        """
+        :param send: Coroutine function writing one frame to the socket.
+        :param loop: The event loop running the websocket session.
+        """
+        super().__init__(send)
+        self.loop = loop
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def put(self, data, priority=None):
+        super().put(data, priority)
+        if self._in_loop():
+            self._wakeup.set()
+        else:
+            self.loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _in_loop(self):
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    async def write(self, data):
+        try:
+            await self.send(data)
+            self.sent += 1
+            logger.debug(data)
+        except Exception as e:
+            self.dropped += 1
+            logger.error(f"Websocket send failed: {e}")
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._task = self.loop.create_task(self.run())
+
+    async def run(self):
+        while self._running:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            data = self.pop()
+            while data is not None:
+                await self.write(data)
+                data = self.pop()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._queue.clear()
+            self._barrier = None
+        if self._task:
+            self._task.cancel()
+        self._task = None
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Append and range lookup checks for CandleArchive"""
+
+import random
+import numpy as np
+import pytest
+from quotexapi.utils.candle_archive import CandleArchive
+
+PERIOD = 60
+
+
+def make_candles(count, start=1700000000, seed=7):
+    rng = np.random.default_rng(seed)
+    closes = np.round(1.08 + np.cumsum(rng.normal(0.0, 1e-4, count)), 5)
+    return [
+        {"time": start + i * PERIOD, "open": close, "high": close + 1e-4,
+         "low": close - 1e-4, "close": close, "ticks": 30}
+        for i, close in enumerate(closes.tolist())
+    ]
+
+
+def export_in_batches(archive, candles, rng):
+    position = 0
+    while position < len(candles):
+        size = rng.randint(1, 3000)
+        # Batches overlap what is already archived; only newer candles count.
+        batch = candles[max(0, position - rng.randint(0, 50)):position + size]
+        rng.shuffle(batch)
+        assert archive.export_candles("EURUSD_otc", PERIOD, batch) == len(candles[position:position + size])
+        position += size
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_batches_read_back(tmp_path, seed):
+    archive = CandleArchive(str(tmp_path))
+    candles = make_candles(20_000, seed=seed)
+    export_in_batches(archive, candles, random.Random(seed))
+    assert archive.import_candles("EURUSD_otc", PERIOD) == candles
+
+
+def test_range_matches_full_scan(tmp_path):
+    rng = random.Random(3)
+    archive = CandleArchive(str(tmp_path))
+    candles = make_candles(20_000, seed=1)
+    export_in_batches(archive, candles, rng)
+    archived = archive.open("EURUSD_otc", PERIOD)
+    times = np.asarray(archived["time"])
+    for _ in range(1000):
+        start = rng.randint(candles[0]["time"] - 600, candles[-1]["time"] + 600)
+        end = start + rng.randint(0, 8000) * PERIOD
+        expected = times[(times >= start) & (times < end)]
+        assert np.array_equal(archived.range(start, end)["time"], expected), (start, end)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Equivalence checks for the vectorized calculate_candles"""
+
+import random
+import numpy as np
+import pytest
+from quotexapi.utils.services import group_by_period
+from quotexapi.utils.processor import calculate_candles
+
+PERIODS = (1, 5, 60, 300, 3600)
+
+
+def legacy_calculate_candles(history, period):
+    """Copy of the group_by_period implementation that was replaced."""
+    grouped = group_by_period(history, period)
+    candles = []
+    for minute, ticks in grouped.items():
+        candles.append({
+            'time': minute * period,
+            'open': ticks[0][1],
+            'close': ticks[-1][1],
+            'high': max(tick[1] for tick in ticks),
+            'low': min(tick[1] for tick in ticks),
+            'ticks': len(ticks)
+        })
+    return candles[:-1]
+
+
+def make_history(count, start=1700000000.0, seed=7, step=0.5):
+    rng = np.random.default_rng(seed)
+    times = start + np.cumsum(rng.uniform(0.0, step, count))
+    prices = np.round(1.08 + np.cumsum(rng.normal(0.0, 1e-5, count)), 5)
+    return [[t, p, 0] for t, p in zip(times.tolist(), prices.tolist())]
+
+
+def random_histories():
+    rng = random.Random(3)
+    histories = []
+    for _ in range(100):
+        history = make_history(rng.randint(0, 300), seed=rng.randint(0, 10 ** 6))
+        if rng.random() < 0.5:
+            rng.shuffle(history)
+        histories.append(history)
+    return histories
+
+
+def with_gaps():
+    # Hours without ticks between bursts.
+    history = []
+    for burst in range(4):
+        history += make_history(50, start=1700000000.0 + burst * 7200, seed=burst)
+    return history
+
+
+def out_of_order():
+    history = make_history(500, seed=11)
+    history[10], history[400] = history[400], history[10]
+    return history[250:] + history[:250]
+
+
+HISTORIES = {
+    "empty": [],
+    "single": [[1700000000.0, 1.1, 0]],
+    "sorted": make_history(5000, seed=1),
+    "gaps": with_gaps(),
+    "out_of_order": out_of_order(),
+    # Ragged rows as sometimes sent by the history channels.
+    "ragged": [[1700000000.0 + i, 1.0 + i * 1e-4] + [0] * (i % 2) for i in range(300)],
+}
+
+
+@pytest.mark.parametrize("period", PERIODS)
+@pytest.mark.parametrize("name", sorted(HISTORIES))
+def test_matches_legacy(name, period):
+    history = HISTORIES[name]
+    expected = legacy_calculate_candles(history, period)
+    assert calculate_candles(history, period) == expected
+    if history:
+        array = np.asarray([row[:2] for row in history])
+        assert calculate_candles(array, period) == expected
+
+
+@pytest.mark.parametrize("period", PERIODS)
+def test_random_histories_match_legacy(period):
+    for history in random_histories():
+        assert calculate_candles(history, period) == legacy_calculate_candles(history, period)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Property checks for merge_candles and merge_candle_columns"""
+
+import random
+import numpy as np
+import pytest
+from quotexapi.utils.processor import merge_candles, merge_candle_columns
+
+FIELDS = ("time", "open", "close", "high", "low", "ticks")
+
+
+def legacy_merge_candles(candles_data):
+    """Copy of the merge_candles implementation that was replaced."""
+    seen_times = set()
+    merged_list = []
+    for candle in candles_data:
+        if isinstance(candle, dict) and candle.get('time') not in seen_times:
+            seen_times.add(candle['time'])
+            merged_list.append(candle)
+    merged_list.sort(key=lambda x: x['time'])
+    return merged_list
+
+
+def make_run(rng, count, start, period=60, gap=0.2, tag=0):
+    run = []
+    candle_time = start
+    for _ in range(count):
+        candle_time += period * (1 + (rng.random() < gap))
+        price = round(rng.uniform(1.0, 1.2), 5)
+        run.append({"time": candle_time, "open": price, "close": price, "high": price,
+                    "low": price, "ticks": tag})
+    return run
+
+
+def expected_merge(runs):
+    """Last writer wins, by brute force."""
+    latest = {}
+    for run in runs:
+        for candle in run:
+            if isinstance(candle, dict):
+                latest[candle["time"]] = candle
+    return [latest[key] for key in sorted(latest)]
+
+
+def as_columns(run):
+    return {name: np.array([candle[name] for candle in run], dtype=np.float64) for name in FIELDS}
+
+
+def random_cases(seed, count=200):
+    rng = random.Random(seed)
+    for _ in range(count):
+        runs = [
+            make_run(rng, rng.randint(0, 60), 1700000000 + rng.randint(0, 40) * 60, tag=tag)
+            for tag in range(rng.randint(0, 5))
+        ]
+        if runs and rng.random() < 0.3:
+            # Duplicate times within a run, out of order, plus a non-dict row.
+            runs[0] = runs[0] + runs[0][-3:]
+            rng.shuffle(runs[0])
+            runs[0].append([1700000000, 1.0, 1.0, 1.0, 1.0, 0])
+        yield runs
+
+
+SEEDS = range(5)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_sorted_and_last_writer_wins(seed):
+    for runs in random_cases(seed):
+        merged = merge_candles(*runs)
+        times = [candle["time"] for candle in merged]
+        assert times == sorted(set(times))
+        assert merged == expected_merge(runs)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_matches_legacy(seed):
+    for runs in random_cases(seed):
+        # The legacy merge kept the first candle of a time: same result
+        # with the runs reversed and no duplicate times within a run.
+        unique_runs = [
+            list({candle["time"]: candle for candle in run if isinstance(candle, dict)}.values())
+            for run in runs
+        ]
+        legacy = legacy_merge_candles([candle for run in reversed(unique_runs) for candle in run])
+        assert merge_candles(*unique_runs) == legacy
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_columns_match_dicts(seed):
+    for runs in random_cases(seed):
+        if not runs:
+            continue
+        merged = merge_candles(*runs)
+        dict_runs = [[candle for candle in run if isinstance(candle, dict)] for run in runs]
+        columns = merge_candle_columns(*map(as_columns, dict_runs))
+        assert columns["time"].tolist() == [candle["time"] for candle in merged]
+        assert columns["close"].tolist() == [candle["close"] for candle in merged]
+        assert columns["ticks"].tolist() == [candle["ticks"] for candle in merged]
+
+
+def test_server_candles_override_computed():
+    computed = [{"time": t, "close": 1.0} for t in (60, 120, 180)]
+    server = [{"time": t, "close": 2.0} for t in (120, 240)]
+    assert [candle["close"] for candle in merge_candles(computed, server)] == [1.0, 2.0, 1.0, 2.0]
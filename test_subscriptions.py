@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Property checks for the reference-counted Subscriptions"""
+
+import random
+import asyncio
+from collections import Counter
+import pytest
+from quotexapi.subscriptions import Subscriptions
+
+ASSETS = ["EURUSD_otc", "GBPUSD_otc", "USDJPY_otc"]
+
+
+class Api(object):
+    """Records the frames instead of sending them."""
+
+    def __init__(self):
+        self.frames = []
+
+    def subscribe_realtime_candle(self, asset, period):
+        self.frames.append(("instruments/update", asset, period))
+
+    def follow_candle(self, asset):
+        self.frames.append(("depth/follow", asset))
+
+    def unfollow_candle(self, asset):
+        self.frames.append(("depth/unfollow", asset))
+
+    def unsubscribe_realtime_candle(self, asset):
+        self.frames.append(("subfor", asset))
+
+
+class Client(object):
+    def __init__(self):
+        self.api = Api()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_frames_only_on_transitions(seed):
+    rng = random.Random(seed)
+    for case in range(100):
+        client = Client()
+        subscriptions = Subscriptions(client)
+        model = Counter()
+        for _ in range(rng.randint(0, 200)):
+            asset = rng.choice(ASSETS)
+            period = rng.choice((0, 60, 300))
+            asset_count = sum(count for (name, _), count in model.items() if name == asset)
+            client.api.frames.clear()
+            if model[(asset, period)] and rng.random() < 0.5:
+                unfollowed = subscriptions.release(asset, period)
+                model[(asset, period)] -= 1
+                model += Counter()
+                assert unfollowed == (asset_count == 1), case
+                expected = [("subfor", asset), ("depth/unfollow", asset)] if unfollowed else []
+            else:
+                subscribed = subscriptions.acquire(asset, period)
+                assert subscribed == (model[(asset, period)] == 0), case
+                model[(asset, period)] += 1
+                expected = [("instruments/update", asset, period)] if subscribed else []
+                if not asset_count:
+                    expected.append(("depth/follow", asset))
+            assert client.api.frames == expected, case
+            assert subscriptions.active() == dict(model), case
+
+        client.api.frames.clear()
+        subscriptions.replay()
+        assets = {asset for asset, _ in model}
+        assert len(client.api.frames) == len(model) + len(assets), case
+        subscriptions.clear()
+        assert not subscriptions.active() and not subscriptions.assets, case
+
+
+def test_hold_pushed_back_then_released():
+    async def scenario():
+        client = Client()
+        subscriptions = Subscriptions(client, linger=0.05)
+        assert subscriptions.hold("EURUSD_otc", 60)
+        assert not subscriptions.hold("EURUSD_otc", 60)
+        assert subscriptions.active() == {("EURUSD_otc", 60): 1}
+        await asyncio.sleep(0.03)
+        subscriptions.hold("EURUSD_otc", 60)
+        await asyncio.sleep(0.03)
+        # Pushed back by the second hold.
+        assert subscriptions.is_active("EURUSD_otc", 60)
+        await asyncio.sleep(0.05)
+        assert not subscriptions.is_active("EURUSD_otc")
+        assert client.api.frames[-2:] == [("subfor", "EURUSD_otc"), ("depth/unfollow", "EURUSD_otc")]
+
+    asyncio.run(scenario())
+
+
+def test_release_leaves_the_hold_reference():
+    async def scenario():
+        client = Client()
+        subscriptions = Subscriptions(client, linger=60)
+        subscriptions.hold("EURUSD_otc", 60)
+        subscriptions.acquire("EURUSD_otc", 300)
+        subscriptions.acquire("EURUSD_otc", 60)
+        assert not subscriptions.release("EURUSD_otc")
+        assert not subscriptions.release("EURUSD_otc")
+        assert not subscriptions.release("EURUSD_otc")
+        assert not subscriptions.release("EURUSD_otc", 60)
+        assert subscriptions.active() == {("EURUSD_otc", 60): 1}
+        subscriptions.clear()
+
+    asyncio.run(scenario())
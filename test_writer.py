@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Send order checks for the outbound websocket queue"""
+
+from quotexapi.ws.writer import WebsocketWriter, PRIORITY_HIGH
+
+
+def drain(writer):
+    frames = []
+    data = writer.pop()
+    while data is not None:
+        frames.append(data)
+        data = writer.pop()
+    return frames
+
+
+def test_order_skips_normal_frames():
+    # The writer is never started, so every frame stays queued.
+    writer = WebsocketWriter(lambda data: None)
+    writer.put('42["tick"]')
+    writer.put('42["indicator/list"]')
+    writer.put('42["orders/open",{"requestId":1}]')
+    assert drain(writer) == [
+        '42["orders/open",{"requestId":1}]',
+        '42["tick"]',
+        '42["indicator/list"]',
+    ]
+
+
+def test_order_keeps_its_settings_first():
+    writer = WebsocketWriter(lambda data: None)
+    writer.put('42["tick"]')
+    writer.put('42["settings/store",{"chartId":"graph"}]')
+    writer.put('42["drawing/load"]')
+    writer.put('42["orders/open",{"requestId":1}]')
+    writer.put('42["orders/open",{"requestId":2}]', PRIORITY_HIGH)
+    assert drain(writer) == [
+        '42["tick"]',
+        '42["settings/store",{"chartId":"graph"}]',
+        '42["orders/open",{"requestId":1}]',
+        '42["orders/open",{"requestId":2}]',
+        '42["drawing/load"]',
+    ]
+
+
+def test_barrier_released_once_sent():
+    writer = WebsocketWriter(lambda data: None)
+    writer.put('42["depth/follow","EURUSD_otc"]')
+    assert drain(writer) == ['42["depth/follow","EURUSD_otc"]']
+    writer.put('42["tick"]')
+    writer.put('42["orders/open",{"requestId":1}]')
+    assert drain(writer) == ['42["orders/open",{"requestId":1}]', '42["tick"]']